@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from src.utils.json_serializer import dumps_compact, loads
+
 # Load environment variables
 load_dotenv()
 
@@ -25,6 +27,9 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', f'sqlite:///{_db_uri_path}')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.getenv('SQLALCHEMY_ECHO', 'False').lower() == 'true'
+    # JSON columns (response data, evidence, reports) are written compactly
+    # and read back with orjson when it is installed
+    SQLALCHEMY_ENGINE_OPTIONS = {'json_serializer': dumps_compact, 'json_deserializer': loads}
     
     # API Keys
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
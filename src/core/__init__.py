@@ -1,10 +1,15 @@
 """Core modules for the Employment Verification Agent"""
 
-from .models import CallResult, ConversationConfig, CallTranscript, EmailResult
+from .models import (
+    CallResult, ConversationConfig, CallTranscript, EmailResult,
+    HREmailJob, ReferenceEmailJob
+)
 
 __all__ = [
     'CallResult',
     'ConversationConfig',
     'CallTranscript',
     'EmailResult',
+    'HREmailJob',
+    'ReferenceEmailJob',
 ]
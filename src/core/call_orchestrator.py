@@ -1,9 +1,15 @@
 """Call orchestrator for coordinating employment verification calls."""
 
+import functools
 import logging
+import threading
+import time
+from collections import deque
 from typing import Optional
 from src.core.models import CallResult
-from src.core.elevenlabs_client import ElevenLabsClient
+from src.core.elevenlabs_client import (
+    ElevenLabsClient, CallTerminatedError, CallTimeoutError
+)
 from src.handlers.hr_verification_handler import HRVerificationHandler
 from src.handlers.reference_call_handler import ReferenceCallHandler
 from src.utils.transcript_manager import TranscriptManager
@@ -20,6 +26,11 @@ class CallOrchestrator:
     and manages transcript saving through the TranscriptManager.
     """
     
+    # Circuit breaker: after this many provider failures within the window,
+    # is_available() reports False until they age out or a call succeeds
+    FAILURE_THRESHOLD = 5
+    FAILURE_WINDOW_SECONDS = 60.0
+    
     def __init__(
         self,
         elevenlabs_client: Optional[ElevenLabsClient] = None,
@@ -29,16 +40,46 @@ class CallOrchestrator:
         
         Args:
             elevenlabs_client: Optional ElevenLabsClient instance. If not provided,
-                             handlers will create their own clients.
+                             creates one shared by both handlers.
             transcript_manager: Optional TranscriptManager instance. If not provided,
                               creates a new manager with default settings.
         """
-        self.elevenlabs_client = elevenlabs_client
+        # One client (and so one HTTP connection pool and phone number ID
+        # lookup) serves both handlers
+        self.elevenlabs_client = elevenlabs_client or ElevenLabsClient()
         self.transcript_manager = transcript_manager or TranscriptManager()
         
-        # Initialize handlers (they will create their own clients if needed)
+        # Initialize handlers
         self.hr_handler = HRVerificationHandler(elevenlabs_client=self.elevenlabs_client)
         self.reference_handler = ReferenceCallHandler(elevenlabs_client=self.elevenlabs_client)
+        
+        self._call_failures = deque()
+        self._call_failures_lock = threading.Lock()
+    
+    def is_available(self) -> bool:
+        """Check whether the call provider is usable, without contacting it.
+        
+        Returns:
+            False if too many calls failed recently, True otherwise
+        """
+        cutoff = time.monotonic() - self.FAILURE_WINDOW_SECONDS
+        with self._call_failures_lock:
+            while self._call_failures and self._call_failures[0] < cutoff:
+                self._call_failures.popleft()
+            return len(self._call_failures) < self.FAILURE_THRESHOLD
+    
+    def _record_call_outcome(self, error: Optional[Exception] = None) -> None:
+        """Update the circuit breaker after a call attempt.
+        
+        Args:
+            error: Exception the call failed with, or None on success
+        """
+        with self._call_failures_lock:
+            if error is None:
+                self._call_failures.clear()
+            elif not isinstance(error, (CallTerminatedError, CallTimeoutError)):
+                # Hang-ups and overlong calls say nothing about the provider
+                self._call_failures.append(time.monotonic())
     
     def initiate_hr_verification(
         self,
@@ -121,6 +162,8 @@ class CallOrchestrator:
                 f"Duration: {transcript.duration_seconds}s, Transcript: {transcript_path}"
             )
             
+            self._record_call_outcome()
+            
             # Return successful result
             return CallResult(
                 success=True,
@@ -136,6 +179,7 @@ class CallOrchestrator:
                 f"HR verification call failed for {candidate_name}: {error_msg}",
                 exc_info=True
             )
+            self._record_call_outcome(e)
             
             # Return failed result with error message
             return CallResult(
@@ -228,6 +272,8 @@ class CallOrchestrator:
                 f"Duration: {transcript.duration_seconds}s, Transcript: {transcript_path}"
             )
             
+            self._record_call_outcome()
+            
             # Return successful result
             return CallResult(
                 success=True,
@@ -243,6 +289,7 @@ class CallOrchestrator:
                 f"Reference call failed for {candidate_name} with {reference_name}: {error_msg}",
                 exc_info=True
             )
+            self._record_call_outcome(e)
             
             # Return failed result with error message
             return CallResult(
@@ -252,3 +299,13 @@ class CallOrchestrator:
                 duration_seconds=0,
                 error_message=error_msg
             )
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_call_orchestrator() -> CallOrchestrator:
+    """Get the process-wide CallOrchestrator built from the default components.
+    
+    Returns:
+        Shared CallOrchestrator instance
+    """
+    return CallOrchestrator()
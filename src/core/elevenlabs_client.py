@@ -1,9 +1,12 @@
 """ElevenLabs API client wrapper for conversational AI phone calls."""
 
 import os
+import time
+import random
 import logging
 from typing import Optional
 from datetime import datetime
+import httpx
 from elevenlabs.client import ElevenLabs
 from elevenlabs.conversational_ai.conversation import Conversation
 from .models import ConversationConfig, CallTranscript
@@ -52,6 +55,13 @@ class ElevenLabsClient:
         client: Initialized ElevenLabs SDK client
     """
     
+    # Retries for starting an outbound call when the request provably did
+    # not place one (connection never made, or rejected as overloaded)
+    OUTBOUND_CALL_MAX_ATTEMPTS = 3
+    OUTBOUND_CALL_BACKOFF_BASE_SECONDS = 1.0
+    OUTBOUND_CALL_BACKOFF_MAX_SECONDS = 30.0
+    RETRYABLE_STATUS_CODES = frozenset({429, 503})
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the ElevenLabs client.
         
@@ -123,6 +133,57 @@ class ElevenLabsClient:
             logger.error(error_msg, exc_info=True)
             raise APIConnectionError(error_msg) from e
     
+    def _is_retryable(self, error: Exception) -> bool:
+        """Check whether a failed outbound call request is safe to retry.
+        
+        Only errors where the call cannot have been placed qualify; a read
+        timeout, for example, may have dialled already.
+        
+        Args:
+            error: Exception raised by the SDK
+        
+        Returns:
+            bool: True if the request can be retried
+        """
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        return getattr(error, 'status_code', None) in self.RETRYABLE_STATUS_CODES
+    
+    def _outbound_call(self, agent_id: str, agent_phone_number_id: str, to_number: str):
+        """Request an outbound call, retrying transient failures.
+        
+        Retries use exponential backoff with full jitter so concurrent
+        verifications hitting the same outage spread out their retries.
+        
+        Args:
+            agent_id: ElevenLabs agent ID
+            agent_phone_number_id: ElevenLabs phone number ID to call from
+            to_number: Phone number to call
+        
+        Returns:
+            SDK outbound call response
+        """
+        for attempt in range(1, self.OUTBOUND_CALL_MAX_ATTEMPTS + 1):
+            try:
+                return self.client.conversational_ai.twilio.outbound_call(
+                    agent_id=agent_id,
+                    agent_phone_number_id=agent_phone_number_id,
+                    to_number=to_number
+                )
+            except Exception as e:
+                if attempt == self.OUTBOUND_CALL_MAX_ATTEMPTS or not self._is_retryable(e):
+                    raise
+                
+                delay = random.uniform(0, min(
+                    self.OUTBOUND_CALL_BACKOFF_MAX_SECONDS,
+                    self.OUTBOUND_CALL_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+                ))
+                logger.warning(
+                    f"Outbound call attempt {attempt} to {to_number} failed: {str(e)}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+    
     def start_conversation(
         self,
         phone_number: str,
@@ -167,7 +228,7 @@ class ElevenLabsClient:
             phone_number_id = self._get_phone_number_id_from_elevenlabs()
             
             # Initiate outbound call using ElevenLabs Twilio integration
-            response = self.client.conversational_ai.twilio.outbound_call(
+            response = self._outbound_call(
                 agent_id=config.agent_id,
                 agent_phone_number_id=phone_number_id,
                 to_number=phone_number
@@ -8,6 +8,8 @@ authentication and error handling.
 import os
 import re
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
@@ -16,6 +18,11 @@ from typing import Optional
 class EmailClient:
     """Client for sending emails via SMTP."""
     
+    # Temporary SMTP replies servers use to rate limit senders; after one,
+    # is_throttled() reports True for THROTTLE_BACKOFF_SECONDS
+    THROTTLE_REPLY_CODES = frozenset({421, 451})
+    THROTTLE_BACKOFF_SECONDS = 60.0
+    
     def __init__(self):
         """Initialize EmailClient with SMTP configuration from environment variables.
         
@@ -53,6 +60,96 @@ class EmailClient:
             self.smtp_port = int(self.smtp_port)
         except ValueError:
             raise ValueError(f"SMTP_PORT must be a valid integer, got: {self.smtp_port}")
+        
+        # Optional SMTP session reused across sends, scoped per thread
+        self._local = threading.local()
+        
+        # Monotonic time until which the server asked us to back off
+        self._throttled_until = 0.0
+    
+    def connect(self) -> None:
+        """Open an SMTP session that subsequent sends on this thread reuse.
+        
+        Call quit() to close it. Without connect(), each send_email call
+        opens and closes its own session.
+        
+        Raises:
+            smtplib.SMTPException: If SMTP connection or authentication fails.
+        """
+        self.quit()
+        self._local.server = self._open_connection()
+    
+    def is_connected(self) -> bool:
+        """Check whether this thread has a session opened by connect().
+        
+        Returns:
+            True if sends on this thread reuse an open session
+        """
+        return getattr(self._local, 'server', None) is not None
+    
+    def is_throttled(self) -> bool:
+        """Check whether the SMTP server recently asked us to back off.
+        
+        Returns:
+            True if sending now would likely be rejected again
+        """
+        return time.monotonic() < self._throttled_until
+    
+    def _note_throttle(self, error: smtplib.SMTPException) -> None:
+        """Start a backoff period if the error is a rate-limiting reply.
+        
+        Args:
+            error: SMTP error raised while sending.
+        """
+        code = getattr(error, 'smtp_code', None)
+        if code in self.THROTTLE_REPLY_CODES:
+            self._throttled_until = time.monotonic() + self.THROTTLE_BACKOFF_SECONDS
+    
+    def quit(self) -> None:
+        """Close the SMTP session opened by connect(), if any."""
+        server = getattr(self._local, 'server', None)
+        if server is None:
+            return
+        
+        self._local.server = None
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            server.close()
+    
+    def _open_connection(self) -> smtplib.SMTP:
+        """Connect, start TLS, and authenticate with the SMTP server.
+        
+        Returns:
+            Authenticated SMTP connection.
+        """
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            # Start TLS encryption
+            server.starttls()
+            
+            # Authenticate
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _send_with_session(self, server: smtplib.SMTP, msg: MIMEMultipart) -> None:
+        """Send a message over the reusable session, reconnecting once if needed.
+        
+        Args:
+            server: Session opened by connect().
+            msg: Message to send.
+        """
+        try:
+            # Cheap health check before reusing the socket
+            server.noop()
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            server.close()
+            self._local.server = self._open_connection()
+            self._local.server.send_message(msg)
     
     def validate_email_address(self, email: str) -> bool:
         """Validate email address format using regex.
@@ -117,16 +214,15 @@ class EmailClient:
             # Attach body
             msg.attach(MIMEText(body, 'plain'))
             
-            # Connect to SMTP server
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                # Start TLS encryption
-                server.starttls()
-                
-                # Authenticate
-                server.login(self.smtp_username, self.smtp_password)
-                
-                # Send email
-                server.send_message(msg)
+            server = getattr(self._local, 'server', None)
+            if server is not None:
+                # Reuse the session opened by connect()
+                self._send_with_session(server, msg)
+            else:
+                # Connect to SMTP server
+                with self._open_connection() as server:
+                    # Send email
+                    server.send_message(msg)
             
             return True
             
@@ -136,12 +232,15 @@ class EmailClient:
             ) from e
         
         except smtplib.SMTPConnectError as e:
+            self._note_throttle(e)
             raise smtplib.SMTPException(
                 f"Failed to connect to SMTP server {self.smtp_host}:{self.smtp_port}. "
                 "Please verify your SMTP host and port configuration."
             ) from e
         
         except smtplib.SMTPException as e:
+            self._note_throttle(e)
+            
             # Re-raise SMTP exceptions with context
             raise smtplib.SMTPException(f"Failed to send email: {str(e)}") from e
         
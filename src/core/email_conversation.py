@@ -6,23 +6,53 @@ for employment verification.
 """
 
 import os
+import sys
 import time
 import imaplib
 import email
-from email.header import decode_header
 from datetime import datetime
-from typing import Optional, List, Dict
+from collections import deque
+from typing import Optional, Dict, Deque, List
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from openai import OpenAI
 
 from src.core.email_client import EmailClient
 
 logger = logging.getLogger(__name__)
 
+# Conversation progress goes to stdout through its own logger so messages are
+# only formatted when emitted and timestamps come from the formatter
+_progress_logger = logging.getLogger(f"{__name__}.progress")
+if not _progress_logger.handlers:
+    _progress_handler = logging.StreamHandler(sys.stdout)
+    _progress_handler.setFormatter(
+        logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+    )
+    _progress_logger.addHandler(_progress_handler)
+    _progress_logger.setLevel(logging.INFO)
+    _progress_logger.propagate = False
+
+
+def _quote_imap_string(value: str) -> str:
+    """Quote a value for use as an IMAP SEARCH string argument.
+    
+    Args:
+        value: Raw string such as an email address or subject line
+        
+    Returns:
+        Double-quoted string with backslashes and quotes escaped
+    """
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class EmailConversationHandler:
     """Handles live email conversations with AI-powered responses."""
     
+    # Number of most recent messages kept in memory and sent to OpenAI
+    MAX_HISTORY_MESSAGES = 32
+    
     def __init__(self, openai_api_key: str):
         """Initialize the email conversation handler.
         
@@ -37,7 +67,10 @@ class EmailConversationHandler:
         self.imap_host = smtp_host.replace('smtp', 'imap')
         self.imap_username = os.getenv('SMTP_USERNAME')
         self.imap_password = os.getenv('SMTP_PASSWORD')
-        self.conversation_history: List[Dict[str, str]] = []
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=self.MAX_HISTORY_MESSAGES)
+        self._cached_messages: Optional[List[Dict[str, str]]] = None
+        self._last_mailbox_state: Optional[tuple] = None
+        self._system_msg: Optional[Dict[str, str]] = None
         
     def start_conversation(
         self,
@@ -61,12 +94,15 @@ class EmailConversationHandler:
         Returns:
             Dictionary with conversation results
         """
-        print(f"\n📧 Starting live email conversation with {recipient_email}")
-        print(f"⏱️  Timeout: {timeout_minutes} minutes")
-        print(f"🔄 Checking for replies every {poll_interval_seconds} seconds\n")
+        _progress_logger.info("📧 Starting live email conversation with %s", recipient_email)
+        _progress_logger.info("⏱️  Timeout: %s minutes", timeout_minutes)
+        _progress_logger.info("🔄 Checking for replies every %s seconds", poll_interval_seconds)
+        
+        # System message is reused for every turn of this conversation
+        self._system_msg = {"role": "system", "content": system_prompt}
         
         # Send initial email
-        print(f"[{self._timestamp()}] Sending initial email...")
+        _progress_logger.info("Sending initial email...")
         success = self.email_client.send_email(
             to_address=recipient_email,
             subject=initial_subject,
@@ -87,96 +123,130 @@ class EmailConversationHandler:
             'timestamp': self._timestamp()
         })
         
-        print(f"[{self._timestamp()}] ✅ Initial email sent")
-        print(f"[{self._timestamp()}] 👀 Monitoring inbox for replies...\n")
+        _progress_logger.info("✅ Initial email sent")
+        _progress_logger.info("👀 Monitoring inbox for replies...")
         
         # Monitor for replies
         start_time = time.time()
         timeout_seconds = timeout_minutes * 60
         last_check_time = 0
         conversation_complete = False
+        in_flight = set()
         
-        while time.time() - start_time < timeout_seconds:
-            current_time = time.time()
-            
-            # Check for new emails at specified interval
-            if current_time - last_check_time >= poll_interval_seconds:
-                last_check_time = current_time
+        # Single worker keeps responses ordered, since each one extends the
+        # shared conversation history; it is shut down when the conversation ends
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while time.time() - start_time < timeout_seconds:
+                # Collect responses that finished generating and sending
+                for future in [f for f in in_flight if f.done()]:
+                    in_flight.discard(future)
+                    if future.result():
+                        conversation_complete = True
                 
-                reply = self._check_for_reply(recipient_email, initial_subject)
+                if conversation_complete:
+                    break
                 
-                if reply:
-                    print(f"[{self._timestamp()}] 📨 Received reply from {recipient_email}")
-                    print(f"[{self._timestamp()}] Reply: {reply[:100]}...")
-                    
-                    # Add to conversation history
-                    self.conversation_history.append({
-                        'role': 'user',
-                        'content': reply,
-                        'timestamp': self._timestamp()
-                    })
+                current_time = time.time()
+                
+                # Check for new emails at specified interval
+                if current_time - last_check_time >= poll_interval_seconds:
+                    last_check_time = current_time
                     
-                    # Generate AI response
-                    print(f"[{self._timestamp()}] 🤖 Generating AI response...")
-                    ai_response, is_complete = self._generate_response(
-                        system_prompt,
-                        reply
-                    )
+                    reply = self._check_for_reply(recipient_email, initial_subject)
                     
-                    if is_complete:
-                        print(f"[{self._timestamp()}] ✅ Verification complete!")
-                        conversation_complete = True
-                        
-                        # Send final response
-                        self.email_client.send_email(
-                            to_address=recipient_email,
-                            subject=f"Re: {initial_subject}",
-                            body=ai_response
-                        )
-                        
-                        self.conversation_history.append({
-                            'role': 'assistant',
-                            'content': ai_response,
-                            'timestamp': self._timestamp()
-                        })
-                        
-                        print(f"[{self._timestamp()}] 📧 Final response sent")
-                        break
-                    else:
-                        # Send follow-up question
-                        print(f"[{self._timestamp()}] 📧 Sending follow-up...")
-                        self.email_client.send_email(
-                            to_address=recipient_email,
-                            subject=f"Re: {initial_subject}",
-                            body=ai_response
-                        )
-                        
-                        self.conversation_history.append({
-                            'role': 'assistant',
-                            'content': ai_response,
-                            'timestamp': self._timestamp()
-                        })
+                    if reply:
+                        _progress_logger.info("📨 Received reply from %s", recipient_email)
+                        _progress_logger.info("Reply: %.100s...", reply)
                         
-                        print(f"[{self._timestamp()}] ✅ Follow-up sent")
-                        print(f"[{self._timestamp()}] 👀 Waiting for next reply...\n")
+                        # Respond in the background so polling carries on
+                        in_flight.add(executor.submit(
+                            self._respond_and_send,
+                            reply,
+                            initial_subject,
+                            recipient_email
+                        ))
+                
+                time.sleep(1)  # Small sleep to prevent busy waiting
             
-            time.sleep(1)  # Small sleep to prevent busy waiting
+            # Drop queued responses once complete, and let any that are already
+            # underway finish sending
+            if conversation_complete:
+                for future in in_flight:
+                    future.cancel()
+            for future in wait(in_flight).done:
+                if not future.cancelled() and future.result():
+                    conversation_complete = True
         
         # Conversation ended
         elapsed_time = time.time() - start_time
         
         if conversation_complete:
-            print(f"\n✅ Conversation completed successfully!")
+            _progress_logger.info("✅ Conversation completed successfully!")
         else:
-            print(f"\n⏱️  Conversation timed out after {elapsed_time:.0f} seconds")
+            _progress_logger.info("⏱️  Conversation timed out after %.0f seconds", elapsed_time)
         
         return {
             'success': conversation_complete or len(self.conversation_history) > 1,
-            'conversation': self.conversation_history,
+            'conversation': list(self.conversation_history),
             'duration_seconds': int(elapsed_time),
             'complete': conversation_complete
         }
     
+    def _respond_and_send(
+        self,
+        reply: str,
+        subject: str,
+        recipient_email: str
+    ) -> bool:
+        """Generate an AI response to a reply and email it back.
+        
+        Runs on the handler's executor so the inbox keeps being polled while
+        OpenAI and SMTP calls are in progress.
+        
+        Args:
+            reply: Reply text received from the recipient
+            subject: Subject line of the conversation
+            recipient_email: Email address to respond to
+            
+        Returns:
+            True if the conversation is complete, False otherwise
+        """
+        # Add to conversation history
+        self.conversation_history.append({
+            'role': 'user',
+            'content': reply,
+            'timestamp': self._timestamp()
+        })
+        
+        # Generate AI response
+        _progress_logger.info("🤖 Generating AI response...")
+        ai_response, is_complete = self._generate_response(reply)
+        
+        if is_complete:
+            _progress_logger.info("✅ Verification complete!")
+        else:
+            _progress_logger.info("📧 Sending follow-up...")
+        
+        self.email_client.send_email(
+            to_address=recipient_email,
+            subject=f"Re: {subject}",
+            body=ai_response
+        )
+        
+        self.conversation_history.append({
+            'role': 'assistant',
+            'content': ai_response,
+            'timestamp': self._timestamp()
+        })
+        
+        if is_complete:
+            _progress_logger.info("📧 Final response sent")
+        else:
+            _progress_logger.info("✅ Follow-up sent")
+            _progress_logger.info("👀 Waiting for next reply...")
+        
+        return is_complete
+    
     def _check_for_reply(self, from_email: str, subject: str) -> Optional[str]:
         """Check inbox for new replies from specific sender.
         
@@ -191,39 +261,79 @@ class EmailConversationHandler:
             # Connect to IMAP server
             mail = imaplib.IMAP4_SSL(self.imap_host)
             mail.login(self.imap_username, self.imap_password)
-            mail.select('inbox')
+            _, select_data = mail.select('inbox')
+            
+            # Skip the search when no message has arrived since the last
+            # check. UIDNEXT changes on every delivery; the EXISTS count
+            # is the fallback for servers that omit it
+            uidnext = mail.untagged_responses.get('UIDNEXT', [None])[-1]
+            mailbox_state = (select_data[0], uidnext)
+            if mailbox_state == self._last_mailbox_state:
+                mail.close()
+                mail.logout()
+                return None
             
             # Search for UNSEEN emails from sender with subject
             # UNSEEN ensures we only get new emails we haven't processed
-            _, message_numbers = mail.search(None, f'(UNSEEN FROM "{from_email}" SUBJECT "{subject}")')
+            quoted_from = _quote_imap_string(from_email)
+            if subject.isascii():
+                _, message_numbers = mail.search(
+                    None,
+                    f'(UNSEEN FROM {quoted_from} SUBJECT {_quote_imap_string(subject)})'
+                )
+            else:
+                # Non-ASCII subjects are sent as a UTF-8 literal
+                mail.literal = subject.encode('utf-8')
+                _, message_numbers = mail.search('UTF-8', 'UNSEEN', 'FROM', quoted_from, 'SUBJECT')
             
             if not message_numbers[0]:
+                self._last_mailbox_state = mailbox_state
                 mail.close()
                 mail.logout()
                 return None
             
-            # Get the most recent unread email
-            latest_email_id = message_numbers[0].split()[-1]
-            _, msg_data = mail.fetch(latest_email_id, '(RFC822)')
+            # Check senders with a small header-only fetch so our own
+            # emails are skipped without downloading the full message
+            message_ids = message_numbers[0].split()
+            _, header_data = mail.fetch(b','.join(message_ids), '(BODY.PEEK[HEADER.FIELDS (FROM)])')
             
-            email_body = msg_data[0][1]
-            email_message = email.message_from_bytes(email_body)
+            own_address = self.imap_username.lower()
+            reply_ids = []
+            for item in header_data:
+                if not isinstance(item, tuple):
+                    continue
+                message_id = item[0].split()[0]
+                sender = email.message_from_bytes(item[1]).get('From', '')
+                if own_address in sender.lower():
+                    # This is an email we sent, not a reply - mark as seen and skip
+                    mail.store(message_id, '+FLAGS', '\\Seen')
+                else:
+                    reply_ids.append(message_id)
             
-            # Check if this email was sent by us (avoid processing our own emails)
-            sender = email_message.get('From', '')
-            if self.imap_username.lower() in sender.lower():
-                # This is an email we sent, not a reply - mark as seen and skip
-                mail.store(latest_email_id, '+FLAGS', '\\Seen')
+            if not reply_ids:
+                self._last_mailbox_state = mailbox_state
                 mail.close()
                 mail.logout()
                 return None
             
+            # Get the most recent unread reply
+            latest_email_id = reply_ids[-1]
+            _, msg_data = mail.fetch(latest_email_id, '(RFC822)')
+            
+            email_body = msg_data[0][1]
+            email_message = email.message_from_bytes(email_body)
+            
             # Extract text content
             reply_text = self._extract_email_text(email_message)
             
             # Mark as read to avoid re-processing
             mail.store(latest_email_id, '+FLAGS', '\\Seen')
             
+            # Older unread replies are picked up on the next check, so only
+            # remember the mailbox state once none remain
+            if len(reply_ids) == 1:
+                self._last_mailbox_state = mailbox_state
+            
             mail.close()
             mail.logout()
             
@@ -260,44 +370,49 @@ class EmailConversationHandler:
         
         return text_content.strip()
     
-    def _generate_response(self, system_prompt: str, user_message: str) -> tuple[str, bool]:
+    def _generate_response(self, user_message: str) -> tuple[str, bool]:
         """Generate AI response using OpenAI.
         
+        Uses the system message prepared by start_conversation.
+        
         Args:
-            system_prompt: System prompt defining AI behavior
             user_message: User's message to respond to
             
         Returns:
             Tuple of (response_text, is_conversation_complete)
         """
         try:
-            # Build messages for OpenAI
-            messages = [
-                {"role": "system", "content": system_prompt}
-            ]
-            
-            # Add conversation history
-            for msg in self.conversation_history:
-                messages.append({
-                    "role": msg['role'],
-                    "content": msg['content']
+            # Build the request messages once (history already holds the
+            # latest reply at that point), then only append new turns; the
+            # list is sent as is, system message first
+            if self._cached_messages is None:
+                self._cached_messages = [self._system_msg]
+                self._cached_messages.extend(
+                    {"role": msg['role'], "content": msg['content']}
+                    for msg in self.conversation_history
+                )
+            else:
+                self._cached_messages[0] = self._system_msg
+                self._cached_messages.append({
+                    "role": "user",
+                    "content": user_message
                 })
-            
-            # Add current user message
-            messages.append({
-                "role": "user",
-                "content": user_message
-            })
+            self._trim_cached_messages()
             
             # Call OpenAI API
             response = self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=messages,
+                messages=self._cached_messages,
                 temperature=0.7,
                 max_tokens=500
             )
             
             ai_response = response.choices[0].message.content
+            self._cached_messages.append({
+                "role": "assistant",
+                "content": ai_response
+            })
+            self._trim_cached_messages()
             
             # Check if conversation is complete
             # Simple heuristic: if AI says "thank you" or "complete" or similar
@@ -308,7 +423,25 @@ class EmailConversationHandler:
             
         except Exception as e:
             logger.error(f"Error generating AI response: {e}")
-            return "I apologize, but I'm having trouble processing your response. Could you please try again?", False
+            fallback = "I apologize, but I'm having trouble processing your response. Could you please try again?"
+            
+            # The fallback is sent and recorded as this turn's reply, so the
+            # cached messages must end with it too
+            if self._cached_messages is not None:
+                fallback_msg = {"role": "assistant", "content": fallback}
+                if self._cached_messages[-1]["role"] == "assistant":
+                    self._cached_messages[-1] = fallback_msg
+                else:
+                    self._cached_messages.append(fallback_msg)
+                    self._trim_cached_messages()
+            
+            return fallback, False
+    
+    def _trim_cached_messages(self) -> None:
+        """Drop the oldest turns after the system message beyond MAX_HISTORY_MESSAGES."""
+        excess = len(self._cached_messages) - 1 - self.MAX_HISTORY_MESSAGES
+        if excess > 0:
+            del self._cached_messages[1:1 + excess]
     
     def _timestamp(self) -> str:
         """Get current timestamp string."""
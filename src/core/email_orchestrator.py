@@ -7,19 +7,71 @@ and EmailLogger components.
 """
 
 import os
+import re
+import time
+import queue
 import logging
 import smtplib
-from datetime import datetime
-from typing import Optional
+import functools
+import itertools
+import threading
+from concurrent.futures import Future
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Union
 
 from src.core.email_client import EmailClient
-from src.core.models import EmailResult
+from src.core.models import EmailResult, HREmailJob, ReferenceEmailJob
 from src.utils.template_manager import TemplateManager
-from src.utils.email_logger import EmailLogger
+from src.utils.email_logger import BufferedEmailLogger, EmailLogger
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Process-wide default components shared by every EmailOrchestrator that is
+# not given its own. EmailClient keeps any reused SMTP session per thread,
+# TemplateManager is stateless, and BufferedEmailLogger locks its buffer, so
+# all three are safe to share between threads.
+@functools.lru_cache(maxsize=1)
+def _default_email_client() -> EmailClient:
+    return EmailClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_template_manager() -> TemplateManager:
+    return TemplateManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_email_logger() -> EmailLogger:
+    return BufferedEmailLogger()
+
+
+@functools.lru_cache(maxsize=1)
+def _sender_template_vars() -> Dict[str, str]:
+    """Read sender information from the environment on first use.
+    
+    Returns:
+        Template variables shared by every email (do not mutate)
+    """
+    return {
+        "sender_name": os.getenv('SMTP_FROM_NAME', 'Employment Verification'),
+        "sender_email": os.getenv('SMTP_FROM_EMAIL', '')
+    }
+
+
+# Subjects recorded for emails that failed before a subject was rendered,
+# keyed by email type and formatted with the candidate name
+_FAILURE_SUBJECTS = {
+    "hr_verification": "Employment Verification Request for {}",
+    "reference_check": "Reference Request for {}",
+}
+
+# Relationships accepted for reference check emails
+_VALID_RELATIONSHIPS = frozenset({"manager", "coworker", "supervisor"})
+
+# Shape check for YYYY-MM-DD dates, run before the calendar check
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 class EmailOrchestrator:
     """Orchestrates email-based verification requests.
@@ -30,6 +82,9 @@ class EmailOrchestrator:
     and logging of results.
     """
     
+    # Maximum number of emails waiting for the background sender
+    SEND_QUEUE_SIZE = 8192
+    
     def __init__(
         self,
         email_client: Optional[EmailClient] = None,
@@ -39,20 +94,55 @@ class EmailOrchestrator:
         """Initialize EmailOrchestrator with required components.
         
         Args:
-            email_client: EmailClient instance (creates new if None)
-            template_manager: TemplateManager instance (creates new if None)
-            email_logger: EmailLogger instance (creates new if None)
+            email_client: EmailClient instance (shared default if None)
+            template_manager: TemplateManager instance (shared default if None)
+            email_logger: EmailLogger instance (shared BufferedEmailLogger if None)
         """
-        self.email_client = email_client or EmailClient()
-        self.template_manager = template_manager or TemplateManager()
-        self.email_logger = email_logger or EmailLogger()
+        self.email_client = email_client or _default_email_client()
+        self.template_manager = template_manager or _default_template_manager()
+        self.email_logger = email_logger or _default_email_logger()
+        
+        # Template contents loaded so far, keyed by template name
+        self._template_cache: Dict[str, str] = {}
+        
+        # Background sender for the *_async methods, started on first use
+        self._send_queue: queue.Queue = queue.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._send_worker: Optional[threading.Thread] = None
+        self._send_worker_lock = threading.Lock()
         
-        # Get sender information from environment
-        self.sender_name = os.getenv('SMTP_FROM_NAME', 'Employment Verification')
-        self.sender_email = os.getenv('SMTP_FROM_EMAIL', '')
+        # State for _generate_email_id
+        self._email_id_counter = itertools.count(1)
+        self._email_id_second: Optional[int] = None
+        self._email_id_prefix = ""
+        
+        # Sender information, read from the environment once per process
+        self._base_vars = _sender_template_vars()
+        self.sender_name = self._base_vars["sender_name"]
+        self.sender_email = self._base_vars["sender_email"]
         
         logger.info("EmailOrchestrator initialized successfully")
     
+    def __enter__(self) -> "EmailOrchestrator":
+        """Open one SMTP session shared by all sends inside the with block.
+        
+        Returns:
+            This orchestrator
+        """
+        self.email_client.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the SMTP session opened by __enter__."""
+        self.email_client.quit()
+    
+    def is_available(self) -> bool:
+        """Check whether sending is worthwhile, without contacting the server.
+        
+        Returns:
+            False while the SMTP server is rate limiting us, True otherwise
+        """
+        return not self.email_client.is_throttled()
+    
     def send_hr_verification_email(
         self,
         candidate_name: str,
@@ -80,7 +170,7 @@ class EmailOrchestrator:
         Raises:
             ValueError: If any parameter is invalid or email address is malformed
         """
-        logger.info(f"Initiating HR verification email for {candidate_name}")
+        logger.info("Initiating HR verification email for %s", candidate_name)
         
         # Validate inputs
         self._validate_required_string(candidate_name, "candidate_name")
@@ -105,15 +195,14 @@ class EmailOrchestrator:
         try:
             # Load and render template
             logger.debug("Loading HR verification template")
-            template_content = self.template_manager.load_template("hr_verification")
+            template_content = self._get_template("hr_verification")
             
             template_vars = {
+                **self._base_vars,
                 "candidate_name": candidate_name,
                 "job_title": job_title,
                 "start_date": start_date,
-                "end_date": end_date,
-                "sender_name": self.sender_name,
-                "sender_email": self.sender_email
+                "end_date": end_date
             }
             
             logger.debug("Rendering template with candidate data")
@@ -122,12 +211,11 @@ class EmailOrchestrator:
                 template_vars
             )
             
-            # Extract subject from rendered content (first line after "Subject:")
-            subject = self._extract_subject(rendered_content)
-            body = self._extract_body(rendered_content)
+            # Extract subject and body from rendered content
+            subject, body = self._split_subject_body(rendered_content)
             
             # Send email
-            logger.info(f"Sending HR verification email to {hr_email}")
+            logger.info("Sending HR verification email to %s", hr_email)
             success = self.email_client.send_email(
                 to_address=hr_email,
                 subject=subject,
@@ -144,7 +232,7 @@ class EmailOrchestrator:
                 error_message=None
             )
             
-            logger.info(f"HR verification email sent successfully: {email_id}")
+            logger.info("HR verification email sent successfully: %s", email_id)
             
             return EmailResult(
                 success=True,
@@ -154,70 +242,13 @@ class EmailOrchestrator:
                 error_message=None
             )
             
-        except (FileNotFoundError, KeyError) as e:
-            # Template errors
-            error_msg = f"Template error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            # Log failed attempt
-            log_path = self._log_failed_email(
-                candidate_name=candidate_name,
-                email_type="hr_verification",
-                recipient=hr_email,
-                subject=f"Employment Verification Request for {candidate_name}",
-                error_message=error_msg
-            )
-            
-            return EmailResult(
-                success=False,
-                email_id=email_id,
-                recipient=hr_email,
-                log_path=log_path,
-                error_message=error_msg
-            )
-            
-        except smtplib.SMTPException as e:
-            # SMTP errors
-            error_msg = f"Email sending failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            # Log failed attempt
-            log_path = self._log_failed_email(
-                candidate_name=candidate_name,
-                email_type="hr_verification",
-                recipient=hr_email,
-                subject=f"Employment Verification Request for {candidate_name}",
-                error_message=error_msg
-            )
-            
-            return EmailResult(
-                success=False,
-                email_id=email_id,
-                recipient=hr_email,
-                log_path=log_path,
-                error_message=error_msg
-            )
-            
         except Exception as e:
-            # Unexpected errors
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            # Log failed attempt
-            log_path = self._log_failed_email(
+            return self._failed_email_result(
+                e,
+                email_id=email_id,
                 candidate_name=candidate_name,
                 email_type="hr_verification",
-                recipient=hr_email,
-                subject=f"Employment Verification Request for {candidate_name}",
-                error_message=error_msg
-            )
-            
-            return EmailResult(
-                success=False,
-                email_id=email_id,
-                recipient=hr_email,
-                log_path=log_path,
-                error_message=error_msg
+                recipient=hr_email
             )
     
     def send_reference_email(
@@ -246,7 +277,7 @@ class EmailOrchestrator:
             ValueError: If any parameter is invalid, email address is malformed,
                        or relationship is not valid
         """
-        logger.info(f"Initiating reference check email for {candidate_name}")
+        logger.info("Initiating reference check email for %s", candidate_name)
         
         # Validate inputs
         self._validate_required_string(candidate_name, "candidate_name")
@@ -261,11 +292,11 @@ class EmailOrchestrator:
             raise ValueError(error_msg)
         
         # Validate relationship
-        valid_relationships = ["manager", "coworker", "supervisor"]
-        if relationship.lower() not in valid_relationships:
+        relationship_key = relationship.casefold()
+        if relationship_key not in _VALID_RELATIONSHIPS:
             error_msg = (
                 f"Invalid relationship: {relationship}. "
-                f"Must be one of: {', '.join(valid_relationships)}"
+                f"Must be one of: {', '.join(sorted(_VALID_RELATIONSHIPS))}"
             )
             logger.error(error_msg)
             raise ValueError(error_msg)
@@ -276,14 +307,13 @@ class EmailOrchestrator:
         try:
             # Load and render template
             logger.debug("Loading reference check template")
-            template_content = self.template_manager.load_template("reference_check")
+            template_content = self._get_template("reference_check")
             
             template_vars = {
+                **self._base_vars,
                 "candidate_name": candidate_name,
                 "reference_name": reference_name,
-                "relationship": relationship,
-                "sender_name": self.sender_name,
-                "sender_email": self.sender_email
+                "relationship": relationship_key
             }
             
             logger.debug("Rendering template with candidate data")
@@ -293,11 +323,10 @@ class EmailOrchestrator:
             )
             
             # Extract subject and body
-            subject = self._extract_subject(rendered_content)
-            body = self._extract_body(rendered_content)
+            subject, body = self._split_subject_body(rendered_content)
             
             # Send email
-            logger.info(f"Sending reference check email to {reference_email}")
+            logger.info("Sending reference check email to %s", reference_email)
             success = self.email_client.send_email(
                 to_address=reference_email,
                 subject=subject,
@@ -314,7 +343,7 @@ class EmailOrchestrator:
                 error_message=None
             )
             
-            logger.info(f"Reference check email sent successfully: {email_id}")
+            logger.info("Reference check email sent successfully: %s", email_id)
             
             return EmailResult(
                 success=True,
@@ -324,71 +353,227 @@ class EmailOrchestrator:
                 error_message=None
             )
             
-        except (FileNotFoundError, KeyError) as e:
-            # Template errors
-            error_msg = f"Template error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            # Log failed attempt
-            log_path = self._log_failed_email(
-                candidate_name=candidate_name,
-                email_type="reference_check",
-                recipient=reference_email,
-                subject=f"Reference Request for {candidate_name}",
-                error_message=error_msg
-            )
-            
-            return EmailResult(
-                success=False,
+        except Exception as e:
+            return self._failed_email_result(
+                e,
                 email_id=email_id,
-                recipient=reference_email,
-                log_path=log_path,
-                error_message=error_msg
-            )
-            
-        except smtplib.SMTPException as e:
-            # SMTP errors
-            error_msg = f"Email sending failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            # Log failed attempt
-            log_path = self._log_failed_email(
                 candidate_name=candidate_name,
                 email_type="reference_check",
-                recipient=reference_email,
-                subject=f"Reference Request for {candidate_name}",
-                error_message=error_msg
+                recipient=reference_email
             )
+    
+    def send_bulk(
+        self,
+        jobs: List[Union[HREmailJob, ReferenceEmailJob]]
+    ) -> List[EmailResult]:
+        """Send a batch of HR verification and reference check emails.
+        
+        Templates are loaded once for the batch, all emails go out over a
+        single SMTP session, and the email log is flushed once at the end.
+        
+        Args:
+            jobs: Emails to send, in order
             
-            return EmailResult(
-                success=False,
-                email_id=email_id,
-                recipient=reference_email,
-                log_path=log_path,
-                error_message=error_msg
-            )
+        Returns:
+            EmailResult for each job, in the same order
+            
+        Raises:
+            ValueError: If a job has invalid parameters (earlier jobs have
+                       already been sent)
+            TypeError: If a job is not an HREmailJob or ReferenceEmailJob
+        """
+        if not jobs:
+            return []
+        
+        # Warm the template cache before sending anything
+        template_names = {
+            "hr_verification" if isinstance(job, HREmailJob) else "reference_check"
+            for job in jobs
+        }
+        for template_name in template_names:
+            try:
+                self._get_template(template_name)
+            except FileNotFoundError:
+                # Reported per email by the send methods
+                pass
+        
+        # Reuse an open session (e.g. inside a with block) or open one
+        owns_session = not self.email_client.is_connected()
+        if owns_session:
+            try:
+                self.email_client.connect()
+            except Exception as e:
+                # Sends fall back to one session per email
+                logger.warning("Could not open shared SMTP session: %s", e)
+                owns_session = False
+        
+        results = []
+        try:
+            for job in jobs:
+                if isinstance(job, HREmailJob):
+                    results.append(self.send_hr_verification_email(
+                        candidate_name=job.candidate_name,
+                        job_title=job.job_title,
+                        start_date=job.start_date,
+                        end_date=job.end_date,
+                        hr_email=job.hr_email
+                    ))
+                elif isinstance(job, ReferenceEmailJob):
+                    results.append(self.send_reference_email(
+                        candidate_name=job.candidate_name,
+                        reference_name=job.reference_name,
+                        reference_email=job.reference_email,
+                        relationship=job.relationship
+                    ))
+                else:
+                    raise TypeError(f"Unsupported email job: {type(job).__name__}")
+        finally:
+            if owns_session:
+                self.email_client.quit()
+        
+        # Write the batch's buffered log entries; a failed log write must not
+        # hide which emails were delivered
+        flush = getattr(self.email_logger, "flush", None)
+        if flush is not None:
+            try:
+                flush()
+            except OSError as e:
+                logger.error("Failed to write email log for bulk send: %s", e, exc_info=True)
+        
+        return results
+    
+    def send_hr_verification_email_async(
+        self,
+        candidate_name: str,
+        job_title: str,
+        start_date: str,
+        end_date: str,
+        hr_email: str
+    ) -> Future:
+        """Queue an HR verification email for the background sender.
+        
+        Takes the same arguments as send_hr_verification_email and returns
+        immediately.
+        
+        Returns:
+            Future resolving to the EmailResult, or raising ValueError if any
+            parameter is invalid
+        """
+        return self._submit(
+            self.send_hr_verification_email,
+            candidate_name=candidate_name,
+            job_title=job_title,
+            start_date=start_date,
+            end_date=end_date,
+            hr_email=hr_email
+        )
+    
+    def send_reference_email_async(
+        self,
+        candidate_name: str,
+        reference_name: str,
+        reference_email: str,
+        relationship: str
+    ) -> Future:
+        """Queue a reference check email for the background sender.
+        
+        Takes the same arguments as send_reference_email and returns
+        immediately.
+        
+        Returns:
+            Future resolving to the EmailResult, or raising ValueError if any
+            parameter is invalid
+        """
+        return self._submit(
+            self.send_reference_email,
+            candidate_name=candidate_name,
+            reference_name=reference_name,
+            reference_email=reference_email,
+            relationship=relationship
+        )
+    
+    def flush(self) -> None:
+        """Block until every queued email has been sent."""
+        self._send_queue.join()
+    
+    def close(self) -> None:
+        """Send any queued emails, then stop the background sender."""
+        with self._send_worker_lock:
+            if self._send_worker is None:
+                return
+            
+            self._send_queue.put(None)
+            self._send_worker.join()
+            self._send_worker = None
+    
+    def _submit(self, send_method, **kwargs) -> Future:
+        """Queue a send call for the background sender.
+        
+        Args:
+            send_method: Synchronous send method to run on the worker
+            **kwargs: Arguments for send_method
             
+        Returns:
+            Future resolving to the send method's result
+        """
+        with self._send_worker_lock:
+            if self._send_worker is None:
+                self._send_worker = threading.Thread(
+                    target=self._smtp_worker,
+                    name="EmailOrchestratorSender",
+                    daemon=True
+                )
+                self._send_worker.start()
+        
+        future = Future()
+        self._send_queue.put((future, send_method, kwargs))
+        return future
+    
+    def _smtp_worker(self) -> None:
+        """Drain the send queue over a single SMTP session."""
+        try:
+            self.email_client.connect()
         except Exception as e:
-            # Unexpected errors
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
+            # Sends fall back to one session per email
+            logger.warning("Could not open shared SMTP session: %s", e)
+        
+        try:
+            while True:
+                job = self._send_queue.get()
+                try:
+                    if job is None:
+                        return
+                    
+                    future, send_method, kwargs = job
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    
+                    try:
+                        future.set_result(send_method(**kwargs))
+                    except Exception as e:
+                        future.set_exception(e)
+                finally:
+                    self._send_queue.task_done()
+        finally:
+            self.email_client.quit()
+    
+    def _get_template(self, template_name: str) -> str:
+        """Load a template once and reuse it for subsequent emails.
+        
+        Args:
+            template_name: Name of template file (without .txt extension)
             
-            # Log failed attempt
-            log_path = self._log_failed_email(
-                candidate_name=candidate_name,
-                email_type="reference_check",
-                recipient=reference_email,
-                subject=f"Reference Request for {candidate_name}",
-                error_message=error_msg
-            )
+        Returns:
+            Template content as string
             
-            return EmailResult(
-                success=False,
-                email_id=email_id,
-                recipient=reference_email,
-                log_path=log_path,
-                error_message=error_msg
-            )
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+        """
+        template_content = self._template_cache.get(template_name)
+        if template_content is None:
+            template_content = self.template_manager.load_template(template_name)
+            self._template_cache[template_name] = template_content
+        return template_content
     
     def _validate_required_string(self, value: str, param_name: str) -> None:
         """Validate that a parameter is a non-empty string.
@@ -400,13 +585,12 @@ class EmailOrchestrator:
         Raises:
             ValueError: If value is None, empty, or not a string
         """
-        if value is None:
-            raise ValueError(f"{param_name} cannot be None")
-        
-        if not isinstance(value, str):
-            raise ValueError(f"{param_name} must be a string")
-        
-        if not value.strip():
+        # Single check on the valid path; work out the message only on failure
+        if not isinstance(value, str) or not value or value.isspace():
+            if value is None:
+                raise ValueError(f"{param_name} cannot be None")
+            if not isinstance(value, str):
+                raise ValueError(f"{param_name} must be a string")
             raise ValueError(f"{param_name} cannot be empty")
     
     def _validate_date_format(self, date_str: str, param_name: str) -> None:
@@ -420,15 +604,18 @@ class EmailOrchestrator:
             ValueError: If date format is invalid
         """
         try:
-            # Try to parse the date
-            datetime.strptime(date_str, "%Y-%m-%d")
+            if not _DATE_RE.match(date_str):
+                raise ValueError(date_str)
+            
+            # Reject impossible dates such as 2024-02-30
+            date.fromisoformat(date_str)
         except ValueError:
             raise ValueError(
                 f"{param_name} must be in YYYY-MM-DD format, got: {date_str}"
             )
     
     def _generate_email_id(self, email_type: str) -> str:
-        """Generate unique email ID based on timestamp and type.
+        """Generate unique email ID from type, timestamp, and a sequence number.
         
         Args:
             email_type: Type of email (hr_verification or reference_check)
@@ -436,51 +623,88 @@ class EmailOrchestrator:
         Returns:
             Unique email ID string
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{email_type}_{timestamp}"
+        # Reformat the timestamp at most once per second; the counter keeps
+        # IDs generated within the same second unique
+        now = int(time.time())
+        if now != self._email_id_second:
+            self._email_id_second = now
+            self._email_id_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        return f"{email_type}_{self._email_id_prefix}_{next(self._email_id_counter):06d}"
     
-    def _extract_subject(self, rendered_content: str) -> str:
-        """Extract email subject from rendered template.
+    def _split_subject_body(self, rendered_content: str) -> Tuple[str, str]:
+        """Split rendered template into email subject and body in one pass.
+        
+        The subject is taken from the first line starting with "Subject:" and
+        the body is everything after that line.
         
         Args:
             rendered_content: Rendered template content
             
         Returns:
-            Email subject line
+            Tuple of (subject, body)
         """
-        lines = rendered_content.split("\n")
-        for line in lines:
-            if line.startswith("Subject:"):
-                return line.replace("Subject:", "").strip()
+        if rendered_content.startswith("Subject:"):
+            subject_start = 0
+        else:
+            subject_start = rendered_content.find("\nSubject:")
+            if subject_start == -1:
+                # Default subject if not found
+                return "Verification Request", ""
+            subject_start += 1
+        
+        subject_end = rendered_content.find("\n", subject_start)
+        if subject_end == -1:
+            subject_end = len(rendered_content)
         
-        # Default subject if not found
-        return "Verification Request"
+        subject = rendered_content[subject_start + len("Subject:"):subject_end].strip()
+        body = rendered_content[subject_end + 1:].strip()
+        
+        return subject, body
     
-    def _extract_body(self, rendered_content: str) -> str:
-        """Extract email body from rendered template.
+    def _failed_email_result(
+        self,
+        error: Exception,
+        email_id: str,
+        candidate_name: str,
+        email_type: str,
+        recipient: str
+    ) -> EmailResult:
+        """Log a failed send and build its EmailResult.
         
         Args:
-            rendered_content: Rendered template content
+            error: Exception raised while rendering or sending the email
+            email_id: ID generated for the email
+            candidate_name: Candidate's full name
+            email_type: Type of email
+            recipient: Email recipient address
             
         Returns:
-            Email body text
+            EmailResult describing the failure
         """
-        lines = rendered_content.split("\n")
-        
-        # Find the line after "Subject:" and use everything after that
-        subject_found = False
-        body_lines = []
+        if isinstance(error, (FileNotFoundError, KeyError)):
+            error_msg = f"Template error: {str(error)}"
+        elif isinstance(error, smtplib.SMTPException):
+            error_msg = f"Email sending failed: {str(error)}"
+        else:
+            error_msg = f"Unexpected error: {str(error)}"
+        logger.error(error_msg, exc_info=error)
         
-        for line in lines:
-            if subject_found:
-                body_lines.append(line)
-            elif line.startswith("Subject:"):
-                subject_found = True
+        # Log failed attempt
+        log_path = self._log_failed_email(
+            candidate_name=candidate_name,
+            email_type=email_type,
+            recipient=recipient,
+            subject=_FAILURE_SUBJECTS[email_type].format(candidate_name),
+            error_message=error_msg
+        )
         
-        # Join and strip extra whitespace
-        body = "\n".join(body_lines).strip()
-        
-        return body
+        return EmailResult(
+            success=False,
+            email_id=email_id,
+            recipient=recipient,
+            log_path=log_path,
+            error_message=error_msg
+        )
     
     def _log_failed_email(
         self,
@@ -512,5 +736,15 @@ class EmailOrchestrator:
                 error_message=error_message
             )
         except Exception as e:
-            logger.error(f"Failed to log failed email: {str(e)}", exc_info=True)
+            logger.error("Failed to log failed email: %s", e, exc_info=True)
             return ""
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_orchestrator() -> EmailOrchestrator:
+    """Get the process-wide EmailOrchestrator built from the default components.
+    
+    Returns:
+        Shared EmailOrchestrator instance
+    """
+    return EmailOrchestrator()
@@ -1,14 +1,20 @@
 """Employment verification service integrating call and email orchestrators."""
 
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
+import functools
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable
+from datetime import date, datetime, timezone
 
-from src.core.call_orchestrator import CallOrchestrator
-from src.core.email_orchestrator import EmailOrchestrator
+from flask import current_app
+from sqlalchemy.orm import joinedload
+
+from src.core.call_orchestrator import CallOrchestrator, get_default_call_orchestrator
+from src.core.email_orchestrator import EmailOrchestrator, get_default_orchestrator
 from src.core.models import CallResult, EmailResult
 from src.database.models import (
-    db, Employment, ContactRecord, EmploymentVerificationStatus
+    db, Employment, ContactRecord, EmploymentVerificationStatus, VerificationSession
 )
 
 logger = logging.getLogger(__name__)
@@ -17,7 +23,7 @@ logger = logging.getLogger(__name__)
 def safe_db_commit():
     """Safely commit database changes, catching app context errors"""
     try:
-        safe_db_commit()
+        db.session.commit()
     except RuntimeError as e:
         if "application context" in str(e).lower():
             logger.warning("Skipping database commit due to app context issue (background thread)")
@@ -28,7 +34,7 @@ def safe_db_commit():
 def safe_db_add(obj):
     """Safely add object to database, catching app context errors"""
     try:
-        safe_db_add(obj)
+        db.session.add(obj)
     except RuntimeError as e:
         if "application context" in str(e).lower():
             logger.warning("Skipping database add due to app context issue (background thread)")
@@ -36,9 +42,72 @@ def safe_db_add(obj):
             raise
 
 
+def _utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, like the model defaults."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_date(value: date, fmt: str) -> str:
+    """Format a date, memoized since batches share many of the same dates.
+    
+    Args:
+        value: Date to format
+        fmt: strftime format
+    
+    Returns:
+        Formatted date string
+    """
+    return value.strftime(fmt)
+
+
+def _load_employment(employment_id: str) -> Optional[Employment]:
+    """Load an employment with its session and candidate in one query.
+    
+    Args:
+        employment_id: Employment ID
+    
+    Returns:
+        Employment record, or None if not found
+    """
+    return (
+        Employment.query
+        .options(
+            joinedload(Employment.verification_session)
+            .joinedload(VerificationSession.candidate)
+        )
+        .filter(Employment.id == employment_id)
+        .first()
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _verification_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor that runs queued verifications.
+    
+    Kept small: verifications are long, I/O-bound, and comparatively rare.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="employment-verification")
+
+
+@functools.lru_cache(maxsize=1)
+def _call_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor that places HR calls alongside emails.
+    
+    Separate from _verification_executor so a queued verification waiting
+    on its call can never starve the pool that would run that call.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="employment-call")
+
+
 class EmploymentVerificationResult:
     """Result of employment verification attempt"""
     
+    __slots__ = (
+        'success', 'employment_id', 'verification_status', 'contact_method',
+        'contact_record_id', 'verified_data', 'error_message'
+    )
+    
     def __init__(
         self,
         success: bool,
@@ -54,7 +123,8 @@ class EmploymentVerificationResult:
         self.verification_status = verification_status
         self.contact_method = contact_method
         self.contact_record_id = contact_record_id
-        self.verified_data = verified_data or {}
+        # None when nothing was verified; use `verified_data or {}` for a dict
+        self.verified_data = verified_data
         self.error_message = error_message
 
 
@@ -65,19 +135,27 @@ class EmploymentVerifier:
     to provide employment verification with automatic fallback from phone to email.
     """
     
+    # Concurrent verifications in verify_employments; each holds a pooled
+    # DB connection while its call/email I/O is in flight
+    BATCH_MAX_WORKERS = 8
+    
     def __init__(
         self,
         call_orchestrator: Optional[CallOrchestrator] = None,
-        email_orchestrator: Optional[EmailOrchestrator] = None
+        email_orchestrator: Optional[EmailOrchestrator] = None,
+        transcript_analyzer: Optional[Callable[[str], Dict[str, Any]]] = None
     ):
         """Initialize EmploymentVerifier with orchestrators.
         
         Args:
             call_orchestrator: Optional CallOrchestrator instance
             email_orchestrator: Optional EmailOrchestrator instance
+            transcript_analyzer: Optional function mapping an HR call transcript
+                to analysis data; run in the background after successful calls
         """
-        self.call_orchestrator = call_orchestrator or CallOrchestrator()
-        self.email_orchestrator = email_orchestrator or EmailOrchestrator()
+        self.call_orchestrator = call_orchestrator or get_default_call_orchestrator()
+        self.email_orchestrator = email_orchestrator or get_default_orchestrator()
+        self.transcript_analyzer = transcript_analyzer
         
         logger.info("EmploymentVerifier initialized")
     
@@ -90,7 +168,8 @@ class EmploymentVerifier:
         """Verify employment using multi-channel contact strategy.
         
         Attempts phone verification first, then falls back to email if phone fails.
-        Creates ContactRecord entries for all attempts and updates Employment status.
+        Creates ContactRecord entries for all attempts and updates Employment status,
+        committing all of these changes once at the end.
         
         Args:
             employment: Employment record to verify
@@ -101,109 +180,437 @@ class EmploymentVerifier:
             EmploymentVerificationResult with verification outcome
         """
         logger.info(
-            f"Starting employment verification for {employment.company_name} "
-            f"(Employment ID: {employment.id})"
+            "Starting employment verification for %s (Employment ID: %s)",
+            employment.company_name, employment.id
         )
         
         # Extract contact info from employment record if not provided
-        if employment.hr_contact_info:
-            hr_phone = hr_phone or employment.hr_contact_info.get('phone')
-            hr_email = hr_email or employment.hr_contact_info.get('email')
+        if not (hr_phone and hr_email):
+            contact_info = employment.hr_contact_info
+            if contact_info:
+                hr_phone = hr_phone or contact_info.get('phone')
+                hr_email = hr_email or contact_info.get('email')
+        
+        # Nothing to try, so record the outcome straight away
+        if not (hr_phone or hr_email):
+            logger.warning("No HR contact info for %s", employment.company_name)
+            return self._mark_unverified(
+                employment,
+                "No HR contact info on file",
+                "No HR contact info available"
+            )
+        
+        # Skip the phone channel outright while the call provider is failing
+        if hr_phone and not self.call_orchestrator.is_available():
+            logger.warning("Call provider unavailable, skipping phone verification to %s", hr_phone)
+            hr_phone = None
+        
+        # Resolve the candidate once for both channels
+        candidate_name = None
+        if hr_phone or hr_email:
+            candidate_name = employment.verification_session.candidate.full_name
+        
+        # With both channels available, place the call in the background while
+        # the email goes out; the outcome is still recorded after the email's
+        call_future = None
+        call_started_at = None
+        if hr_phone and hr_email:
+            call_started_at = _utcnow()
+            call_future = _call_executor().submit(
+                self.call_orchestrator.initiate_hr_verification,
+                **self._hr_call_kwargs(employment, hr_phone, candidate_name)
+            )
         
         # Send email notification first if email is available (always send as notification)
         email_sent = False
         if hr_email:
-            logger.info(f"Sending email notification to HR at {hr_email}")
-            email_result = self._verify_via_email(employment, hr_email)
+            logger.info("Sending email notification to HR at %s", hr_email)
+            email_result = self._verify_via_email(employment, hr_email, candidate_name)
             
             if email_result.success:
                 email_sent = True
                 logger.info("Email notification sent successfully")
             else:
-                logger.warning(f"Failed to send email notification: {email_result.error_message}")
+                logger.warning("Failed to send email notification: %s", email_result.error_message)
         
         # Try phone verification if available
         if hr_phone:
-            logger.info(f"Attempting phone verification to {hr_phone}")
-            result = self._verify_via_phone(employment, hr_phone)
+            logger.info("Attempting phone verification to %s", hr_phone)
+            result = self._verify_via_phone(
+                employment,
+                hr_phone,
+                candidate_name,
+                call_future=call_future,
+                call_started_at=call_started_at
+            )
             
             if result.success:
                 logger.info("Phone verification successful")
+                safe_db_commit()
+                self._queue_transcript_analysis(result)
                 return result
             
-            logger.warning(f"Phone verification failed: {result.error_message}")
+            logger.warning("Phone verification failed: %s", result.error_message)
         
         # If phone failed but email was sent, return email result
         if email_sent:
             logger.info("Phone verification failed but email was sent successfully")
+            safe_db_commit()
             return email_result
         
-        # Both methods failed or no contact info available
+        # Both methods failed
         logger.error(
-            f"Employment verification failed for {employment.company_name}: "
-            "No successful contact method"
+            "Employment verification failed for %s: No successful contact method",
+            employment.company_name
+        )
+        
+        return self._mark_unverified(
+            employment,
+            "Unable to contact HR via phone or email",
+            "No successful contact method available"
+        )
+    
+    def submit_verification(
+        self,
+        employment: Employment,
+        hr_phone: Optional[str] = None,
+        hr_email: Optional[str] = None
+    ) -> Future:
+        """Queue employment verification and return without waiting for it.
+        
+        Marks the employment as PENDING and commits, then runs
+        verify_employment on a background worker inside the current Flask
+        application's context.
+        
+        Args:
+            employment: Employment record to verify
+            hr_phone: HR phone number (optional)
+            hr_email: HR email address (optional)
+        
+        Returns:
+            Future resolving to the EmploymentVerificationResult
+        """
+        employment.verification_status = EmploymentVerificationStatus.PENDING
+        safe_db_commit()
+        
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            # No application context; the worker uses the record as given
+            app = None
+        
+        logger.info(
+            "Queued employment verification for %s (Employment ID: %s)",
+            employment.company_name, employment.id
+        )
+        return _verification_executor().submit(
+            self._run_queued_verification,
+            app,
+            employment.id if app is not None else employment,
+            hr_phone,
+            hr_email
+        )
+    
+    def _run_queued_verification(
+        self,
+        app,
+        employment,
+        hr_phone: Optional[str],
+        hr_email: Optional[str]
+    ) -> EmploymentVerificationResult:
+        """Run a verification queued by submit_verification.
+        
+        Args:
+            app: Flask application to run in, or None
+            employment: Employment ID when app is given, otherwise the record
+            hr_phone: HR phone number (optional)
+            hr_email: HR email address (optional)
+        
+        Returns:
+            EmploymentVerificationResult with verification outcome
+        """
+        if app is None:
+            return self.verify_employment(employment, hr_phone, hr_email)
+        
+        with app.app_context():
+            # Reload in this thread's session rather than sharing the caller's
+            record = _load_employment(employment)
+            if record is None:
+                raise ValueError(f"Employment {employment} not found")
+            return self.verify_employment(record, hr_phone, hr_email)
+    
+    def verify_employments(
+        self,
+        employments: List[Employment]
+    ) -> List[EmploymentVerificationResult]:
+        """Verify several employment records concurrently.
+        
+        HR contact details are taken from each record's hr_contact_info.
+        Each verification runs on its own worker with its own session and
+        commits independently, so one failure does not roll back the others;
+        a worker that raises gives an unsuccessful result for its record.
+        
+        Args:
+            employments: Employment records to verify
+        
+        Returns:
+            EmploymentVerificationResult for each record, in input order
+        """
+        if not employments:
+            return []
+        
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            # No application context to hand to workers; verify in place
+            return [self.verify_employment(employment) for employment in employments]
+        
+        # Workers load the rows in their own sessions, so persist ours first;
+        # statuses are kept for results of workers that fail
+        employment_ids = [employment.id for employment in employments]
+        statuses = [employment.verification_status for employment in employments]
+        safe_db_commit()
+        
+        logger.info("Verifying %d employment records", len(employment_ids))
+        workers = min(self.BATCH_MAX_WORKERS, len(employment_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="employment-batch") as executor:
+            futures = [
+                executor.submit(self._run_queued_verification, app, employment_id, None, None)
+                for employment_id in employment_ids
+            ]
+        
+        results = []
+        for employment_id, status, future in zip(employment_ids, statuses, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # A failed worker only fails its own record
+                logger.error(
+                    "Verification of employment %s failed: %s", employment_id, e, exc_info=True
+                )
+                results.append(self._fail(employment_id, status, 'NONE', str(e)))
+        return results
+    
+    def _queue_transcript_analysis(self, result: EmploymentVerificationResult) -> None:
+        """Queue analysis of a successful call's transcript, if configured.
+        
+        Analysis can be slow (e.g. an LLM call), so it runs on a background
+        worker rather than holding up the verification.
+        
+        Args:
+            result: Successful phone verification result
+        """
+        transcript_path = (result.verified_data or {}).get('transcript_path')
+        if self.transcript_analyzer is None or not transcript_path:
+            return
+        
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            logger.warning(
+                "Skipping transcript analysis for contact record %s: no application context",
+                result.contact_record_id
+            )
+            return
+        
+        _verification_executor().submit(
+            self._run_transcript_analysis,
+            app,
+            result.contact_record_id,
+            transcript_path
         )
+    
+    def _run_transcript_analysis(
+        self,
+        app,
+        contact_record_id: str,
+        transcript_path: str
+    ) -> None:
+        """Analyze a call transcript and store the outcome on its ContactRecord.
+        
+        Args:
+            app: Flask application to run in
+            contact_record_id: ContactRecord of the call
+            transcript_path: Path to the saved transcript
+        """
+        with app.app_context():
+            try:
+                with open(transcript_path, 'r', encoding='utf-8') as f:
+                    analysis = self.transcript_analyzer(f.read())
+                
+                contact_record = ContactRecord.query.get(contact_record_id)
+                if contact_record is None:
+                    logger.warning("Contact record %s not found for transcript analysis", contact_record_id)
+                    return
+                
+                # Assign a new dict so the JSON column is marked dirty
+                contact_record.response_data = {
+                    **(contact_record.response_data or {}),
+                    'transcript_analysis': analysis
+                }
+                safe_db_commit()
+                logger.info("Stored transcript analysis for contact record %s", contact_record_id)
+            except Exception as e:
+                logger.error(
+                    "Transcript analysis failed for contact record %s: %s",
+                    contact_record_id, e,
+                    exc_info=True
+                )
+                db.session.rollback()
+    
+    def _mark_unverified(
+        self,
+        employment: Employment,
+        notes: str,
+        error_message: str
+    ) -> EmploymentVerificationResult:
+        """Mark an employment UNVERIFIED and commit.
         
-        # Update employment status to UNVERIFIED
+        Args:
+            employment: Employment record being verified
+            notes: Verification notes to store on the employment
+            error_message: Error message for the result
+        
+        Returns:
+            EmploymentVerificationResult with success=False
+        """
         employment.verification_status = EmploymentVerificationStatus.UNVERIFIED
-        employment.verification_notes = "Unable to contact HR via phone or email"
+        employment.verification_notes = notes
         safe_db_commit()
         
+        return self._fail(
+            employment.id,
+            EmploymentVerificationStatus.UNVERIFIED,
+            "NONE",
+            error_message
+        )
+    
+    @staticmethod
+    def _fail(
+        employment_id: str,
+        status: EmploymentVerificationStatus,
+        method: str,
+        msg: str,
+        contact_record_id: Optional[str] = None
+    ) -> EmploymentVerificationResult:
+        """Build an unsuccessful EmploymentVerificationResult.
+        
+        Args:
+            employment_id: Employment ID
+            status: Employment's verification status after the attempt
+            method: Contact method attempted ('PHONE', 'EMAIL' or 'NONE')
+            msg: Error message
+            contact_record_id: ContactRecord for the attempt, if any
+        
+        Returns:
+            EmploymentVerificationResult with success=False
+        """
         return EmploymentVerificationResult(
             success=False,
-            employment_id=employment.id,
-            verification_status=EmploymentVerificationStatus.UNVERIFIED,
-            contact_method="NONE",
-            error_message="No successful contact method available"
+            employment_id=employment_id,
+            verification_status=status,
+            contact_method=method,
+            contact_record_id=contact_record_id,
+            error_message=msg
         )
     
+    @staticmethod
+    def _save_attempt(
+        contact_record: ContactRecord,
+        result: EmploymentVerificationResult
+    ) -> EmploymentVerificationResult:
+        """Insert a completed attempt's ContactRecord and link it to the result.
+        
+        The record is only added once the attempt's outcome is known; the
+        caller commits all changes for the employment at once.
+        
+        Args:
+            contact_record: ContactRecord for the attempt, fully populated
+            result: Result of the attempt
+        
+        Returns:
+            The result, with contact_record_id set
+        """
+        safe_db_add(contact_record)
+        result.contact_record_id = contact_record.id
+        return result
+    
+    def _hr_call_kwargs(
+        self,
+        employment: Employment,
+        hr_phone: str,
+        candidate_name: str
+    ) -> Dict[str, Any]:
+        """Build the arguments for CallOrchestrator.initiate_hr_verification.
+        
+        Args:
+            employment: Employment record to verify
+            hr_phone: HR phone number
+            candidate_name: Candidate's full name
+        
+        Returns:
+            Keyword arguments for the call
+        """
+        # Format dates for call
+        start_date = _fmt_date(employment.start_date, "%B %Y")
+        end_date = _fmt_date(employment.end_date, "%B %Y") if employment.end_date else "Present"
+        
+        return {
+            'candidate_name': candidate_name,
+            'job_title': employment.job_title,
+            'start_date': start_date,
+            'end_date': end_date,
+            'hr_phone': hr_phone
+        }
+    
     def _verify_via_phone(
         self,
         employment: Employment,
-        hr_phone: str
+        hr_phone: str,
+        candidate_name: str,
+        call_future: Optional[Future] = None,
+        call_started_at: Optional[datetime] = None
     ) -> EmploymentVerificationResult:
         """Verify employment via phone call.
         
         Args:
             employment: Employment record to verify
             hr_phone: HR phone number
+            candidate_name: Candidate's full name
+            call_future: Call already placed in the background, if any
+            call_started_at: When call_future was submitted
         
         Returns:
             EmploymentVerificationResult
         """
-        # Get candidate name from verification session
-        candidate_name = employment.verification_session.candidate.full_name
-        
-        # Format dates for call
-        start_date = employment.start_date.strftime("%B %Y")
-        end_date = employment.end_date.strftime("%B %Y") if employment.end_date else "Present"
-        
         # Create contact record for attempt
         contact_record = ContactRecord(
+            # Assign the id here rather than at flush so it is known up front
+            id=str(uuid.uuid4()),
             verification_session_id=employment.verification_session_id,
             contact_type='HR',
             contact_method='PHONE',
             contact_info=hr_phone,
-            attempt_timestamp=datetime.utcnow(),
+            attempt_timestamp=call_started_at or _utcnow(),
             response_received=False
         )
-        safe_db_add(contact_record)
-        safe_db_commit()
         
         try:
-            # Initiate HR verification call
-            call_result: CallResult = self.call_orchestrator.initiate_hr_verification(
-                candidate_name=candidate_name,
-                job_title=employment.job_title,
-                start_date=start_date,
-                end_date=end_date,
-                hr_phone=hr_phone
-            )
+            # Initiate HR verification call, or wait for the one already placed
+            if call_future is not None:
+                call_result: CallResult = call_future.result()
+            else:
+                call_result = self.call_orchestrator.initiate_hr_verification(
+                    **self._hr_call_kwargs(employment, hr_phone, candidate_name)
+                )
             
             if call_result.success:
+                # One timestamp for the answer, stored and quoted in the notes
+                answered_at = _utcnow()
+                
                 # Update contact record with success
                 contact_record.response_received = True
-                contact_record.response_timestamp = datetime.utcnow()
+                contact_record.response_timestamp = answered_at
                 contact_record.transcript_url = call_result.transcript_path
                 contact_record.response_data = {
                     'call_id': call_result.call_id,
@@ -214,16 +621,13 @@ class EmploymentVerifier:
                 # For MVP, we'll mark as VERIFIED if call completed successfully
                 # In production, would parse transcript for actual verification
                 employment.verification_status = EmploymentVerificationStatus.VERIFIED
-                employment.verification_notes = f"Verified via phone call on {datetime.utcnow().strftime('%Y-%m-%d')}"
+                employment.verification_notes = f"Verified via phone call on {_fmt_date(answered_at.date(), '%Y-%m-%d')}"
                 
-                safe_db_commit()
-                
-                return EmploymentVerificationResult(
+                result = EmploymentVerificationResult(
                     success=True,
                     employment_id=employment.id,
                     verification_status=EmploymentVerificationStatus.VERIFIED,
                     contact_method='PHONE',
-                    contact_record_id=contact_record.id,
                     verified_data={
                         'call_id': call_result.call_id,
                         'transcript_path': call_result.transcript_path,
@@ -233,15 +637,12 @@ class EmploymentVerifier:
             else:
                 # Update contact record with failure
                 contact_record.notes = call_result.error_message
-                safe_db_commit()
                 
-                return EmploymentVerificationResult(
-                    success=False,
-                    employment_id=employment.id,
-                    verification_status=employment.verification_status,
-                    contact_method='PHONE',
-                    contact_record_id=contact_record.id,
-                    error_message=call_result.error_message
+                result = self._fail(
+                    employment.id,
+                    employment.verification_status,
+                    'PHONE',
+                    call_result.error_message
                 )
         
         except Exception as e:
@@ -249,49 +650,60 @@ class EmploymentVerifier:
             logger.error(error_msg, exc_info=True)
             
             contact_record.notes = error_msg
-            safe_db_commit()
             
-            return EmploymentVerificationResult(
-                success=False,
-                employment_id=employment.id,
-                verification_status=employment.verification_status,
-                contact_method='PHONE',
-                contact_record_id=contact_record.id,
-                error_message=error_msg
+            result = self._fail(
+                employment.id,
+                employment.verification_status,
+                'PHONE',
+                error_msg
             )
+        
+        return self._save_attempt(contact_record, result)
     
     def _verify_via_email(
         self,
         employment: Employment,
-        hr_email: str
+        hr_email: str,
+        candidate_name: str
     ) -> EmploymentVerificationResult:
         """Verify employment via email.
         
         Args:
             employment: Employment record to verify
             hr_email: HR email address
+            candidate_name: Candidate's full name
         
         Returns:
             EmploymentVerificationResult
         """
-        # Get candidate name from verification session
-        candidate_name = employment.verification_session.candidate.full_name
+        # While the server is rate limiting, fail fast without recording an
+        # attempt so the caller can retry later
+        if not self.email_orchestrator.is_available():
+            logger.warning("Email provider is rate limiting, skipping email to %s", hr_email)
+            return self._fail(
+                employment.id,
+                employment.verification_status,
+                'EMAIL',
+                "Email provider is rate limiting; retry later"
+            )
         
         # Format dates for email
-        start_date = employment.start_date.strftime("%Y-%m-%d")
-        end_date = employment.end_date.strftime("%Y-%m-%d") if employment.end_date else "Present"
+        start_date = _fmt_date(employment.start_date, "%Y-%m-%d")
+        end_date = _fmt_date(employment.end_date, "%Y-%m-%d") if employment.end_date else "Present"
+        
+        now = _utcnow()
         
         # Create contact record for attempt
         contact_record = ContactRecord(
+            # Assign the id here rather than at flush so it is known up front
+            id=str(uuid.uuid4()),
             verification_session_id=employment.verification_session_id,
             contact_type='HR',
             contact_method='EMAIL',
             contact_info=hr_email,
-            attempt_timestamp=datetime.utcnow(),
+            attempt_timestamp=now,
             response_received=False
         )
-        safe_db_add(contact_record)
-        safe_db_commit()
         
         try:
             # Send HR verification email
@@ -312,16 +724,13 @@ class EmploymentVerifier:
                 
                 # Email sent successfully, but response pending
                 # Mark as PENDING until we receive a response
-                employment.verification_notes = f"Verification email sent on {datetime.utcnow().strftime('%Y-%m-%d')}, awaiting response"
-                
-                safe_db_commit()
+                employment.verification_notes = f"Verification email sent on {_fmt_date(now.date(), '%Y-%m-%d')}, awaiting response"
                 
-                return EmploymentVerificationResult(
+                result = EmploymentVerificationResult(
                     success=True,
                     employment_id=employment.id,
                     verification_status=EmploymentVerificationStatus.PENDING,
                     contact_method='EMAIL',
-                    contact_record_id=contact_record.id,
                     verified_data={
                         'email_id': email_result.email_id,
                         'log_path': email_result.log_path
@@ -330,15 +739,12 @@ class EmploymentVerifier:
             else:
                 # Update contact record with failure
                 contact_record.notes = email_result.error_message
-                safe_db_commit()
                 
-                return EmploymentVerificationResult(
-                    success=False,
-                    employment_id=employment.id,
-                    verification_status=employment.verification_status,
-                    contact_method='EMAIL',
-                    contact_record_id=contact_record.id,
-                    error_message=email_result.error_message
+                result = self._fail(
+                    employment.id,
+                    employment.verification_status,
+                    'EMAIL',
+                    email_result.error_message
                 )
         
         except Exception as e:
@@ -346,13 +752,12 @@ class EmploymentVerifier:
             logger.error(error_msg, exc_info=True)
             
             contact_record.notes = error_msg
-            safe_db_commit()
             
-            return EmploymentVerificationResult(
-                success=False,
-                employment_id=employment.id,
-                verification_status=employment.verification_status,
-                contact_method='EMAIL',
-                contact_record_id=contact_record.id,
-                error_message=error_msg
+            result = self._fail(
+                employment.id,
+                employment.verification_status,
+                'EMAIL',
+                error_msg
             )
+        
+        return self._save_attempt(contact_record, result)
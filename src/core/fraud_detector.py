@@ -9,9 +9,13 @@ This module implements comprehensive fraud detection including:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Any, Tuple
-from collections import defaultdict
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy.orm import selectinload
 
 from src.database.models import (
     db, VerificationSession, Employment, EducationCredential, FraudFlag,
@@ -21,122 +25,273 @@ from src.database.models import (
 
 logger = logging.getLogger(__name__)
 
+# Severity strings used by ClaimValidator issues
+_SEVERITY_FROM_STR = {
+    'critical': FraudSeverity.CRITICAL,
+    'moderate': FraudSeverity.MODERATE,
+    'minor': FraudSeverity.MINOR
+}
+
+
+def _start_ordinal(employment: Employment) -> int:
+    """Sort key ordering employments by start date as plain integers"""
+    return employment.start_date.toordinal()
+
+
+def _overlapping_pairs(day_numbers: List[Tuple[int, Optional[int]]]) -> List[Tuple[int, int, int]]:
+    """
+    Find every overlapping pair of jobs in a start-sorted timeline
+    
+    For each finished job, scans forward only while later jobs start before
+    it ends; since starts are sorted, the first one that doesn't ends the scan.
+    Every job scanned before that overlaps, so the work is linear in the
+    number of jobs plus the number of overlaps.
+    
+    Args:
+        day_numbers: (start, end) day ordinals per job, sorted by start; end is
+            None for current jobs, which are never the earlier side of an overlap
+            
+    Returns:
+        List of (earlier index, later index, overlap days), ordered by pair
+    """
+    pairs = []
+    count = len(day_numbers)
+    
+    for i in range(count):
+        end1 = day_numbers[i][1]
+        if end1 is None:
+            continue
+        
+        j = i + 1
+        while j < count and day_numbers[j][0] < end1:
+            pairs.append((i, j, end1 - day_numbers[j][0]))
+            j += 1
+    
+    return pairs
+
 
 class TimelineAnalyzer:
     """Analyzes employment and education timelines for conflicts and gaps"""
     
     @staticmethod
-    def detect_timeline_conflicts(employments: List[Employment]) -> List[Dict[str, Any]]:
+    def analyze_timeline(
+        employments: List[Employment],
+        education: List[EducationCredential],
+        gap_threshold_months: int = 3,
+        today: Optional[date] = None,
+        assume_sorted: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run all timeline checks, sorting and sweeping the employments once
+        
+        Args:
+            employments: List of Employment records
+            education: List of EducationCredential records
+            gap_threshold_months: Minimum gap in months to flag (default: 3)
+            today: Date to check for future dates against (default: today)
+            assume_sorted: Employments are already sorted by start date
+            
+        Returns:
+            Tuple of (conflicts, gaps, future_dates), as returned by
+            detect_timeline_conflicts, detect_employment_gaps and
+            detect_future_dates
+        """
+        conflicts, gaps = TimelineAnalyzer._sweep_employments(
+            employments,
+            gap_threshold_months=gap_threshold_months,
+            assume_sorted=assume_sorted
+        )
+        future_dates = TimelineAnalyzer.detect_future_dates(employments, education, today)
+        return conflicts, gaps, future_dates
+    
+    @staticmethod
+    def detect_timeline_conflicts(
+        employments: List[Employment],
+        assume_sorted: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Detect impossible date overlaps in employment history
         
         Args:
             employments: List of Employment records
+            assume_sorted: Employments are already sorted by start date
             
         Returns:
             List of conflict dictionaries with details
         """
-        conflicts = []
-        
-        # Sort employments by start date
-        sorted_employments = sorted(employments, key=lambda e: e.start_date)
-        
-        for i in range(len(sorted_employments)):
-            for j in range(i + 1, len(sorted_employments)):
-                emp1 = sorted_employments[i]
-                emp2 = sorted_employments[j]
-                
-                # Skip if emp1 has no end date (current job)
-                if not emp1.end_date:
-                    continue
-                
-                # Check for overlap
-                if emp1.end_date > emp2.start_date:
-                    overlap_days = (emp1.end_date - emp2.start_date).days
-                    
-                    conflicts.append({
-                        'type': 'overlap',
-                        'employment1': {
-                            'id': emp1.id,
-                            'company': emp1.company_name,
-                            'title': emp1.job_title,
-                            'start_date': emp1.start_date.isoformat(),
-                            'end_date': emp1.end_date.isoformat()
-                        },
-                        'employment2': {
-                            'id': emp2.id,
-                            'company': emp2.company_name,
-                            'title': emp2.job_title,
-                            'start_date': emp2.start_date.isoformat(),
-                            'end_date': emp2.end_date.isoformat() if emp2.end_date else None
-                        },
-                        'overlap_days': overlap_days,
-                        'description': f"Employment at {emp1.company_name} overlaps with {emp2.company_name} by {overlap_days} days"
-                    })
-        
+        conflicts, _ = TimelineAnalyzer._sweep_employments(employments, assume_sorted=assume_sorted)
         return conflicts
     
     @staticmethod
-    def detect_employment_gaps(employments: List[Employment], gap_threshold_months: int = 3) -> List[Dict[str, Any]]:
+    def detect_employment_gaps(
+        employments: List[Employment],
+        gap_threshold_months: int = 3,
+        assume_sorted: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Detect suspicious gaps in employment history
         
         Args:
             employments: List of Employment records
             gap_threshold_months: Minimum gap in months to flag (default: 3)
+            assume_sorted: Employments are already sorted by start date
             
         Returns:
             List of gap dictionaries with details
         """
-        gaps = []
-        
-        # Sort employments by start date
-        sorted_employments = sorted(employments, key=lambda e: e.start_date)
+        _, gaps = TimelineAnalyzer._sweep_employments(
+            employments,
+            find_conflicts=False,
+            gap_threshold_months=gap_threshold_months,
+            assume_sorted=assume_sorted
+        )
+        return gaps
+    
+    @staticmethod
+    def _sweep_employments(
+        employments: List[Employment],
+        find_conflicts: bool = True,
+        gap_threshold_months: Optional[int] = None,
+        assume_sorted: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Find overlaps and gaps in one pass over the employments in start order
         
-        for i in range(len(sorted_employments) - 1):
-            current_emp = sorted_employments[i]
-            next_emp = sorted_employments[i + 1]
-            
-            # Skip if current employment has no end date
-            if not current_emp.end_date:
-                continue
+        Args:
+            employments: List of Employment records
+            find_conflicts: Whether to look for overlaps
+            gap_threshold_months: Minimum gap in months to flag, or None to
+                skip gap detection
+            assume_sorted: Employments are already sorted by start date
             
-            # Calculate gap
-            gap_days = (next_emp.start_date - current_emp.end_date).days
-            gap_months = gap_days / 30.0
+        Returns:
+            Tuple of (conflicts, gaps)
+        """
+        gaps = []
+        
+        # Sort employments by start date, unless the caller already has
+        if assume_sorted:
+            sorted_employments = employments
+        else:
+            sorted_employments = sorted(employments, key=_start_ordinal)
+        
+        # Convert dates to day ordinals once so the checks below are plain
+        # integer arithmetic, and format them once since a job can appear in
+        # many results
+        day_numbers = [
+            (emp.start_date.toordinal(), emp.end_date.toordinal() if emp.end_date else None)
+            for emp in sorted_employments
+        ]
+        iso_dates = [
+            (emp.start_date.isoformat(), emp.end_date.isoformat() if emp.end_date else None)
+            for emp in sorted_employments
+        ]
+        
+        # Gaps: compare each job with the one that started just before, if it
+        # ended; thresholds are in whole days (gap months are days / 30)
+        if gap_threshold_months is not None:
+            threshold_days = gap_threshold_months * 30
             
-            if gap_months >= gap_threshold_months:
-                gaps.append({
-                    'type': 'gap',
-                    'previous_employment': {
-                        'company': current_emp.company_name,
-                        'end_date': current_emp.end_date.isoformat()
-                    },
-                    'next_employment': {
-                        'company': next_emp.company_name,
-                        'start_date': next_emp.start_date.isoformat()
-                    },
-                    'gap_days': gap_days,
-                    'gap_months': round(gap_months, 1),
-                    'description': f"Gap of {round(gap_months, 1)} months between {current_emp.company_name} and {next_emp.company_name}"
-                })
+            for j in range(1, len(sorted_employments)):
+                previous_end = day_numbers[j - 1][1]
+                if previous_end is None:
+                    continue
+                
+                gap_days = day_numbers[j][0] - previous_end
+                if gap_days >= threshold_days:
+                    previous_emp = sorted_employments[j - 1]
+                    next_emp = sorted_employments[j]
+                    gap_months = gap_days / 30.0
+                    gaps.append({
+                        'type': 'gap',
+                        'previous_employment': {
+                            'company': previous_emp.company_name,
+                            'end_date': iso_dates[j - 1][1]
+                        },
+                        'next_employment': {
+                            'company': next_emp.company_name,
+                            'start_date': iso_dates[j][0]
+                        },
+                        'gap_days': gap_days,
+                        'gap_months': round(gap_months, 1),
+                        'description': f"Gap of {round(gap_months, 1)} months between {previous_emp.company_name} and {next_emp.company_name}"
+                    })
         
-        return gaps
+        # Overlaps
+        overlaps = _overlapping_pairs(day_numbers) if find_conflicts else []
+        conflicts = [
+            TimelineAnalyzer._build_overlap_conflict(
+                sorted_employments[i],
+                sorted_employments[j],
+                iso_dates[i],
+                iso_dates[j],
+                overlap_days
+            )
+            for i, j, overlap_days in overlaps
+        ]
+        
+        return conflicts, gaps
     
     @staticmethod
-    def detect_future_dates(employments: List[Employment], education: List[EducationCredential]) -> List[Dict[str, Any]]:
+    def _build_overlap_conflict(
+        emp1: Employment,
+        emp2: Employment,
+        iso_dates1: Tuple[str, Optional[str]],
+        iso_dates2: Tuple[str, Optional[str]],
+        overlap_days: int
+    ) -> Dict[str, Any]:
+        """
+        Build the conflict dictionary for two overlapping employments
+        
+        Args:
+            emp1: Earlier-starting Employment record, with an end date
+            emp2: Later-starting Employment record
+            iso_dates1: emp1's (start, end) dates in ISO format
+            iso_dates2: emp2's (start, end) dates in ISO format
+            overlap_days: Days from emp2's start to emp1's end
+            
+        Returns:
+            Conflict dictionary with details
+        """
+        return {
+            'type': 'overlap',
+            'employment1': {
+                'id': emp1.id,
+                'company': emp1.company_name,
+                'title': emp1.job_title,
+                'start_date': iso_dates1[0],
+                'end_date': iso_dates1[1]
+            },
+            'employment2': {
+                'id': emp2.id,
+                'company': emp2.company_name,
+                'title': emp2.job_title,
+                'start_date': iso_dates2[0],
+                'end_date': iso_dates2[1]
+            },
+            'overlap_days': overlap_days,
+            'description': f"Employment at {emp1.company_name} overlaps with {emp2.company_name} by {overlap_days} days"
+        }
+    
+    @staticmethod
+    def detect_future_dates(
+        employments: List[Employment],
+        education: List[EducationCredential],
+        today: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
         """
         Detect dates in the future (impossible)
         
         Args:
             employments: List of Employment records
             education: List of EducationCredential records
+            today: Date to compare against (default: today)
             
         Returns:
             List of future date violations
         """
         violations = []
-        today = date.today()
+        today = today or date.today()
         
         # Check employment dates
         for emp in employments:
@@ -175,6 +330,19 @@ class TimelineAnalyzer:
 class ClaimValidator:
     """Validates claims against verification results"""
     
+    # Employment statuses that raise a claim issue, with the issue type and
+    # description template for each
+    EMPLOYMENT_STATUS_ISSUES = {
+        EmploymentVerificationStatus.UNVERIFIED: (
+            'unverified_employment',
+            "Employment at {company} could not be verified"
+        ),
+        EmploymentVerificationStatus.CONFLICTED: (
+            'conflicted_employment',
+            "Employment verification at {company} shows conflicting information"
+        ),
+    }
+    
     @staticmethod
     def validate_employment_claims(employments: List[Employment]) -> List[Dict[str, Any]]:
         """
@@ -188,36 +356,28 @@ class ClaimValidator:
         """
         issues = []
         
+        status_issues = ClaimValidator.EMPLOYMENT_STATUS_ISSUES
+        
         for emp in employments:
-            if emp.verification_status == EmploymentVerificationStatus.UNVERIFIED:
-                issues.append({
-                    'type': 'unverified_employment',
-                    'severity': 'critical',
-                    'company': emp.company_name,
-                    'title': emp.job_title,
-                    'dates': f"{emp.start_date.isoformat()} to {emp.end_date.isoformat() if emp.end_date else 'Present'}",
-                    'description': f"Employment at {emp.company_name} could not be verified",
-                    'evidence': {
-                        'employment_id': emp.id,
-                        'verification_status': emp.verification_status.value,
-                        'notes': emp.verification_notes
-                    }
-                })
+            status_issue = status_issues.get(emp.verification_status)
+            if status_issue is None:
+                continue
             
-            elif emp.verification_status == EmploymentVerificationStatus.CONFLICTED:
-                issues.append({
-                    'type': 'conflicted_employment',
-                    'severity': 'critical',
-                    'company': emp.company_name,
-                    'title': emp.job_title,
-                    'dates': f"{emp.start_date.isoformat()} to {emp.end_date.isoformat() if emp.end_date else 'Present'}",
-                    'description': f"Employment verification at {emp.company_name} shows conflicting information",
-                    'evidence': {
-                        'employment_id': emp.id,
-                        'verification_status': emp.verification_status.value,
-                        'notes': emp.verification_notes
-                    }
-                })
+            issue_type, description = status_issue
+            end_date = emp.end_date.isoformat() if emp.end_date else 'Present'
+            issues.append({
+                'type': issue_type,
+                'severity': 'critical',
+                'company': emp.company_name,
+                'title': emp.job_title,
+                'dates': f"{emp.start_date.isoformat()} to {end_date}",
+                'description': description.format(company=emp.company_name),
+                'evidence': {
+                    'employment_id': emp.id,
+                    'verification_status': emp.verification_status.value,
+                    'notes': emp.verification_notes
+                }
+            })
         
         return issues
     
@@ -362,12 +522,33 @@ class RiskScorer:
         if not fraud_flags:
             return RiskScore.GREEN
         
-        # Count flags by severity
-        critical_count = sum(1 for flag in fraud_flags if flag.severity == FraudSeverity.CRITICAL)
-        moderate_count = sum(1 for flag in fraud_flags if flag.severity == FraudSeverity.MODERATE)
-        minor_count = sum(1 for flag in fraud_flags if flag.severity == FraudSeverity.MINOR)
+        # Count flags by severity in one pass; any critical flag decides the
+        # score, so stop at the first one
+        moderate_count = 0
+        minor_count = 0
+        for flag in fraud_flags:
+            if flag.severity == FraudSeverity.CRITICAL:
+                return RiskScore.RED
+            if flag.severity == FraudSeverity.MODERATE:
+                moderate_count += 1
+            elif flag.severity == FraudSeverity.MINOR:
+                minor_count += 1
+        
+        return RiskScorer._score_from_counts(0, moderate_count, minor_count)
+    
+    @staticmethod
+    def _score_from_counts(critical_count: int, moderate_count: int, minor_count: int) -> RiskScore:
+        """
+        Apply the scoring logic of calculate_risk_score to severity counts
         
-        # Apply scoring logic
+        Args:
+            critical_count: Number of CRITICAL flags
+            moderate_count: Number of MODERATE flags
+            minor_count: Number of MINOR flags
+            
+        Returns:
+            RiskScore enum (GREEN, YELLOW, or RED)
+        """
         if critical_count > 0:
             return RiskScore.RED
         
@@ -393,43 +574,67 @@ class RiskScorer:
         Returns:
             Dictionary with risk summary details
         """
-        critical_flags = [f for f in fraud_flags if f.severity == FraudSeverity.CRITICAL]
-        moderate_flags = [f for f in fraud_flags if f.severity == FraudSeverity.MODERATE]
-        minor_flags = [f for f in fraud_flags if f.severity == FraudSeverity.MINOR]
+        _, summary = RiskScorer.score_and_summarize(fraud_flags)
+        return summary
+    
+    @staticmethod
+    def score_and_summarize(fraud_flags: List[FraudFlag]) -> Tuple[RiskScore, Dict[str, Any]]:
+        """
+        Calculate the risk score and summary together in one pass over the flags
+        
+        Args:
+            fraud_flags: List of FraudFlag records
+            
+        Returns:
+            Tuple of (RiskScore, summary), as returned by calculate_risk_score
+            and get_risk_summary
+        """
+        critical_count = 0
+        moderate_count = 0
+        minor_count = 0
+        critical_issues = []
+        moderate_issues = []
+        flags_by_type = Counter()
         
-        # Group by type
-        flags_by_type = defaultdict(list)
         for flag in fraud_flags:
-            flags_by_type[flag.flag_type.value].append(flag)
+            flag_type = flag.flag_type.value
+            flags_by_type[flag_type] += 1
+            
+            if flag.severity == FraudSeverity.CRITICAL:
+                critical_count += 1
+                critical_issues.append({
+                    'type': flag_type,
+                    'description': flag.description
+                })
+            elif flag.severity == FraudSeverity.MODERATE:
+                moderate_count += 1
+                moderate_issues.append({
+                    'type': flag_type,
+                    'description': flag.description
+                })
+            elif flag.severity == FraudSeverity.MINOR:
+                minor_count += 1
         
-        return {
+        risk_score = RiskScorer._score_from_counts(critical_count, moderate_count, minor_count)
+        summary = {
             'total_flags': len(fraud_flags),
-            'critical_count': len(critical_flags),
-            'moderate_count': len(moderate_flags),
-            'minor_count': len(minor_flags),
-            'flags_by_type': {
-                flag_type: len(flags) for flag_type, flags in flags_by_type.items()
-            },
-            'critical_issues': [
-                {
-                    'type': f.flag_type.value,
-                    'description': f.description
-                }
-                for f in critical_flags
-            ],
-            'moderate_issues': [
-                {
-                    'type': f.flag_type.value,
-                    'description': f.description
-                }
-                for f in moderate_flags
-            ]
+            'critical_count': critical_count,
+            'moderate_count': moderate_count,
+            'minor_count': minor_count,
+            'flags_by_type': dict(flags_by_type),
+            'critical_issues': critical_issues,
+            'moderate_issues': moderate_issues
         }
+        
+        return risk_score, summary
 
 
 class FraudDetector:
     """Main fraud detection coordinator"""
     
+    # Concurrent analyses in analyze_sessions
+    BATCH_MAX_WORKERS = 8
+    
     def __init__(self):
         """Initialize FraudDetector"""
         self.timeline_analyzer = TimelineAnalyzer()
@@ -449,8 +654,15 @@ class FraudDetector:
         """
         logger.info(f"Starting fraud analysis for session {verification_session_id}")
         
-        # Load verification session
-        session = db.session.get(VerificationSession, verification_session_id)
+        # Load verification session with the collections every detector reads
+        session = db.session.get(
+            VerificationSession,
+            verification_session_id,
+            options=[
+                selectinload(VerificationSession.employments),
+                selectinload(VerificationSession.education_credentials)
+            ]
+        )
         if not session:
             logger.error(f"Verification session {verification_session_id} not found")
             return {
@@ -458,15 +670,19 @@ class FraudDetector:
                 'error': 'Verification session not found'
             }
         
-        # Clear existing fraud flags for this session
-        FraudFlag.query.filter_by(verification_session_id=verification_session_id).delete()
-        db.session.commit()
+        # Clear existing fraud flags for this session; the deletion is
+        # committed together with the new flags and score below
+        # The flags are rebuilt from scratch, so skip reconciling loaded objects
+        FraudFlag.query.filter_by(verification_session_id=verification_session_id).delete(
+            synchronize_session=False
+        )
         
-        # Run all fraud detection checks
+        # Run all fraud detection checks against a single notion of "today"
+        today = date.today()
         fraud_flags_created = []
         
         # 1. Timeline analysis
-        timeline_flags = self._detect_timeline_fraud(session)
+        timeline_flags = self._detect_timeline_fraud(session, today)
         fraud_flags_created.extend(timeline_flags)
         
         # 2. Credential validation
@@ -477,10 +693,28 @@ class FraudDetector:
         technical_flags = self._detect_technical_fraud(session)
         fraud_flags_created.extend(technical_flags)
         
-        # Calculate risk score
-        all_flags = FraudFlag.query.filter_by(verification_session_id=verification_session_id).all()
-        risk_score = self.risk_scorer.calculate_risk_score(all_flags)
-        risk_summary = self.risk_scorer.get_risk_summary(all_flags)
+        # Insert all new flags in one flush; flushing now assigns their ids
+        # for the response below
+        db.session.add_all(fraud_flags_created)
+        db.session.flush()
+        
+        # Calculate risk score from the flags just created, which are all of
+        # this session's flags since the old ones were cleared
+        all_flags = fraud_flags_created
+        risk_score, risk_summary = self.risk_scorer.score_and_summarize(all_flags)
+        
+        # Serialize before committing, which would expire the flags and
+        # reload each one on access
+        fraud_flags = [
+            {
+                'id': flag.id,
+                'type': flag.flag_type.value,
+                'severity': flag.severity.value,
+                'description': flag.description,
+                'evidence': flag.evidence
+            }
+            for flag in all_flags
+        ]
         
         # Update session risk score
         session.risk_score = risk_score
@@ -498,103 +732,168 @@ class FraudDetector:
             'total_flags': len(all_flags),
             'flags_created': len(fraud_flags_created),
             'risk_summary': risk_summary,
-            'fraud_flags': [
-                {
-                    'id': flag.id,
-                    'type': flag.flag_type.value,
-                    'severity': flag.severity.value,
-                    'description': flag.description,
-                    'evidence': flag.evidence
-                }
-                for flag in all_flags
-            ]
+            'fraud_flags': fraud_flags
         }
     
-    def _detect_timeline_fraud(self, session: VerificationSession) -> List[FraudFlag]:
-        """Detect timeline-related fraud"""
+    def compute_risk_score_fast(self, verification_session_id: str) -> Optional[RiskScore]:
+        """
+        Compute a session's risk score without storing flags or the score
+        
+        Runs the detectors cheapest first and stops at the first critical
+        flag, since one decides the score. Use analyze_session for the full
+        set of flags.
+        
+        Args:
+            verification_session_id: ID of the verification session
+            
+        Returns:
+            RiskScore enum, or None if the session does not exist
+        """
+        session = db.session.get(
+            VerificationSession,
+            verification_session_id,
+            options=[
+                selectinload(VerificationSession.employments),
+                selectinload(VerificationSession.education_credentials)
+            ]
+        )
+        if not session:
+            logger.error(f"Verification session {verification_session_id} not found")
+            return None
+        
+        today = date.today()
+        detectors = (
+            lambda: self._detect_timeline_fraud(session, today),
+            lambda: self._detect_credential_fraud(session),
+            lambda: self._detect_technical_fraud(session)
+        )
+        
+        flags = []
+        for detect in detectors:
+            new_flags = detect()
+            if any(flag.severity == FraudSeverity.CRITICAL for flag in new_flags):
+                return RiskScore.RED
+            flags.extend(new_flags)
+        
+        return self.risk_scorer.calculate_risk_score(flags)
+    
+    def analyze_sessions(self, verification_session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Perform fraud analysis on several verification sessions concurrently
+        
+        Each analysis runs on its own worker inside the current application's
+        context, so each gets its own database session and commits on its own.
+        An analysis that raises gives an unsuccessful result for its session
+        without affecting the others.
+        
+        Args:
+            verification_session_ids: IDs of the verification sessions
+            
+        Returns:
+            Dictionary mapping each session ID to its analyze_session result
+        """
+        if not verification_session_ids:
+            return {}
+        
+        app = current_app._get_current_object()
+        
+        def analyze_in_app(verification_session_id: str) -> Dict[str, Any]:
+            with app.app_context():
+                return self.analyze_session(verification_session_id)
+        
+        logger.info(f"Starting fraud analysis for {len(verification_session_ids)} sessions")
+        workers = min(self.BATCH_MAX_WORKERS, len(verification_session_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fraud-analysis") as executor:
+            futures = {
+                verification_session_id: executor.submit(analyze_in_app, verification_session_id)
+                for verification_session_id in verification_session_ids
+            }
+        
+        results = {}
+        for verification_session_id, future in futures.items():
+            try:
+                results[verification_session_id] = future.result()
+            except Exception as e:
+                # A failed analysis only fails its own session
+                logger.error(f"Fraud analysis failed for session {verification_session_id}: {e}", exc_info=True)
+                results[verification_session_id] = {
+                    'success': False,
+                    'error': str(e)
+                }
+        return results
+    
+    def _detect_timeline_fraud(self, session: VerificationSession, today: date) -> List[FraudFlag]:
+        """Detect timeline-related fraud; returns new flags without adding them"""
         flags = []
         
+        # Nothing dated to check
+        if not session.employments and not session.education_credentials:
+            return flags
+        
+        # Sort once here; every timeline check below works from this order
+        employments = sorted(session.employments, key=_start_ordinal)
+        
+        # Overlaps, gaps and future dates in one pass over the timeline
+        conflicts, gaps, future_dates = self.timeline_analyzer.analyze_timeline(
+            employments,
+            session.education_credentials,
+            today=today,
+            assume_sorted=True
+        )
+        
+        timeline_conflict = FraudFlagType.TIMELINE_CONFLICT
+        
         # Check for overlapping employment
-        conflicts = self.timeline_analyzer.detect_timeline_conflicts(session.employments)
         for conflict in conflicts:
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.TIMELINE_CONFLICT,
-                severity=FraudSeverity.CRITICAL,
-                description=conflict['description'],
-                evidence=conflict
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            flags.append(self._new_flag(
+                session, timeline_conflict, FraudSeverity.CRITICAL,
+                conflict['description'], conflict
+            ))
         
         # Check for suspicious gaps
-        gaps = self.timeline_analyzer.detect_employment_gaps(session.employments)
         for gap in gaps:
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.TIMELINE_CONFLICT,
-                severity=FraudSeverity.MINOR,
-                description=gap['description'],
-                evidence=gap
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            flags.append(self._new_flag(
+                session, timeline_conflict, FraudSeverity.MINOR,
+                gap['description'], gap
+            ))
         
         # Check for future dates
-        future_dates = self.timeline_analyzer.detect_future_dates(
-            session.employments,
-            session.education_credentials
-        )
         for violation in future_dates:
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.TIMELINE_CONFLICT,
-                severity=FraudSeverity.CRITICAL,
-                description=violation['description'],
-                evidence=violation
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            flags.append(self._new_flag(
+                session, timeline_conflict, FraudSeverity.CRITICAL,
+                violation['description'], violation
+            ))
         
-        db.session.commit()
         return flags
     
     def _detect_credential_fraud(self, session: VerificationSession) -> List[FraudFlag]:
-        """Detect credential-related fraud"""
+        """Detect credential-related fraud; returns new flags without adding them"""
         flags = []
         
+        if not session.employments and not session.education_credentials:
+            return flags
+        
         # Validate employment claims
         employment_issues = self.claim_validator.validate_employment_claims(session.employments)
         for issue in employment_issues:
-            severity = FraudSeverity.CRITICAL if issue['severity'] == 'critical' else FraudSeverity.MODERATE
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.UNVERIFIED_CREDENTIAL,
-                severity=severity,
-                description=issue['description'],
-                evidence=issue['evidence']
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            severity = _SEVERITY_FROM_STR.get(issue['severity'], FraudSeverity.MODERATE)
+            flags.append(self._new_flag(
+                session, FraudFlagType.UNVERIFIED_CREDENTIAL, severity,
+                issue['description'], issue['evidence']
+            ))
         
         # Validate education claims
         education_issues = self.claim_validator.validate_education_claims(session.education_credentials)
         for issue in education_issues:
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.UNVERIFIED_CREDENTIAL,
-                severity=FraudSeverity.CRITICAL,
-                description=issue['description'],
-                evidence=issue['evidence']
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            flags.append(self._new_flag(
+                session, FraudFlagType.UNVERIFIED_CREDENTIAL, FraudSeverity.CRITICAL,
+                issue['description'], issue['evidence']
+            ))
         
-        db.session.commit()
         return flags
     
     def _detect_technical_fraud(self, session: VerificationSession) -> List[FraudFlag]:
-        """Detect technical profile fraud"""
+        """Detect technical profile fraud; returns new flags without adding them"""
         flags = []
         
         # Get GitHub analysis if available
@@ -616,22 +915,27 @@ class FraudDetector:
         )
         
         for issue in technical_issues:
-            severity_map = {
-                'critical': FraudSeverity.CRITICAL,
-                'moderate': FraudSeverity.MODERATE,
-                'minor': FraudSeverity.MINOR
-            }
-            severity = severity_map.get(issue['severity'], FraudSeverity.MODERATE)
-            
-            flag = FraudFlag(
-                verification_session_id=session.id,
-                flag_type=FraudFlagType.TECHNICAL_MISMATCH,
-                severity=severity,
-                description=issue['description'],
-                evidence=issue.get('evidence', {})
-            )
-            db.session.add(flag)
-            flags.append(flag)
+            severity = _SEVERITY_FROM_STR.get(issue['severity'], FraudSeverity.MODERATE)
+            flags.append(self._new_flag(
+                session, FraudFlagType.TECHNICAL_MISMATCH, severity,
+                issue['description'], issue.get('evidence', {})
+            ))
         
-        db.session.commit()
         return flags
+    
+    @staticmethod
+    def _new_flag(
+        session: VerificationSession,
+        flag_type: FraudFlagType,
+        severity: FraudSeverity,
+        description: str,
+        evidence: Dict[str, Any]
+    ) -> FraudFlag:
+        """Build a flag for the session; the caller adds it to the database session"""
+        return FraudFlag(
+            verification_session_id=session.id,
+            flag_type=flag_type,
+            severity=severity,
+            description=description,
+            evidence=evidence
+        )
@@ -1,11 +1,18 @@
 """Data models for the Employment Verification Agent."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import repeat
 from typing import Optional, List
 
 
-@dataclass
+# Store fields in __slots__ rather than a per-instance __dict__ where the
+# dataclass decorator supports it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class CallResult:
     """Result of a verification call attempt.
     
@@ -40,7 +47,7 @@ class CallResult:
             raise TypeError("error_message must be a string or None")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationConfig:
     """Configuration for a conversational AI call.
     
@@ -69,14 +76,15 @@ class ConversationConfig:
         if not self.questions:
             raise ValueError("questions list cannot be empty")
         
-        if not all(isinstance(q, str) and q for q in self.questions):
+        # Type and emptiness checks both run in C, without a per-question frame
+        if not all(map(isinstance, self.questions, repeat(str))) or '' in self.questions:
             raise ValueError("all questions must be non-empty strings")
         
         if not isinstance(self.max_duration_seconds, int) or self.max_duration_seconds <= 0:
             raise ValueError("max_duration_seconds must be a positive integer")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CallTranscript:
     """Transcript of a completed verification call.
     
@@ -86,12 +94,14 @@ class CallTranscript:
         start_time: When the call started
         end_time: When the call ended
         participant_phone: Phone number of the call participant
+        duration_seconds: Call duration in whole seconds, derived from the times
     """
     conversation_id: str
     raw_transcript: str
     start_time: datetime
     end_time: datetime
     participant_phone: str
+    duration_seconds: int = field(init=False, compare=False)
     
     def __post_init__(self):
         """Validate CallTranscript data integrity."""
@@ -112,14 +122,12 @@ class CallTranscript:
         
         if not self.participant_phone or not isinstance(self.participant_phone, str):
             raise ValueError("participant_phone must be a non-empty string")
-    
-    @property
-    def duration_seconds(self) -> int:
-        """Calculate call duration in seconds."""
-        return int((self.end_time - self.start_time).total_seconds())
+        
+        # Computed once here rather than on every read
+        self.duration_seconds = int((self.end_time - self.start_time).total_seconds())
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EmailResult:
     """Result of an email send operation.
     
@@ -152,3 +160,37 @@ class EmailResult:
         
         if self.error_message is not None and not isinstance(self.error_message, str):
             raise TypeError("error_message must be a string or None")
+
+
+@dataclass(**_SLOTS)
+class HREmailJob:
+    """HR verification email to send as part of a bulk send.
+    
+    Attributes:
+        candidate_name: Full name of candidate
+        job_title: Job title to verify
+        start_date: Employment start date (YYYY-MM-DD format)
+        end_date: Employment end date (YYYY-MM-DD format)
+        hr_email: HR contact email address
+    """
+    candidate_name: str
+    job_title: str
+    start_date: str
+    end_date: str
+    hr_email: str
+
+
+@dataclass(**_SLOTS)
+class ReferenceEmailJob:
+    """Reference check email to send as part of a bulk send.
+    
+    Attributes:
+        candidate_name: Full name of candidate
+        reference_name: Name of reference contact
+        reference_email: Reference email address
+        relationship: Relationship to candidate (manager/coworker/supervisor)
+    """
+    candidate_name: str
+    reference_name: str
+    reference_email: str
+    relationship: str
@@ -4,57 +4,152 @@ ReferenceVerifier for managing reference interview workflow.
 This module coordinates reference verification activities including:
 - Multi-channel contact (phone and email)
 - Structured reference interviews
-- Feedback extraction and theme analysis using GPT-4
+- Feedback extraction and theme analysis using OpenAI models
 - Reference relationship verification
 - Storage of transcripts and extracted quotes
 """
 
 import os
 import logging
+import functools
+import threading
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
-from src.core.call_orchestrator import CallOrchestrator
-from src.core.email_orchestrator import EmailOrchestrator
+from flask import has_app_context
+
+# Try to import openai, but make it optional
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+from src.core.call_orchestrator import CallOrchestrator, get_default_call_orchestrator
+from src.core.email_orchestrator import EmailOrchestrator, get_default_orchestrator
 from src.database.models import db, ContactRecord, VerificationSession
 from src.core.models import CallResult, EmailResult
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Transcript analysis prompts, filled in with str.format_map
+_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an expert at analyzing reference call transcripts, extracting key "
+    "themes and quotes, and detecting fraudulent references."
+)
 
-def safe_db_commit():
-    """Safely commit database changes, catching app context errors"""
-    try:
-        db.session.commit()
-    except RuntimeError as e:
-        if "application context" in str(e).lower():
-            logger.warning("Skipping database commit due to app context issue (background thread)")
-        else:
-            raise
+_ANALYSIS_PROMPT_TEMPLATE = """Analyze this reference call transcript for {candidate_name} with reference {reference_name}.
 
+Claimed relationship: {claimed_relationship}{dates_info}
 
-def safe_db_add(obj):
-    """Safely add object to database, catching app context errors"""
-    try:
-        db.session.add(obj)
-    except RuntimeError as e:
-        if "application context" in str(e).lower():
-            logger.warning("Skipping database add due to app context issue (background thread)")
-        else:
-            raise
+Transcript:
+{transcript_text}
+
+Extract:
+1. Key themes about the candidate's performance, skills, and work style
+2. Notable direct quotes that provide insight into the candidate
+
+Focus on actionable insights and specific examples. Include both positive and negative feedback.
+
+Also determine if:
+1. The reference demonstrates knowledge consistent with the claimed relationship
+2. The reference's statements align with the claimed employment timeline
+3. The reference provides specific, credible details (not vague or generic)
+
+Respond in JSON format:
+{{
+    "themes": ["theme1", "theme2", ...],
+    "quotes": ["quote1", "quote2", ...],
+    "verified": true/false,
+    "confidence": "high/medium/low",
+    "reasoning": "brief explanation"
+}}"""
 
 
-def safe_db_rollback():
-    """Safely rollback database changes, catching app context errors"""
+@contextmanager
+def safe_db_ctx():
+    """Commit the database work done in the block, or roll it back on error.
+    
+    Outside an application context (a background thread) there is no
+    session to write to: the block gets None and nothing is written.
+    
+    Yields:
+        The database session, or None outside an application context
+    """
+    if not has_app_context():
+        logger.warning("Skipping database write due to missing app context (background thread)")
+        yield None
+        return
+    
     try:
+        yield db.session
+        db.session.commit()
+    except Exception:
         db.session.rollback()
-    except RuntimeError as e:
-        if "application context" in str(e).lower():
-            logger.warning("Skipping database rollback due to app context issue (background thread)")
-        else:
-            raise
+        raise
+
+
+@functools.lru_cache(maxsize=8)
+def _openai_client(api_key: str):
+    """Get the process-wide OpenAI client for an API key.
+    
+    The client owns an HTTP connection pool, so sharing it lets requests
+    reuse open TLS connections instead of setting up new ones.
+    """
+    return openai.OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=256)
+def _complete_json(
+    api_key: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int
+) -> Dict[str, Any]:
+    """Run a JSON-mode chat completion, memoized on its full input.
+    
+    The prompt embeds the transcript, so re-analyzing the same transcript
+    (retries, replays) returns the earlier answer instead of a new request.
+    Failures raise and are therefore never cached.
+    
+    Args:
+        api_key: OpenAI API key
+        model: Chat model name
+        system_prompt: System message content
+        user_prompt: User message content
+        temperature: Sampling temperature
+        max_tokens: Cap on the response length
+        
+    Returns:
+        Parsed JSON object from the response; callers must not mutate it
+    """
+    response = _openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"}
+    )
+    return json.loads(response.choices[0].message.content)
+
+
+@functools.lru_cache(maxsize=1)
+def _reference_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor that places reference calls alongside emails.
+    
+    Nothing queued here waits on this pool itself, so it cannot starve.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="reference-verification")
 
 
 class ReferenceVerifier:
@@ -68,25 +163,56 @@ class ReferenceVerifier:
     5. Database storage of results
     """
     
+    # Transcript analysis is extraction, not deep reasoning, so a small model
+    # is the default; set REFERENCE_ANALYSIS_MODEL to use another one
+    DEFAULT_ANALYSIS_MODEL = "gpt-4o-mini"
+    
+    # Cap on the analysis response, which holds themes, quotes and a verdict
+    ANALYSIS_MAX_TOKENS = 1024
+    
+    # Only this much of a transcript is read for analysis (~15k tokens)
+    MAX_TRANSCRIPT_BYTES = 60_000
+    
+    # Shorter transcripts (a dropped call, voicemail) hold too little to
+    # analyze, so they are not sent to OpenAI
+    MIN_ANALYSIS_CHARS = 200
+    
     def __init__(
         self,
         call_orchestrator: Optional[CallOrchestrator] = None,
         email_orchestrator: Optional[EmailOrchestrator] = None,
-        openai_api_key: Optional[str] = None
+        openai_api_key: Optional[str] = None,
+        analysis_model: Optional[str] = None,
+        defer_contact_records: bool = False
     ):
         """Initialize ReferenceVerifier.
         
         Args:
             call_orchestrator: Optional CallOrchestrator instance
             email_orchestrator: Optional EmailOrchestrator instance
-            openai_api_key: Optional OpenAI API key for GPT-4 analysis
+            openai_api_key: Optional OpenAI API key for transcript analysis
+            analysis_model: Optional OpenAI model for transcript analysis
+            defer_contact_records: Queue contact records per session until
+                flush_contact_records() instead of committing each one
         """
-        self.call_orchestrator = call_orchestrator or CallOrchestrator()
-        self.email_orchestrator = email_orchestrator or EmailOrchestrator()
+        self.call_orchestrator = call_orchestrator or get_default_call_orchestrator()
+        self.email_orchestrator = email_orchestrator or get_default_orchestrator()
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
+        self.analysis_model = (
+            analysis_model
+            or os.getenv('REFERENCE_ANALYSIS_MODEL')
+            or self.DEFAULT_ANALYSIS_MODEL
+        )
+        
+        # Contact records awaiting flush_contact_records(), by session ID
+        self.defer_contact_records = defer_contact_records
+        self._pending_records: Dict[str, List[ContactRecord]] = {}
+        self._pending_lock = threading.Lock()
         
         if not self.openai_api_key:
             logger.warning("OpenAI API key not provided - feedback analysis will be limited")
+        elif not OPENAI_AVAILABLE:
+            logger.warning("openai package not installed - feedback analysis will be limited")
         
         logger.info("ReferenceVerifier initialized successfully")
 
@@ -134,30 +260,24 @@ class ReferenceVerifier:
         if not verification_session_id or not candidate_name or not reference_name:
             error_msg = "verification_session_id, candidate_name, and reference_name are required"
             logger.error(error_msg)
-            return {
-                "success": False,
-                "contact_method": "none",
-                "feedback_extracted": False,
-                "themes": [],
-                "quotes": [],
-                "relationship_verified": False,
-                "contact_record_id": None,
-                "error_message": error_msg
-            }
+            return self._error_result(error_msg)
         
         if not reference_phone and not reference_email:
             error_msg = "At least one contact method (phone or email) must be provided"
             logger.error(error_msg)
-            return {
-                "success": False,
-                "contact_method": "none",
-                "feedback_extracted": False,
-                "themes": [],
-                "quotes": [],
-                "relationship_verified": False,
-                "contact_record_id": None,
-                "error_message": error_msg
-            }
+            return self._error_result(error_msg)
+        
+        # With both channels available, place the call in the background while
+        # the email goes out; its outcome is still considered after the email's
+        phone_future = None
+        if reference_phone and reference_email:
+            phone_future = _reference_executor().submit(
+                self._attempt_phone_contact,
+                candidate_name=candidate_name,
+                reference_name=reference_name,
+                reference_phone=reference_phone,
+                relationship=relationship
+            )
         
         # Send email notification first if email is available (always send as notification)
         email_sent = False
@@ -183,12 +303,15 @@ class ReferenceVerifier:
         
         if reference_phone:
             logger.info(f"Attempting phone contact with {reference_name}")
-            phone_result = self._attempt_phone_contact(
-                candidate_name=candidate_name,
-                reference_name=reference_name,
-                reference_phone=reference_phone,
-                relationship=relationship
-            )
+            if phone_future is not None:
+                phone_result = phone_future.result()
+            else:
+                phone_result = self._attempt_phone_contact(
+                    candidate_name=candidate_name,
+                    reference_name=reference_name,
+                    reference_phone=reference_phone,
+                    relationship=relationship
+                )
             
             if phone_result.success:
                 contact_result = phone_result
@@ -221,39 +344,35 @@ class ReferenceVerifier:
                 transcript_url=None
             )
             
-            return {
-                "success": False,
-                "contact_method": contact_method,
-                "feedback_extracted": False,
-                "themes": [],
-                "quotes": [],
-                "relationship_verified": False,
-                "contact_record_id": contact_record_id,
-                "error_message": error_msg
-            }
+            return self._error_result(error_msg, contact_method, contact_record_id)
         
         # Extract feedback and themes from transcript (if phone call)
         themes = []
         quotes = []
         feedback_extracted = False
         
-        if transcript_text and self.openai_api_key:
-            logger.info("Extracting feedback themes using GPT-4")
-            analysis = self._extract_feedback_themes(
+        if transcript_text and len(transcript_text) < self.MIN_ANALYSIS_CHARS:
+            logger.info(f"Transcript too short to analyze ({len(transcript_text)} chars)")
+            transcript_text = None
+        
+        if transcript_text and self.openai_api_key and OPENAI_AVAILABLE:
+            # Feedback and relationship authenticity from one request
+            logger.info(f"Analyzing reference transcript using {self.analysis_model}")
+            analysis = self._analyze_transcript(
                 transcript_text=transcript_text,
                 candidate_name=candidate_name,
-                reference_name=reference_name
+                reference_name=reference_name,
+                claimed_relationship=relationship,
+                claimed_employment_dates=claimed_employment_dates
             )
-            themes = analysis.get("themes", [])
-            quotes = analysis.get("quotes", [])
+            themes = analysis["themes"]
+            quotes = analysis["quotes"]
             feedback_extracted = len(themes) > 0 or len(quotes) > 0
-        
-        # Verify relationship authenticity
-        relationship_verified = self._verify_relationship(
-            transcript_text=transcript_text,
-            claimed_relationship=relationship,
-            claimed_employment_dates=claimed_employment_dates
-        )
+            relationship_verified = analysis["relationship_verified"]
+        else:
+            # If no transcript or no OpenAI key, assume verified (benefit of doubt)
+            logger.warning("Cannot verify relationship - no transcript or OpenAI key")
+            relationship_verified = True
         
         # Create contact record in database
         response_data = {
@@ -293,6 +412,33 @@ class ReferenceVerifier:
             "error_message": None
         }
 
+    @staticmethod
+    def _error_result(
+        error_message: str,
+        contact_method: str = "none",
+        contact_record_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the verify_reference result for a failed verification.
+        
+        Args:
+            error_message: Why the verification failed
+            contact_method: Contact method attempted (phone/email/none)
+            contact_record_id: Optional ID of the contact record created
+            
+        Returns:
+            Result dict with no feedback and an unverified relationship
+        """
+        return {
+            "success": False,
+            "contact_method": contact_method,
+            "feedback_extracted": False,
+            "themes": [],
+            "quotes": [],
+            "relationship_verified": False,
+            "contact_record_id": contact_record_id,
+            "error_message": error_message
+        }
+    
     def _attempt_phone_contact(
         self,
         candidate_name: str,
@@ -366,7 +512,7 @@ class ReferenceVerifier:
             )
     
     def _read_transcript(self, transcript_path: str) -> Optional[str]:
-        """Read transcript file content.
+        """Read transcript file content, up to MAX_TRANSCRIPT_BYTES.
         
         Args:
             transcript_path: Path to transcript file
@@ -379,139 +525,67 @@ class ReferenceVerifier:
                 logger.warning(f"Transcript file not found: {transcript_path}")
                 return None
             
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read only the capped prefix; a character cut at the cap is dropped
+            with open(transcript_path, 'rb') as f:
+                data = f.read(self.MAX_TRANSCRIPT_BYTES + 1)
+            
+            if len(data) > self.MAX_TRANSCRIPT_BYTES:
+                logger.warning(
+                    f"Transcript {transcript_path} exceeds {self.MAX_TRANSCRIPT_BYTES} bytes, "
+                    "analyzing the beginning only"
+                )
+                return data[:self.MAX_TRANSCRIPT_BYTES].decode('utf-8', errors='ignore')
             
-            return content
+            return data.decode('utf-8')
         except Exception as e:
             logger.error(f"Failed to read transcript: {str(e)}", exc_info=True)
             return None
 
-    def _extract_feedback_themes(
+    def _analyze_transcript(
         self,
         transcript_text: str,
         candidate_name: str,
-        reference_name: str
-    ) -> Dict[str, List[str]]:
-        """Extract feedback themes and quotes using GPT-4.
-        
-        Args:
-            transcript_text: Full transcript of the reference call
-            candidate_name: Name of the candidate
-            reference_name: Name of the reference
-            
-        Returns:
-            Dict with 'themes' and 'quotes' lists
-        """
-        if not self.openai_api_key or not transcript_text:
-            return {"themes": [], "quotes": []}
-        
-        try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.openai_api_key)
-            
-            prompt = f"""Analyze this reference call transcript for {candidate_name} with reference {reference_name}.
-
-Extract:
-1. Key themes about the candidate's performance, skills, and work style
-2. Notable direct quotes that provide insight into the candidate
-
-Transcript:
-{transcript_text}
-
-Respond in JSON format:
-{{
-    "themes": ["theme1", "theme2", ...],
-    "quotes": ["quote1", "quote2", ...]
-}}
-
-Focus on actionable insights and specific examples. Include both positive and negative feedback."""
-
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at analyzing reference call transcripts and extracting key themes and quotes."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            return {
-                "themes": result.get("themes", []),
-                "quotes": result.get("quotes", [])
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to extract feedback themes: {str(e)}", exc_info=True)
-            return {"themes": [], "quotes": []}
-
-    def _verify_relationship(
-        self,
-        transcript_text: Optional[str],
+        reference_name: str,
         claimed_relationship: str,
         claimed_employment_dates: Optional[Dict[str, str]]
-    ) -> bool:
-        """Verify the authenticity of the reference relationship.
+    ) -> Dict[str, Any]:
+        """Extract feedback and verify the relationship in one OpenAI request.
         
-        Uses GPT-4 to analyze transcript and check if the reference's
-        statements are consistent with the claimed relationship and dates.
+        Sends the transcript once for both analyses. If the request fails,
+        no feedback is extracted and the relationship is treated as verified
+        (benefit of doubt).
         
         Args:
             transcript_text: Full transcript of the reference call
+            candidate_name: Name of the candidate
+            reference_name: Name of the reference
             claimed_relationship: Claimed relationship (manager/coworker/supervisor)
             claimed_employment_dates: Optional dict with start_date and end_date
             
         Returns:
-            True if relationship appears authentic, False otherwise
+            Dict with 'themes' and 'quotes' lists and 'relationship_verified' bool
         """
-        # If no transcript or no OpenAI key, assume verified (benefit of doubt)
-        if not transcript_text or not self.openai_api_key:
-            logger.warning("Cannot verify relationship - no transcript or OpenAI key")
-            return True
-        
         try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.openai_api_key)
-            
             dates_info = ""
             if claimed_employment_dates:
                 dates_info = f"\nClaimed employment dates: {claimed_employment_dates.get('start_date')} to {claimed_employment_dates.get('end_date')}"
             
-            prompt = f"""Analyze this reference call transcript to verify the authenticity of the relationship.
-
-Claimed relationship: {claimed_relationship}{dates_info}
+            prompt = _ANALYSIS_PROMPT_TEMPLATE.format_map({
+                'candidate_name': candidate_name,
+                'reference_name': reference_name,
+                'claimed_relationship': claimed_relationship,
+                'dates_info': dates_info,
+                'transcript_text': transcript_text
+            })
 
-Transcript:
-{transcript_text}
-
-Determine if:
-1. The reference demonstrates knowledge consistent with the claimed relationship
-2. The reference's statements align with the claimed employment timeline
-3. The reference provides specific, credible details (not vague or generic)
-
-Respond in JSON format:
-{{
-    "verified": true/false,
-    "confidence": "high/medium/low",
-    "reasoning": "brief explanation"
-}}"""
-
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at detecting fraudulent references and verifying relationship authenticity."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                response_format={"type": "json_object"}
+            result = _complete_json(
+                self.openai_api_key,
+                self.analysis_model,
+                _ANALYSIS_SYSTEM_PROMPT,
+                prompt,
+                0.2,
+                self.ANALYSIS_MAX_TOKENS
             )
-            
-            result = json.loads(response.choices[0].message.content)
             verified = result.get("verified", True)
             confidence = result.get("confidence", "medium")
             
@@ -519,12 +593,15 @@ Respond in JSON format:
                 f"Relationship verification: {verified} (confidence: {confidence})"
             )
             
-            return verified
+            return {
+                "themes": list(result.get("themes", [])),
+                "quotes": list(result.get("quotes", [])),
+                "relationship_verified": verified
+            }
             
         except Exception as e:
-            logger.error(f"Failed to verify relationship: {str(e)}", exc_info=True)
-            # Default to True (benefit of doubt) if verification fails
-            return True
+            logger.error(f"Failed to analyze transcript: {str(e)}", exc_info=True)
+            return {"themes": [], "quotes": [], "relationship_verified": True}
     
     def _create_contact_record(
         self,
@@ -550,28 +627,70 @@ Respond in JSON format:
         Returns:
             ID of the created contact record
         """
+        # One timestamp for the attempt and its response; the columns store
+        # naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        
         try:
             contact_record = ContactRecord(
+                id=str(uuid.uuid4()),
                 verification_session_id=verification_session_id,
                 contact_type="REFERENCE",
                 contact_method=contact_method,
                 contact_name=contact_name,
                 contact_info=contact_info,
-                attempt_timestamp=datetime.utcnow(),
+                attempt_timestamp=now,
                 response_received=response_received,
-                response_timestamp=datetime.utcnow() if response_received else None,
+                response_timestamp=now if response_received else None,
                 response_data=response_data,
                 transcript_url=transcript_url,
                 notes=f"Reference verification via {contact_method.lower()}"
             )
             
-            db.session.add(contact_record)
-            db.session.commit()
+            if self.defer_contact_records:
+                with self._pending_lock:
+                    self._pending_records.setdefault(verification_session_id, []).append(contact_record)
+                logger.info(f"Contact record queued: {contact_record.id}")
+                return contact_record.id
+            
+            with safe_db_ctx() as session:
+                if session is None:
+                    return ""
+                session.add(contact_record)
             
             logger.info(f"Contact record created: {contact_record.id}")
             return contact_record.id
             
         except Exception as e:
             logger.error(f"Failed to create contact record: {str(e)}", exc_info=True)
-            db.session.rollback()
             return ""
+    
+    def flush_contact_records(self, verification_session_id: str) -> int:
+        """Insert a session's queued contact records in a single commit.
+        
+        Only records queued with defer_contact_records enabled are pending;
+        otherwise there is nothing to flush.
+        
+        Args:
+            verification_session_id: ID of the verification session
+            
+        Returns:
+            Number of contact records written
+        """
+        with self._pending_lock:
+            records = self._pending_records.pop(verification_session_id, [])
+        
+        if not records:
+            return 0
+        
+        try:
+            with safe_db_ctx() as session:
+                if session is None:
+                    return 0
+                session.add_all(records)
+        except Exception as e:
+            logger.error(f"Failed to write contact records: {str(e)}", exc_info=True)
+            return 0
+        
+        logger.info(f"Wrote {len(records)} contact records for session {verification_session_id}")
+        return len(records)
@@ -11,25 +11,233 @@ This module synthesizes all verification data into comprehensive reports includi
 
 import os
 import logging
+import functools
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import json
 
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import joinedload, selectinload
+
+# Try to import openai, but make it optional
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
 from src.database.models import (
     db, VerificationSession, VerificationReport, Employment, EducationCredential,
     FraudFlag, ContactRecord, GitHubAnalysisRecord, RiskScore,
     EmploymentVerificationStatus, EducationVerificationStatus
 )
+from src.utils.json_serializer import dumps_compact
 
 logger = logging.getLogger(__name__)
 
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE ... RETURNING
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+# Static instructions go in the system message and the per-candidate data
+# last, so requests share an identical prefix for OpenAI prompt caching
+_EMPLOYMENT_NARRATIVE_SYSTEM_PROMPT = """You are an expert at writing professional employment verification narratives for hiring reports.
+
+Create a concise, professional narrative for the employment period in the CANDIDATE_DATA block.
+
+Write a 2-3 sentence narrative that:
+1. States the verification status clearly
+2. Incorporates relevant reference quotes if available
+3. Highlights any concerns or positive findings
+4. Uses professional, objective language
+
+Do not use JSON format. Write plain text only."""
+
+_EMPLOYMENT_NARRATIVES_SYSTEM_PROMPT = """You are an expert at writing professional employment verification narratives for hiring reports.
+
+Create a concise, professional narrative for each employment period in the CANDIDATE_DATA block.
+
+For each period, write a 2-3 sentence narrative that:
+1. States the verification status clearly
+2. Incorporates relevant reference quotes if available
+3. Highlights any concerns or positive findings
+4. Uses professional, objective language
+
+Respond in JSON format, with one entry per period and "i" matching its index:
+{
+    "narratives": [{"i": 0, "text": "narrative"}, ...]
+}"""
+
+_TECHNICAL_NARRATIVE_SYSTEM_PROMPT = """You are an expert at analyzing technical profiles and writing professional assessment narratives.
+
+Create a concise technical validation narrative for the GitHub profile in the CANDIDATE_DATA block.
+
+Write a 2-3 sentence narrative that:
+1. Summarizes the GitHub activity level
+2. Compares claimed skills against actual code contributions
+3. Mentions the code quality assessment
+4. Uses professional, objective language
+
+Do not use JSON format. Write plain text only."""
+
+# Structured output schema for interview questions; models without structured
+# output support reject requests that use it
+_QUESTIONS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "questions",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "questions": {
+                    "type": "array",
+                    "minItems": 5,
+                    "maxItems": 10,
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["questions"],
+            "additionalProperties": False
+        }
+    }
+}
+
+_QUESTIONS_SYSTEM_PROMPT = """You are an expert at creating behavioral interview questions based on background verification findings.
+
+Generate 5-10 targeted interview questions for the candidate whose verification findings are in the CANDIDATE_DATA block.
+
+Generate questions that:
+1. Probe any red flags or concerns
+2. Follow up on reference feedback themes
+3. Validate technical claims if applicable
+4. Explore employment gaps or transitions
+5. Are open-ended and behavioral
+6. Are professional and non-accusatory
+
+Respond in JSON format:
+{
+    "questions": ["question1", "question2", ...]
+}
+
+Generate 5-10 questions total."""
+
+
+@functools.lru_cache(maxsize=8)
+def _openai_client(api_key: str):
+    """Get the process-wide OpenAI client for an API key.
+    
+    Every report call shares the client's connection pool instead of opening
+    a new TLS connection per request.
+    """
+    return openai.OpenAI(api_key=api_key, max_retries=3, timeout=60.0)
+
+
+# Chat completions get this many attempts, with exponential backoff and full
+# jitter between them, before callers fall back to template text
+_COMPLETION_MAX_ATTEMPTS = 3
+_COMPLETION_BACKOFF_BASE_SECONDS = 1.0
+_COMPLETION_BACKOFF_MAX_SECONDS = 10.0
+
+
+def _create_completion(api_key: str, request: Dict[str, Any]):
+    """Create a chat completion, retrying rate limits, timeouts and server errors.
+    
+    Retries happen here instead of in the SDK so that each one is logged.
+    
+    Args:
+        api_key: OpenAI API key
+        request: Keyword arguments for chat.completions.create
+    
+    Returns:
+        Chat completion response
+    """
+    client = _openai_client(api_key).with_options(max_retries=0)
+    for attempt in range(1, _COMPLETION_MAX_ATTEMPTS + 1):
+        try:
+            return client.chat.completions.create(**request)
+        except (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError) as e:
+            if attempt == _COMPLETION_MAX_ATTEMPTS:
+                raise
+            
+            delay = random.uniform(0, min(
+                _COMPLETION_BACKOFF_MAX_SECONDS,
+                _COMPLETION_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+            ))
+            logger.warning(
+                f"Chat completion attempt {attempt} of {_COMPLETION_MAX_ATTEMPTS} failed: {str(e)}, "
+                f"retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=2048)
+def _employment_template(
+    status: str,
+    company: str,
+    title: str,
+    start_date: str,
+    end_date: str,
+    first_quote: Optional[str]
+) -> str:
+    """Format the template employment narrative; periods recur across report regenerations"""
+    if status == 'VERIFIED':
+        narrative = f"Employment at {company} as {title} from {start_date} to {end_date} has been verified."
+    elif status == 'UNVERIFIED':
+        narrative = f"Employment at {company} as {title} from {start_date} to {end_date} could not be verified."
+    elif status == 'CONFLICTED':
+        narrative = f"Employment at {company} as {title} from {start_date} to {end_date} shows conflicting information."
+    else:
+        narrative = f"Employment at {company} as {title} from {start_date} to {end_date} is pending verification."
+    
+    if first_quote:
+        narrative += f" References provided feedback: \"{first_quote}\""
+    
+    return narrative
+
+
+@functools.lru_cache(maxsize=1)
+def _report_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor that runs a report's OpenAI calls side by side.
+    
+    Only the API calls run here; database access stays on the caller's thread.
+    """
+    return ThreadPoolExecutor(max_workers=6, thread_name_prefix="report-generation")
+
 
 class NarrativeSynthesizer:
-    """Uses GPT-4 to create human-readable summaries from verification data"""
+    """Uses an OpenAI chat model to create human-readable summaries from verification data"""
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize NarrativeSynthesizer with OpenAI API key"""
+    DEFAULT_MODEL = "gpt-4o-mini"
+    
+    # Without notes or quotes, the template says all there is to say about these
+    TEMPLATE_ONLY_STATUSES = frozenset({'VERIFIED', 'PENDING'})
+    
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        force_llm: bool = False
+    ):
+        """
+        Initialize NarrativeSynthesizer with OpenAI API key
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Chat model for narratives (defaults to REPORT_MODEL, then gpt-4o-mini)
+            force_llm: Ask the model even when the template narrative would say
+                the same, e.g. to compare the two
+        """
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
+        self.model = model or os.getenv('REPORT_MODEL') or self.DEFAULT_MODEL
+        self.force_llm = force_llm
         
         if not self.openai_api_key:
             logger.warning("OpenAI API key not provided - narrative synthesis will be limited")
@@ -37,26 +245,19 @@ class NarrativeSynthesizer:
     def synthesize_employment_narrative(
         self,
         employment: Employment,
-        contact_records: List[ContactRecord]
+        reference_quotes: List[str]
     ) -> str:
         """
         Generate narrative for a single employment period
         
         Args:
             employment: Employment record
-            contact_records: List of contact records for this employment
+            reference_quotes: Reference quotes from extract_reference_quotes
             
         Returns:
             Human-readable narrative string
         """
-        # Extract reference quotes from contact records
-        reference_quotes = []
-        for record in contact_records:
-            if record.contact_type == 'REFERENCE' and record.response_received:
-                if record.response_data and 'quotes' in record.response_data:
-                    reference_quotes.extend(record.response_data['quotes'])
-        
-        # Build context for GPT-4
+        # Build context for the model
         context = {
             'company': employment.company_name,
             'title': employment.job_title,
@@ -67,17 +268,12 @@ class NarrativeSynthesizer:
             'reference_quotes': reference_quotes
         }
         
-        if not self.openai_api_key:
+        if not self.openai_api_key or not OPENAI_AVAILABLE or self._template_suffices(context):
             # Fallback to template-based narrative
             return self._template_employment_narrative(context)
         
         try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.openai_api_key)
-            
-            prompt = f"""Create a concise, professional narrative for this employment period:
-
+            prompt = f"""<CANDIDATE_DATA>
 Company: {context['company']}
 Title: {context['title']}
 Period: {context['start_date']} to {context['end_date']}
@@ -86,24 +282,17 @@ Notes: {context['verification_notes']}
 
 Reference Quotes:
 {chr(10).join(f'- "{quote}"' for quote in reference_quotes) if reference_quotes else 'No reference quotes available'}
+</CANDIDATE_DATA>"""
 
-Write a 2-3 sentence narrative that:
-1. States the verification status clearly
-2. Incorporates relevant reference quotes if available
-3. Highlights any concerns or positive findings
-4. Uses professional, objective language
-
-Do not use JSON format. Write plain text only."""
-
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at writing professional employment verification narratives for hiring reports."},
+            response = _create_completion(self.openai_api_key, {
+                'model': self.model,
+                'messages': [
+                    {"role": "system", "content": _EMPLOYMENT_NARRATIVE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3,
-                max_tokens=200
-            )
+                'temperature': 0.3,
+                'max_tokens': 200
+            })
             
             narrative = response.choices[0].message.content.strip()
             return narrative
@@ -112,23 +301,185 @@ Do not use JSON format. Write plain text only."""
             logger.error(f"Failed to synthesize employment narrative: {str(e)}", exc_info=True)
             return self._template_employment_narrative(context)
     
-    def _template_employment_narrative(self, context: Dict[str, Any]) -> str:
-        """Fallback template-based employment narrative"""
-        status = context['verification_status']
-        
-        if status == 'VERIFIED':
-            narrative = f"Employment at {context['company']} as {context['title']} from {context['start_date']} to {context['end_date']} has been verified."
-        elif status == 'UNVERIFIED':
-            narrative = f"Employment at {context['company']} as {context['title']} from {context['start_date']} to {context['end_date']} could not be verified."
-        elif status == 'CONFLICTED':
-            narrative = f"Employment at {context['company']} as {context['title']} from {context['start_date']} to {context['end_date']} shows conflicting information."
-        else:
-            narrative = f"Employment at {context['company']} as {context['title']} from {context['start_date']} to {context['end_date']} is pending verification."
+    def synthesize_employment_narratives_batch(
+        self,
+        employments: List[Employment],
+        reference_quotes: List[str]
+    ) -> List[str]:
+        """
+        Generate narratives for several employment periods in one request
+        
+        Args:
+            employments: Employment records
+            reference_quotes: Reference quotes from extract_reference_quotes
+            
+        Returns:
+            Narrative strings in the same order as employments; any period the
+            response leaves out gets the template narrative
+        """
+        if not employments or not self.openai_api_key or not OPENAI_AVAILABLE:
+            # Fallback to template-based narratives
+            return self.parse_employment_narratives(None, employments, reference_quotes)
         
-        if context['reference_quotes']:
-            narrative += f" References provided feedback: \"{context['reference_quotes'][0]}\""
+        request = self.employment_narratives_request(employments, reference_quotes)
+        if request is None:
+            return self.parse_employment_narratives(None, employments, reference_quotes)
         
-        return narrative
+        try:
+            response = _create_completion(self.openai_api_key, request)
+            content = response.choices[0].message.content
+            
+        except Exception as e:
+            logger.error(f"Failed to synthesize employment narratives: {str(e)}", exc_info=True)
+            content = None
+        
+        return self.parse_employment_narratives(content, employments, reference_quotes)
+    
+    def employment_narratives_request(
+        self,
+        employments: List[Employment],
+        reference_quotes: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the chat completion request behind synthesize_employment_narratives_batch
+        
+        Periods the template narrative covers are left out of the request.
+        
+        Args:
+            employments: Employment records
+            reference_quotes: Reference quotes from extract_reference_quotes
+            
+        Returns:
+            Keyword arguments for chat.completions.create, also usable as a
+            Batch API request body, or None if every period can use the template
+        """
+        contexts = self._employment_contexts(employments, reference_quotes)
+        
+        periods = [
+            {
+                'i': i,
+                'company': context['company'],
+                'title': context['title'],
+                'period': f"{context['start_date']} to {context['end_date']}",
+                'verification_status': context['verification_status'],
+                'notes': context['verification_notes']
+            }
+            for i, context in enumerate(contexts)
+            if not self._template_suffices(context)
+        ]
+        if not periods:
+            return None
+        
+        prompt = f"""<CANDIDATE_DATA>
+Employment Periods:
+{dumps_compact(periods)}
+
+Reference Quotes:
+{chr(10).join(f'- "{quote}"' for quote in reference_quotes) if reference_quotes else 'No reference quotes available'}
+</CANDIDATE_DATA>"""
+
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": _EMPLOYMENT_NARRATIVES_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.3,
+            'max_tokens': 200 * len(periods),
+            'response_format': {"type": "json_object"}
+        }
+    
+    def parse_employment_narratives(
+        self,
+        content: Optional[str],
+        employments: List[Employment],
+        reference_quotes: List[str]
+    ) -> List[str]:
+        """
+        Read narratives out of a response to employment_narratives_request
+        
+        Args:
+            content: Message content of the response, or None if there is none
+            employments: Employment records the request was built from
+            reference_quotes: Reference quotes the request was built from
+            
+        Returns:
+            Narrative strings in the same order as employments, with template
+            narratives for any period the response leaves out
+        """
+        contexts = self._employment_contexts(employments, reference_quotes)
+        
+        narratives_by_index = {}
+        if content:
+            try:
+                result = json.loads(content)
+                for item in result.get('narratives', []):
+                    if isinstance(item, dict) and isinstance(item.get('text'), str) and item['text'].strip():
+                        narratives_by_index[item.get('i')] = item['text'].strip()
+            except (ValueError, AttributeError) as e:
+                logger.error(f"Failed to parse employment narratives: {str(e)}")
+        
+        return [
+            narratives_by_index.get(i) or self._template_employment_narrative(context)
+            for i, context in enumerate(contexts)
+        ]
+    
+    @staticmethod
+    def extract_reference_quotes(contact_records: List[ContactRecord]) -> List[str]:
+        """
+        Collect the quotes from answered reference contact records
+        
+        Args:
+            contact_records: Contact records of a verification session
+            
+        Returns:
+            Reference quotes in contact record order
+        """
+        reference_quotes = []
+        for record in contact_records:
+            if record.contact_type == 'REFERENCE' and record.response_received:
+                if record.response_data and 'quotes' in record.response_data:
+                    reference_quotes.extend(record.response_data['quotes'])
+        return reference_quotes
+    
+    def _template_suffices(self, context: Dict[str, Any]) -> bool:
+        """Check whether the template narrative says all a model would for an employment context"""
+        return (
+            not self.force_llm
+            and not context['reference_quotes']
+            and not context['verification_notes']
+            and context['verification_status'] in self.TEMPLATE_ONLY_STATUSES
+        )
+    
+    def _employment_contexts(
+        self,
+        employments: List[Employment],
+        reference_quotes: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Build the narrative context for each employment period"""
+        return [
+            {
+                'company': employment.company_name,
+                'title': employment.job_title,
+                'start_date': employment.start_date.strftime('%B %Y'),
+                'end_date': employment.end_date.strftime('%B %Y') if employment.end_date else 'Present',
+                'verification_status': employment.verification_status.value,
+                'verification_notes': employment.verification_notes or '',
+                'reference_quotes': reference_quotes
+            }
+            for employment in employments
+        ]
+    
+    def _template_employment_narrative(self, context: Dict[str, Any]) -> str:
+        """Fallback template-based employment narrative"""
+        return _employment_template(
+            context['verification_status'],
+            context['company'],
+            context['title'],
+            context['start_date'],
+            context['end_date'],
+            context['reference_quotes'][0] if context['reference_quotes'] else None
+        )
     
     def synthesize_technical_narrative(
         self,
@@ -148,59 +499,102 @@ Do not use JSON format. Write plain text only."""
         if not github_analysis or not github_analysis.profile_found:
             return "No GitHub profile found to validate technical claims."
         
-        context = {
-            'username': github_analysis.username,
-            'total_repos': github_analysis.total_repos,
-            'owned_repos': github_analysis.owned_repos,
-            'total_commits': github_analysis.total_commits,
-            'commit_frequency': github_analysis.commit_frequency,
-            'languages': list(github_analysis.languages.keys()) if github_analysis.languages else [],
-            'code_quality_score': github_analysis.code_quality_score,
-            'skills_match': github_analysis.skills_match or {},
-            'claimed_skills': claimed_skills
-        }
-        
-        if not self.openai_api_key:
-            return self._template_technical_narrative(context)
+        request = None
+        if self.openai_api_key and OPENAI_AVAILABLE:
+            request = self.technical_narrative_request(github_analysis, claimed_skills)
+        if request is None:
+            return self.parse_technical_narrative(None, github_analysis, claimed_skills)
         
         try:
-            import openai
+            response = _create_completion(self.openai_api_key, request)
+            content = response.choices[0].message.content
             
-            client = openai.OpenAI(api_key=self.openai_api_key)
+        except Exception as e:
+            logger.error(f"Failed to synthesize technical narrative: {str(e)}", exc_info=True)
+            content = None
+        
+        return self.parse_technical_narrative(content, github_analysis, claimed_skills)
+    
+    def technical_narrative_request(
+        self,
+        github_analysis: GitHubAnalysisRecord,
+        claimed_skills: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the chat completion request behind synthesize_technical_narrative
+        
+        Args:
+            github_analysis: GitHubAnalysisRecord with a profile found
+            claimed_skills: List of claimed technical skills
             
-            prompt = f"""Create a concise technical validation narrative:
-
+        Returns:
+            Keyword arguments for chat.completions.create, also usable as a
+            Batch API request body, or None if the template narrative covers
+            an analysis with no quality score or skills comparison
+        """
+        context = self._technical_context(github_analysis, claimed_skills)
+        if not self.force_llm and not context['code_quality_score'] and not context['skills_match']:
+            return None
+        
+        prompt = f"""<CANDIDATE_DATA>
 GitHub Username: {context['username']}
 Repositories: {context['total_repos']} total, {context['owned_repos']} owned
 Commits: {context['total_commits']} total ({context['commit_frequency']} per month)
 Languages: {', '.join(context['languages'])}
 Code Quality Score: {context['code_quality_score']}/10
 Claimed Skills: {', '.join(claimed_skills) if claimed_skills else 'Not specified'}
+</CANDIDATE_DATA>"""
 
-Write a 2-3 sentence narrative that:
-1. Summarizes the GitHub activity level
-2. Compares claimed skills against actual code contributions
-3. Mentions the code quality assessment
-4. Uses professional, objective language
-
-Do not use JSON format. Write plain text only."""
-
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at analyzing technical profiles and writing professional assessment narratives."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=200
-            )
-            
-            narrative = response.choices[0].message.content.strip()
-            return narrative
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": _TECHNICAL_NARRATIVE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.3,
+            'max_tokens': 200
+        }
+    
+    def parse_technical_narrative(
+        self,
+        content: Optional[str],
+        github_analysis: GitHubAnalysisRecord,
+        claimed_skills: List[str]
+    ) -> str:
+        """
+        Read the narrative out of a response to technical_narrative_request
+        
+        Args:
+            content: Message content of the response, or None if there is none
+            github_analysis: GitHubAnalysisRecord the request was built from
+            claimed_skills: Claimed skills the request was built from
             
-        except Exception as e:
-            logger.error(f"Failed to synthesize technical narrative: {str(e)}", exc_info=True)
-            return self._template_technical_narrative(context)
+        Returns:
+            Narrative string, or the template narrative if content is empty
+        """
+        if content and content.strip():
+            return content.strip()
+        return self._template_technical_narrative(
+            self._technical_context(github_analysis, claimed_skills)
+        )
+    
+    def _technical_context(
+        self,
+        github_analysis: GitHubAnalysisRecord,
+        claimed_skills: List[str]
+    ) -> Dict[str, Any]:
+        """Build the narrative context for a GitHub analysis"""
+        return {
+            'username': github_analysis.username,
+            'total_repos': github_analysis.total_repos,
+            'owned_repos': github_analysis.owned_repos,
+            'total_commits': github_analysis.total_commits,
+            'commit_frequency': github_analysis.commit_frequency,
+            'languages': list(github_analysis.languages.keys()) if github_analysis.languages else [],
+            'code_quality_score': github_analysis.code_quality_score,
+            'skills_match': github_analysis.skills_match or {},
+            'claimed_skills': claimed_skills
+        }
     
     def _template_technical_narrative(self, context: Dict[str, Any]) -> str:
         """Fallback template-based technical narrative"""
@@ -233,27 +627,30 @@ Do not use JSON format. Write plain text only."""
         if not fraud_flags:
             return "No red flags identified during verification."
         
-        # Group by severity
-        critical = [f for f in fraud_flags if f.severity.value == 'CRITICAL']
-        moderate = [f for f in fraud_flags if f.severity.value == 'MODERATE']
-        minor = [f for f in fraud_flags if f.severity.value == 'MINOR']
+        # Count by severity and keep the first flag of each in one pass
+        counts = Counter()
+        first = {}
+        for flag in fraud_flags:
+            severity = flag.severity.value
+            counts[severity] += 1
+            first.setdefault(severity, flag)
         
         summary_parts = []
         
-        if critical:
-            summary_parts.append(f"{len(critical)} critical issue(s)")
-        if moderate:
-            summary_parts.append(f"{len(moderate)} moderate concern(s)")
-        if minor:
-            summary_parts.append(f"{len(minor)} minor flag(s)")
+        if counts['CRITICAL']:
+            summary_parts.append(f"{counts['CRITICAL']} critical issue(s)")
+        if counts['MODERATE']:
+            summary_parts.append(f"{counts['MODERATE']} moderate concern(s)")
+        if counts['MINOR']:
+            summary_parts.append(f"{counts['MINOR']} minor flag(s)")
         
         summary = f"Identified {', '.join(summary_parts)} during verification."
         
         # Add top issues
-        if critical:
-            summary += f" Critical: {critical[0].description}"
-        elif moderate:
-            summary += f" Primary concern: {moderate[0].description}"
+        if 'CRITICAL' in first:
+            summary += f" Critical: {first['CRITICAL'].description}"
+        elif 'MODERATE' in first:
+            summary += f" Primary concern: {first['MODERATE'].description}"
         
         return summary
 
@@ -261,9 +658,27 @@ Do not use JSON format. Write plain text only."""
 class InterviewQuestionGenerator:
     """Generates targeted interview questions based on verification findings"""
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize InterviewQuestionGenerator with OpenAI API key"""
+    DEFAULT_MODEL = "gpt-4o-mini"
+    DEFAULT_PREMIUM_MODEL = "gpt-4o"
+    
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        premium_model: Optional[str] = None
+    ):
+        """
+        Initialize InterviewQuestionGenerator with OpenAI API key
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Chat model for questions (defaults to REPORT_MODEL, then gpt-4o-mini)
+            premium_model: Chat model used instead when a fraud flag is CRITICAL
+                (defaults to REPORT_PREMIUM_MODEL, then gpt-4o)
+        """
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
+        self.model = model or os.getenv('REPORT_MODEL') or self.DEFAULT_MODEL
+        self.premium_model = premium_model or os.getenv('REPORT_PREMIUM_MODEL') or self.DEFAULT_PREMIUM_MODEL
         
         if not self.openai_api_key:
             logger.warning("OpenAI API key not provided - question generation will be limited")
@@ -287,99 +702,136 @@ class InterviewQuestionGenerator:
         Returns:
             List of interview question strings
         """
-        if not self.openai_api_key:
+        if not self.openai_api_key or not OPENAI_AVAILABLE:
             return self._template_questions(employments, fraud_flags)
         
         try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.openai_api_key)
-            
-            # Build context
-            employment_summary = []
-            for emp in employments:
-                employment_summary.append({
-                    'company': emp.company_name,
-                    'title': emp.job_title,
-                    'status': emp.verification_status.value
-                })
-            
-            flag_summary = [
-                {
-                    'type': flag.flag_type.value,
-                    'severity': flag.severity.value,
-                    'description': flag.description
-                }
-                for flag in fraud_flags
-            ]
+            response = _create_completion(
+                self.openai_api_key,
+                self.questions_request(employments, fraud_flags, contact_records, github_analysis)
+            )
             
-            # Extract reference themes
-            reference_themes = []
-            for record in contact_records:
-                if record.contact_type == 'REFERENCE' and record.response_data:
-                    themes = record.response_data.get('themes', [])
-                    reference_themes.extend(themes)
-            
-            github_summary = None
-            if github_analysis and github_analysis.profile_found:
-                github_summary = {
-                    'code_quality_score': github_analysis.code_quality_score,
-                    'total_commits': github_analysis.total_commits,
-                    'mismatches': github_analysis.mismatches or []
-                }
+            return self.parse_questions(response.choices[0].message.content, employments, fraud_flags)
             
-            prompt = f"""Generate 5-10 targeted interview questions for a candidate based on verification findings.
-
+        except Exception as e:
+            logger.error(f"Failed to generate interview questions: {str(e)}", exc_info=True)
+            return self._template_questions(employments, fraud_flags)
+    
+    def questions_request(
+        self,
+        employments: List[Employment],
+        fraud_flags: List[FraudFlag],
+        contact_records: List[ContactRecord],
+        github_analysis: Optional[GitHubAnalysisRecord]
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completion request behind generate_questions
+        
+        Args:
+            employments: List of Employment records
+            fraud_flags: List of FraudFlag records
+            contact_records: List of ContactRecord records
+            github_analysis: Optional GitHubAnalysisRecord
+            
+        Returns:
+            Keyword arguments for chat.completions.create, also usable as a
+            Batch API request body
+        """
+        # Build context
+        employment_summary = []
+        for emp in employments:
+            employment_summary.append({
+                'company': emp.company_name,
+                'title': emp.job_title,
+                'status': emp.verification_status.value
+            })
+        
+        flag_summary = [
+            {
+                'type': flag.flag_type.value,
+                'severity': flag.severity.value,
+                'description': flag.description
+            }
+            for flag in fraud_flags
+        ]
+        
+        # Extract reference themes
+        reference_themes = []
+        for record in contact_records:
+            if record.contact_type == 'REFERENCE' and record.response_data:
+                themes = record.response_data.get('themes', [])
+                reference_themes.extend(themes)
+        
+        github_summary = None
+        if github_analysis and github_analysis.profile_found:
+            github_summary = {
+                'code_quality_score': github_analysis.code_quality_score,
+                'total_commits': github_analysis.total_commits,
+                'mismatches': github_analysis.mismatches or []
+            }
+        
+        prompt = f"""<CANDIDATE_DATA>
 Employment History:
-{json.dumps(employment_summary, indent=2)}
+{dumps_compact(employment_summary)}
 
 Red Flags:
-{json.dumps(flag_summary, indent=2) if flag_summary else 'None'}
+{dumps_compact(flag_summary) if flag_summary else 'None'}
 
 Reference Themes:
-{json.dumps(reference_themes, indent=2) if reference_themes else 'None'}
+{dumps_compact(reference_themes) if reference_themes else 'None'}
 
 GitHub Analysis:
-{json.dumps(github_summary, indent=2) if github_summary else 'Not available'}
+{dumps_compact(github_summary) if github_summary else 'Not available'}
+</CANDIDATE_DATA>"""
 
-Generate questions that:
-1. Probe any red flags or concerns
-2. Follow up on reference feedback themes
-3. Validate technical claims if applicable
-4. Explore employment gaps or transitions
-5. Are open-ended and behavioral
-6. Are professional and non-accusatory
-
-Respond in JSON format:
-{{
-    "questions": ["question1", "question2", ...]
-}}
-
-Generate 5-10 questions total."""
-
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at creating behavioral interview questions based on background verification findings."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.4,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            questions = result.get('questions', [])
-            
-            # Ensure we have 5-10 questions
-            if len(questions) < 5:
-                questions.extend(self._template_questions(employments, fraud_flags))
-                questions = questions[:10]
-            
-            return questions[:10]
+        return {
+            'model': self._questions_model(fraud_flags),
+            'messages': [
+                {"role": "system", "content": _QUESTIONS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.4,
+            'max_tokens': 500,
+            'response_format': _QUESTIONS_RESPONSE_FORMAT
+        }
+    
+    def parse_questions(
+        self,
+        content: Optional[str],
+        employments: List[Employment],
+        fraud_flags: List[FraudFlag]
+    ) -> List[str]:
+        """
+        Read questions out of a response to questions_request
+        
+        Args:
+            content: Message content of the response, or None if there is none
+            employments: Employment records the request was built from
+            fraud_flags: Fraud flags the request was built from
             
-        except Exception as e:
-            logger.error(f"Failed to generate interview questions: {str(e)}", exc_info=True)
-            return self._template_questions(employments, fraud_flags)
+        Returns:
+            List of 5-10 interview question strings, topped up from the
+            template questions when the response has too few
+        """
+        questions = []
+        if content:
+            try:
+                questions = json.loads(content).get('questions', [])
+            except (ValueError, AttributeError) as e:
+                logger.error(f"Failed to parse interview questions: {str(e)}")
+        
+        # Ensure we have 5-10 questions
+        if len(questions) < 5:
+            questions.extend(self._template_questions(employments, fraud_flags))
+            questions = questions[:10]
+        
+        return questions[:10]
+    
+    def _questions_model(self, fraud_flags: List[FraudFlag]) -> str:
+        """Pick the premium model when any flag is critical, the regular model otherwise"""
+        if any(flag.severity.value == 'CRITICAL' for flag in fraud_flags):
+            return self.premium_model
+        return self.model
     
     def _template_questions(
         self,
@@ -419,11 +871,33 @@ Generate 5-10 questions total."""
 class ReportGenerator:
     """Main coordinator for generating comprehensive verification reports"""
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize ReportGenerator"""
+    # Batch API jobs finish within this window at a discount to real-time calls
+    BATCH_COMPLETION_WINDOW = "24h"
+    
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        use_batch_api: bool = False,
+        model: Optional[str] = None,
+        premium_model: Optional[str] = None
+    ):
+        """
+        Initialize ReportGenerator
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            use_batch_api: Submit the report's OpenAI requests as a batch
+                instead of calling them directly. The report is stored with
+                template text first and finalize_report fills in the batch output.
+            model: Chat model for narratives and questions (defaults to
+                REPORT_MODEL, then gpt-4o-mini)
+            premium_model: Chat model for interview questions when a fraud flag
+                is CRITICAL (defaults to REPORT_PREMIUM_MODEL, then gpt-4o)
+        """
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
-        self.narrative_synthesizer = NarrativeSynthesizer(self.openai_api_key)
-        self.question_generator = InterviewQuestionGenerator(self.openai_api_key)
+        self.use_batch_api = use_batch_api
+        self.narrative_synthesizer = NarrativeSynthesizer(self.openai_api_key, model)
+        self.question_generator = InterviewQuestionGenerator(self.openai_api_key, model, premium_model)
         
         logger.info("ReportGenerator initialized")
     
@@ -440,7 +914,7 @@ class ReportGenerator:
         logger.info(f"Starting report generation for session {verification_session_id}")
         
         # Load verification session
-        session = db.session.get(VerificationSession, verification_session_id)
+        session = self._load_session(verification_session_id)
         if not session:
             logger.error(f"Verification session {verification_session_id} not found")
             return {
@@ -449,27 +923,61 @@ class ReportGenerator:
             }
         
         try:
-            # Generate employment narratives
-            employment_narratives = self._generate_employment_narratives(session)
+            # Everything the report reads was loaded with the session; the OpenAI
+            # calls below run concurrently over those records
+            employments = session.employments
+            contact_records = session.contact_records
+            fraud_flags = session.fraud_flags
+            github_analysis = session.github_analysis
+            
+            # Quotes are not tied to an employment, so one scan serves every period
+            reference_quotes = self.narrative_synthesizer.extract_reference_quotes(contact_records)
             
             # Generate education summary
             education_summary = self._generate_education_summary(session)
             
-            # Generate technical validation narrative
-            technical_validation = self._generate_technical_validation(session)
-            
             # Generate red flags summary
             red_flags_summary = self.narrative_synthesizer.synthesize_red_flags_summary(
-                session.fraud_flags
+                fraud_flags
             )
             
-            # Generate interview questions
-            interview_questions = self.question_generator.generate_questions(
-                employments=session.employments,
-                fraud_flags=session.fraud_flags,
-                contact_records=session.contact_records,
-                github_analysis=session.github_analysis
-            )
+            batch_id = None
+            if self.use_batch_api and self.openai_api_key and OPENAI_AVAILABLE:
+                # Store template text now; finalize_report swaps in the batch output
+                batch_id = self._submit_report_batch(session, github_analysis, reference_quotes)
+                employment_narratives = self._generate_employment_narratives(
+                    session,
+                    reference_quotes,
+                    self.narrative_synthesizer.parse_employment_narratives(
+                        None, employments, reference_quotes
+                    )
+                )
+                technical_validation = self._generate_technical_validation(
+                    github_analysis,
+                    self._technical_narrative_from(None, github_analysis)
+                )
+                interview_questions = self.question_generator.parse_questions(
+                    None, employments, fraud_flags
+                )
+            else:
+                # Employment narratives, technical narrative and interview questions
+                # are independent requests
+                executor = _report_executor()
+                employment_future = executor.submit(
+                    self._generate_employment_narratives, session, reference_quotes
+                )
+                technical_future = executor.submit(self._generate_technical_validation, github_analysis)
+                questions_future = executor.submit(
+                    self.question_generator.generate_questions,
+                    employments=employments,
+                    fraud_flags=fraud_flags,
+                    contact_records=contact_records,
+                    github_analysis=github_analysis
+                )
+                
+                employment_narratives = employment_future.result()
+                technical_validation = technical_future.result()
+                interview_questions = questions_future.result()
             
             # Generate overall summary narrative
             summary_narrative = self._generate_summary_narrative(
@@ -502,81 +1010,307 @@ class ReportGenerator:
                 'interview_questions': interview_questions,
                 'generated_at': datetime.utcnow().isoformat()
             }
+            if batch_id:
+                report_data['batch_id'] = batch_id
             
             # Store report in database
-            report = VerificationReport.query.filter_by(
-                verification_session_id=verification_session_id
-            ).first()
+            risk_score = session.risk_score or RiskScore.YELLOW
+            report_id = self._save_report(verification_session_id, {
+                'risk_score': risk_score,
+                'summary_narrative': summary_narrative,
+                'employment_narratives': employment_narratives,
+                'education_summary': education_summary,
+                'technical_validation': technical_validation,
+                'interview_questions': interview_questions,
+                'report_data': report_data,
+                'generated_at': datetime.utcnow()
+            })
             
+            db.session.commit()
+            
+            logger.info(f"Report generated successfully for session {verification_session_id}")
+            
+            return {
+                'success': True,
+                'verification_session_id': verification_session_id,
+                'report_id': report_id,
+                'risk_score': risk_score.value,
+                'report_data': report_data
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to generate report: {str(e)}", exc_info=True)
+            db.session.rollback()
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def finalize_report(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Fill a batch-generated report in with the output of its OpenAI batch
+        
+        Args:
+            batch_id: Batch ID stored in the report's report_data
+            
+        Returns:
+            Dictionary with the finalization results; 'status' is the batch
+            status when the batch has not completed yet
+        """
+        try:
+            client = _openai_client(self.openai_api_key)
+            
+            batch = client.batches.retrieve(batch_id)
+            if batch.status != 'completed':
+                return {
+                    'success': False,
+                    'batch_id': batch_id,
+                    'status': batch.status
+                }
+            
+            # Collect message content by custom_id; failed requests keep their template text
+            outputs = {}
+            output_lines = client.files.content(batch.output_file_id).text.splitlines() if batch.output_file_id else []
+            for line in output_lines:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get('response') or {}
+                if response.get('status_code') == 200:
+                    outputs[item['custom_id']] = response['body']['choices'][0]['message']['content']
+            
+            verification_session_id = batch.metadata['verification_session_id']
+            session = self._load_session(verification_session_id)
+            report = session.verification_report if session else None
             if not report:
-                report = VerificationReport(
-                    verification_session_id=verification_session_id,
-                    risk_score=session.risk_score or RiskScore.YELLOW,
-                    summary_narrative=summary_narrative,
-                    employment_narratives=employment_narratives,
-                    education_summary=education_summary,
-                    technical_validation=technical_validation,
-                    interview_questions=interview_questions,
-                    report_data=report_data
+                return {
+                    'success': False,
+                    'batch_id': batch_id,
+                    'error': 'Verification report not found'
+                }
+            
+            github_analysis = session.github_analysis
+            reference_quotes = self.narrative_synthesizer.extract_reference_quotes(
+                session.contact_records
+            )
+            
+            employment_narratives = self._generate_employment_narratives(
+                session,
+                reference_quotes,
+                self.narrative_synthesizer.parse_employment_narratives(
+                    outputs.get(self._batch_custom_id(session.id, 'employment')),
+                    session.employments,
+                    reference_quotes
                 )
-                db.session.add(report)
-            else:
-                # Update existing report
-                report.risk_score = session.risk_score or RiskScore.YELLOW
-                report.summary_narrative = summary_narrative
-                report.employment_narratives = employment_narratives
-                report.education_summary = education_summary
-                report.technical_validation = technical_validation
-                report.interview_questions = interview_questions
-                report.report_data = report_data
-                report.generated_at = datetime.utcnow()
+            )
+            technical_validation = self._generate_technical_validation(
+                github_analysis,
+                self._technical_narrative_from(
+                    outputs.get(self._batch_custom_id(session.id, 'technical')),
+                    github_analysis
+                )
+            )
+            interview_questions = self.question_generator.parse_questions(
+                outputs.get(self._batch_custom_id(session.id, 'questions')),
+                session.employments,
+                session.fraud_flags
+            )
+            summary_narrative = self._generate_summary_narrative(
+                session,
+                employment_narratives,
+                technical_validation
+            )
+            
+            report_data = dict(report.report_data or {})
+            report_data.pop('batch_id', None)
+            report_data.update({
+                'summary': summary_narrative,
+                'employment_history': employment_narratives,
+                'technical_validation': technical_validation,
+                'interview_questions': interview_questions
+            })
+            
+            report.summary_narrative = summary_narrative
+            report.employment_narratives = employment_narratives
+            report.technical_validation = technical_validation
+            report.interview_questions = interview_questions
+            report.report_data = report_data
+            report.generated_at = datetime.utcnow()
             
             db.session.commit()
             
-            logger.info(f"Report generated successfully for session {verification_session_id}")
+            logger.info(f"Report finalized from batch {batch_id} for session {verification_session_id}")
             
             return {
                 'success': True,
+                'batch_id': batch_id,
                 'verification_session_id': verification_session_id,
                 'report_id': report.id,
-                'risk_score': report.risk_score.value,
                 'report_data': report_data
             }
             
         except Exception as e:
-            logger.error(f"Failed to generate report: {str(e)}", exc_info=True)
+            logger.error(f"Failed to finalize report from batch {batch_id}: {str(e)}", exc_info=True)
             db.session.rollback()
             return {
                 'success': False,
+                'batch_id': batch_id,
                 'error': str(e)
             }
     
+    @staticmethod
+    def _save_report(verification_session_id: str, fields: Dict[str, Any]) -> str:
+        """
+        Insert the session's report, or update it if it already exists
+        
+        On PostgreSQL and SQLite this is a single INSERT ... ON CONFLICT
+        statement keyed on the unique verification_session_id.
+        
+        Args:
+            verification_session_id: ID of the verification session
+            fields: Report column values
+            
+        Returns:
+            ID of the stored report
+        """
+        insert = _UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+        if insert is None:
+            report = VerificationReport.query.filter_by(
+                verification_session_id=verification_session_id
+            ).first()
+            if not report:
+                report = VerificationReport(verification_session_id=verification_session_id)
+                db.session.add(report)
+            for name, value in fields.items():
+                setattr(report, name, value)
+            db.session.flush()
+            return report.id
+        
+        stmt = insert(VerificationReport).values(
+            verification_session_id=verification_session_id,
+            **fields
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['verification_session_id'],
+            set_={name: stmt.excluded[name] for name in fields}
+        ).returning(VerificationReport.id)
+        return db.session.execute(stmt).scalar_one()
+    
+    @staticmethod
+    def _load_session(verification_session_id: str) -> Optional[VerificationSession]:
+        """Load a verification session together with every relationship the report reads"""
+        return db.session.get(
+            VerificationSession,
+            verification_session_id,
+            options=[
+                joinedload(VerificationSession.candidate),
+                selectinload(VerificationSession.employments),
+                selectinload(VerificationSession.education_credentials),
+                selectinload(VerificationSession.fraud_flags),
+                selectinload(VerificationSession.contact_records),
+                selectinload(VerificationSession.github_analysis)
+            ]
+        )
+    
+    def _submit_report_batch(
+        self,
+        session: VerificationSession,
+        github_analysis: Optional[GitHubAnalysisRecord],
+        reference_quotes: List[str]
+    ) -> str:
+        """
+        Submit the report's OpenAI requests as one batch
+        
+        Args:
+            session: Verification session being reported on
+            github_analysis: The session's GitHub analysis, if any
+            reference_quotes: The session's reference quotes
+            
+        Returns:
+            ID of the created batch
+        """
+        client = _openai_client(self.openai_api_key)
+        
+        bodies = {
+            'questions': self.question_generator.questions_request(
+                session.employments,
+                session.fraud_flags,
+                session.contact_records,
+                github_analysis
+            )
+        }
+        if session.employments:
+            bodies['employment'] = self.narrative_synthesizer.employment_narratives_request(
+                session.employments,
+                reference_quotes
+            )
+        if github_analysis and github_analysis.profile_found:
+            bodies['technical'] = self.narrative_synthesizer.technical_narrative_request(
+                github_analysis,
+                []
+            )
+        
+        # Sections the templates cover have no request
+        bodies = {kind: body for kind, body in bodies.items() if body is not None}
+        
+        batch_input = "\n".join(
+            dumps_compact({
+                'custom_id': self._batch_custom_id(session.id, kind),
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': body
+            })
+            for kind, body in bodies.items()
+        )
+        
+        input_file = client.files.create(
+            file=(f"report_{session.id}.jsonl", batch_input.encode('utf-8')),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.BATCH_COMPLETION_WINDOW,
+            metadata={'verification_session_id': session.id}
+        )
+        
+        logger.info(f"Submitted report batch {batch.id} for session {session.id}")
+        return batch.id
+    
+    @staticmethod
+    def _batch_custom_id(verification_session_id: str, kind: str, index: int = 0) -> str:
+        """Build the custom_id that ties a batch request back to its report section"""
+        return f"{verification_session_id}:{kind}:{index}"
+    
+    def _technical_narrative_from(
+        self,
+        content: Optional[str],
+        github_analysis: Optional[GitHubAnalysisRecord]
+    ) -> Optional[str]:
+        """Get the technical narrative for a batch response, or None without an analysis"""
+        if not github_analysis:
+            return None
+        if not github_analysis.profile_found:
+            return self.narrative_synthesizer.synthesize_technical_narrative(github_analysis, [])
+        return self.narrative_synthesizer.parse_technical_narrative(content, github_analysis, [])
+    
     def _generate_employment_narratives(
         self,
-        session: VerificationSession
+        session: VerificationSession,
+        reference_quotes: List[str],
+        narrative_texts: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Generate narratives for all employment periods"""
+        """Generate narratives for all employment periods, unless narrative_texts are given"""
         narratives = []
         
-        for employment in session.employments:
-            # Get contact records for this employment
-            contact_records = [
-                record for record in session.contact_records
-                if record.contact_type in ['HR', 'REFERENCE']
-            ]
-            
-            narrative_text = self.narrative_synthesizer.synthesize_employment_narrative(
-                employment,
-                contact_records
+        if narrative_texts is None:
+            # One request covers every employment period
+            narrative_texts = self.narrative_synthesizer.synthesize_employment_narratives_batch(
+                session.employments,
+                reference_quotes
             )
-            
-            # Extract reference quotes
-            reference_quotes = []
-            for record in contact_records:
-                if record.contact_type == 'REFERENCE' and record.response_received:
-                    if record.response_data and 'quotes' in record.response_data:
-                        reference_quotes.extend(record.response_data['quotes'])
-            
+        
+        for employment, narrative_text in zip(session.employments, narrative_texts):
             narratives.append({
                 'company': employment.company_name,
                 'title': employment.job_title,
@@ -614,23 +1348,21 @@ class ReportGenerator:
     
     def _generate_technical_validation(
         self,
-        session: VerificationSession
+        github_analysis: Optional[GitHubAnalysisRecord],
+        narrative: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Generate technical validation section"""
-        github_analysis = GitHubAnalysisRecord.query.filter_by(
-            verification_session_id=session.id
-        ).first()
-        
+        """Generate technical validation section from the session's GitHub analysis"""
         if not github_analysis:
             return None
         
-        # Extract claimed skills (simplified for MVP)
-        claimed_skills = []
-        
-        narrative = self.narrative_synthesizer.synthesize_technical_narrative(
-            github_analysis,
-            claimed_skills
-        )
+        if narrative is None:
+            # Extract claimed skills (simplified for MVP)
+            claimed_skills = []
+            
+            narrative = self.narrative_synthesizer.synthesize_technical_narrative(
+                github_analysis,
+                claimed_skills
+            )
         
         return {
             'github_username': github_analysis.username,
@@ -9,10 +9,15 @@ This module implements the main orchestration logic for the verification process
 """
 
 import logging
+import threading
 import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import uuid
+from contextlib import nullcontext
+
+from flask import current_app, has_app_context
+from sqlalchemy.orm import selectinload
 
 from src.database.models import (
     db, VerificationSession, VerificationStatus, Employment,
@@ -129,10 +134,16 @@ class VerificationOrchestrator:
             timeout_hours: Timeout in hours for verification completion (default 1 hour for demo)
         """
         self.employment_verifier = employment_verifier or EmploymentVerifier()
-        self.reference_verifier = reference_verifier or ReferenceVerifier()
+        # Reference tasks queue their contact records; the last one to finish
+        # for a session writes them in one commit
+        self.reference_verifier = reference_verifier or ReferenceVerifier(defer_contact_records=True)
         self.technical_analyzer = technical_analyzer or TechnicalProfileAnalyzer()
         self.timeout_hours = timeout_hours
         
+        # Reference tasks not yet finished, by session ID
+        self._reference_tasks_remaining: Dict[str, int] = {}
+        self._reference_tasks_lock = threading.Lock()
+        
         # Task manager for parallel execution
         self.task_manager = VerificationTaskManager()
         
@@ -226,12 +237,25 @@ class VerificationOrchestrator:
         # Clear any existing tasks
         self.task_manager.clear_tasks()
         
+        # Load all planned employments together with their session and
+        # candidate, which verification reads, instead of lazily per task
+        employment_ids = [emp_task['employment_id'] for emp_task in plan.employment_verifications]
+        employments = {}
+        if employment_ids:
+            employments = {
+                employment.id: employment
+                for employment in Employment.query.options(
+                    selectinload(Employment.verification_session)
+                    .selectinload(VerificationSession.candidate)
+                ).filter(Employment.id.in_(employment_ids))
+            }
+        
         # Add employment verification tasks
         for emp_task in plan.employment_verifications:
             task_id = f"emp_{emp_task['employment_id']}"
             
             # Get employment record
-            employment = Employment.query.get(emp_task['employment_id'])
+            employment = employments.get(emp_task['employment_id'])
             if not employment:
                 logger.warning(f"Employment {emp_task['employment_id']} not found, skipping")
                 continue
@@ -249,6 +273,16 @@ class VerificationOrchestrator:
             )
             logger.info(f"Added employment verification task: {task_id}")
         
+        # Reference tasks run under the app so the session's last one can write
+        # the queued contact records, even if it outlives the timeout
+        app = current_app._get_current_object() if has_app_context() else None
+        if plan.reference_verifications:
+            with self._reference_tasks_lock:
+                self._reference_tasks_remaining[plan.verification_session_id] = (
+                    self._reference_tasks_remaining.get(plan.verification_session_id, 0)
+                    + len(plan.reference_verifications)
+                )
+        
         # Add reference verification tasks
         for ref_task in plan.reference_verifications:
             task_id = f"ref_{uuid.uuid4().hex[:8]}"
@@ -257,8 +291,9 @@ class VerificationOrchestrator:
                 task_id=task_id,
                 task_type='REFERENCE',
                 target_id=task_id,
-                execute_fn=self.reference_verifier.verify_reference,
+                execute_fn=self._execute_reference_verification,
                 execute_args={
+                    'app': app,
                     'verification_session_id': plan.verification_session_id,
                     'candidate_name': session.candidate.full_name if session else 'Candidate',
                     'reference_name': ref_task['reference_name'],
@@ -312,6 +347,38 @@ class VerificationOrchestrator:
             session.completed_at = datetime.utcnow()
             db.session.commit()
     
+    def _execute_reference_verification(self, app, **verify_args) -> Dict[str, Any]:
+        """Execute reference verification inside an app context so its contact records are written.
+        
+        The session's last reference task to finish, successful or not,
+        writes all of the session's queued contact records in one commit.
+        
+        Args:
+            app: Flask app to run under; without one, contact records are
+                skipped like any other write from a thread with no app context
+            **verify_args: ReferenceVerifier.verify_reference arguments
+            
+        Returns:
+            Reference verification results
+        """
+        verification_session_id = verify_args['verification_session_id']
+        with app.app_context() if app is not None else nullcontext():
+            try:
+                return self.reference_verifier.verify_reference(**verify_args)
+            finally:
+                if self._finish_reference_task(verification_session_id):
+                    self.reference_verifier.flush_contact_records(verification_session_id)
+    
+    def _finish_reference_task(self, verification_session_id: str) -> bool:
+        """Count a finished reference task; True when it was the session's last"""
+        with self._reference_tasks_lock:
+            remaining = self._reference_tasks_remaining.get(verification_session_id, 1) - 1
+            if remaining > 0:
+                self._reference_tasks_remaining[verification_session_id] = remaining
+                return False
+            self._reference_tasks_remaining.pop(verification_session_id, None)
+            return True
+    
     def _execute_technical_verification(
         self,
         verification_session_id: str,
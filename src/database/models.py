@@ -156,6 +156,10 @@ class EducationCredential(db.Model):
 class FraudFlag(db.Model):
     """Fraud detection flag"""
     __tablename__ = 'fraud_flags'
+    __table_args__ = (
+        # Flags are looked up, cleared and counted per session and severity
+        db.Index('ix_fraud_flags_session_severity', 'verification_session_id', 'severity'),
+    )
     
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     verification_session_id = db.Column(db.String(36), db.ForeignKey('verification_sessions.id'), nullable=False)
@@ -241,7 +245,7 @@ class GitHubAnalysisRecord(db.Model):
     analyzed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationships
-    verification_session = db.relationship('VerificationSession', backref='github_analysis', uselist=False)
+    verification_session = db.relationship('VerificationSession', backref=db.backref('github_analysis', uselist=False))
     
     def __repr__(self):
         return f'<GitHubAnalysisRecord {self.username} - Score: {self.code_quality_score}>'
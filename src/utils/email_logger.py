@@ -1,10 +1,12 @@
 """Email logging for verification email audit trail."""
 
 import os
+import atexit
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -57,43 +59,12 @@ class EmailLogger:
             ValueError: If candidate_name, email_type, recipient, or subject is empty
             OSError: If directory creation or file writing fails
         """
-        # Validate inputs
-        if not candidate_name or not candidate_name.strip():
-            error_msg = "candidate_name must be a non-empty string"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if not email_type or not email_type.strip():
-            error_msg = "email_type must be a non-empty string"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if not recipient or not recipient.strip():
-            error_msg = "recipient must be a non-empty string"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if not subject or not subject.strip():
-            error_msg = "subject must be a non-empty string"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        self._validate_log_fields(candidate_name, email_type, recipient, subject)
         
         logger.info(f"Logging email for {candidate_name}, type: {email_type}, recipient: {recipient}")
         
-        # Normalize candidate name for directory
-        normalized_name = candidate_name.strip().lower().replace(" ", "_")
-        
         try:
-            # Create candidate-specific directory
-            candidate_dir = self.base_dir / normalized_name
-            candidate_dir.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created/verified directory: {candidate_dir}")
-            
-            # Path to emails.log file
-            log_file_path = candidate_dir / "emails.log"
-            
-            # Check if this is a new log file
-            is_new_file = not log_file_path.exists()
+            log_file_path = self._log_file_path(candidate_name)
             
             # Format the log entry
             log_entry = self._format_log_entry(
@@ -104,14 +75,7 @@ class EmailLogger:
                 error_message=error_message
             )
             
-            # Write to log file (append mode)
-            with open(log_file_path, 'a', encoding='utf-8') as f:
-                # Add header if this is a new file
-                if is_new_file:
-                    f.write("=== EMAIL LOG ===\n")
-                    f.write(f"Candidate: {candidate_name}\n\n")
-                
-                f.write(log_entry)
+            self._append_entries(log_file_path, candidate_name, [log_entry])
             
             logger.info(f"Email logged successfully: {log_file_path}")
             return str(log_file_path)
@@ -125,6 +89,83 @@ class EmailLogger:
             logger.error(error_msg, exc_info=True)
             raise
     
+    def _validate_log_fields(
+        self,
+        candidate_name: str,
+        email_type: str,
+        recipient: str,
+        subject: str
+    ) -> None:
+        """Validate the fields required for a log entry.
+        
+        Raises:
+            ValueError: If candidate_name, email_type, recipient, or subject is empty
+        """
+        if not candidate_name or not candidate_name.strip():
+            error_msg = "candidate_name must be a non-empty string"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not email_type or not email_type.strip():
+            error_msg = "email_type must be a non-empty string"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not recipient or not recipient.strip():
+            error_msg = "recipient must be a non-empty string"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not subject or not subject.strip():
+            error_msg = "subject must be a non-empty string"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+    
+    def _log_file_path(self, candidate_name: str) -> Path:
+        """Get the path of a candidate's emails.log file.
+        
+        Args:
+            candidate_name: Candidate's full name
+        
+        Returns:
+            Path: Path to the candidate's emails.log file
+        """
+        # Normalize candidate name for directory
+        normalized_name = candidate_name.strip().lower().replace(" ", "_")
+        return self.base_dir / normalized_name / "emails.log"
+    
+    def _append_entries(
+        self,
+        log_file_path: Path,
+        candidate_name: str,
+        entries: List[str]
+    ) -> None:
+        """Append formatted entries to a log file, creating it if needed.
+        
+        Args:
+            log_file_path: Path to the emails.log file
+            candidate_name: Candidate's full name (used in the file header)
+            entries: Formatted log entries to append
+        
+        Raises:
+            OSError: If directory creation or file writing fails
+        """
+        # Create candidate-specific directory
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Created/verified directory: {log_file_path.parent}")
+        
+        # Check if this is a new log file
+        is_new_file = not log_file_path.exists()
+        
+        # Write to log file (append mode)
+        with open(log_file_path, 'a', encoding='utf-8') as f:
+            # Add header if this is a new file
+            if is_new_file:
+                f.write("=== EMAIL LOG ===\n")
+                f.write(f"Candidate: {candidate_name}\n\n")
+            
+            f.writelines(entries)
+    
     def _format_log_entry(
         self,
         email_type: str,
@@ -192,11 +233,8 @@ class EmailLogger:
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Normalize candidate name for directory
-        normalized_name = candidate_name.strip().lower().replace(" ", "_")
-        
         # Path to emails.log file
-        log_file_path = self.base_dir / normalized_name / "emails.log"
+        log_file_path = self._log_file_path(candidate_name)
         
         # Return empty list if log file doesn't exist
         if not log_file_path.exists():
@@ -267,3 +305,197 @@ class EmailLogger:
             entries.append(current_entry)
         
         return entries
+
+
+class BufferedEmailLogger(EmailLogger):
+    """EmailLogger that buffers entries and writes them in the background.
+    
+    log_sent_email formats the entry and returns the log file path right
+    away; entries are appended to disk once the buffer reaches
+    buffer_capacity bytes, every flush_interval seconds, on flush(), and at
+    process exit. A failed write is logged, and raised by the next explicit
+    flush() or close() from a thread that queued one of its entries, so a
+    shared logger never fails one caller for another's entries. Pass
+    buffered=False to write every entry directly, as EmailLogger does.
+    """
+    
+    DEFAULT_BUFFER_CAPACITY = 8 * 1024
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    
+    def __init__(
+        self,
+        base_dir: str = "./transcripts",
+        buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffered: bool = True
+    ):
+        """Initialize the BufferedEmailLogger.
+        
+        Args:
+            base_dir: Base directory for storing email logs (default: ./transcripts)
+            buffer_capacity: Buffered bytes that trigger an immediate flush
+            flush_interval: Seconds between background flushes
+            buffered: Whether to buffer entries (False writes directly)
+        """
+        super().__init__(base_dir)
+        self.buffer_capacity = buffer_capacity
+        self.flush_interval = flush_interval
+        self.buffered = buffered
+        
+        # Buffered (log file, candidate, entry, queuing thread ident) tuples
+        self._pending: List[Tuple[Path, str, str, int]] = []
+        self._pending_bytes = 0
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Last failed write per thread that queued an entry in it, for flush()
+        self._flush_errors: Dict[int, OSError] = {}
+        self._closed = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        
+        if buffered:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                name="BufferedEmailLoggerFlush",
+                daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self._close_at_exit)
+    
+    def log_sent_email(
+        self,
+        candidate_name: str,
+        email_type: str,
+        recipient: str,
+        subject: str,
+        success: bool,
+        error_message: Optional[str] = None
+    ) -> str:
+        """Queue a sent email log entry for the candidate's log file.
+        
+        Takes the same arguments as EmailLogger.log_sent_email.
+        
+        Returns:
+            str: Path to the log file the entry will be written to
+        
+        Raises:
+            ValueError: If candidate_name, email_type, recipient, or subject is empty
+        """
+        if not self.buffered or self._closed.is_set():
+            return super().log_sent_email(
+                candidate_name=candidate_name,
+                email_type=email_type,
+                recipient=recipient,
+                subject=subject,
+                success=success,
+                error_message=error_message
+            )
+        
+        self._validate_log_fields(candidate_name, email_type, recipient, subject)
+        
+        log_file_path = self._log_file_path(candidate_name)
+        log_entry = self._format_log_entry(
+            email_type=email_type,
+            recipient=recipient,
+            subject=subject,
+            success=success,
+            error_message=error_message
+        )
+        
+        with self._pending_lock:
+            self._pending.append((log_file_path, candidate_name, log_entry, threading.get_ident()))
+            self._pending_bytes += len(log_entry)
+            buffer_full = self._pending_bytes >= self.buffer_capacity
+        
+        if buffer_full:
+            # The email itself went out; a failed write is only logged here
+            with self._flush_lock:
+                self._write_pending()
+        
+        return str(log_file_path)
+    
+    def get_email_history(self, candidate_name: str) -> List[Dict[str, str]]:
+        """Flush buffered entries, then retrieve email history for a candidate.
+        
+        See EmailLogger.get_email_history.
+        """
+        with self._flush_lock:
+            self._write_pending()
+        return super().get_email_history(candidate_name)
+    
+    def flush(self) -> None:
+        """Write all buffered entries to their log files.
+        
+        Raises:
+            OSError: If an entry queued by the calling thread could not be
+                     written, here or in an earlier background flush (the
+                     other files are still written)
+        """
+        with self._flush_lock:
+            self._write_pending()
+            error = self._flush_errors.pop(threading.get_ident(), None)
+        
+        if error is not None:
+            raise error
+    
+    def _write_pending(self) -> None:
+        """Write all buffered entries, keeping failures in _flush_errors.
+        
+        The caller must hold _flush_lock.
+        """
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+        
+        if not pending:
+            return
+        
+        # Group entries per file so each file is opened once
+        grouped: Dict[Path, Tuple[str, List[str], Set[int]]] = {}
+        for log_file_path, candidate_name, log_entry, owner in pending:
+            group = grouped.setdefault(log_file_path, (candidate_name, [], set()))
+            group[1].append(log_entry)
+            group[2].add(owner)
+        
+        for log_file_path, (candidate_name, entries, owners) in grouped.items():
+            try:
+                self._append_entries(log_file_path, candidate_name, entries)
+            except OSError as e:
+                error_msg = f"Failed to write {len(entries)} email log entries for {candidate_name}: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                error = OSError(error_msg)
+                error.__cause__ = e
+                
+                # Threads that have exited will never flush to collect theirs
+                live = {thread.ident for thread in threading.enumerate()}
+                for ident in [ident for ident in self._flush_errors if ident not in live]:
+                    del self._flush_errors[ident]
+                for owner in owners & live:
+                    self._flush_errors[owner] = error
+    
+    def close(self) -> None:
+        """Stop the background flush thread and write remaining entries.
+        
+        Raises:
+            OSError: If an entry queued by the calling thread could not be
+                     written (see flush)
+        """
+        self._closed.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+    
+    def _close_at_exit(self) -> None:
+        """Close at interpreter exit; write failures were already logged."""
+        try:
+            self.close()
+        except OSError:
+            pass
+    
+    def _flush_periodically(self) -> None:
+        """Flush buffered entries every flush_interval seconds until closed."""
+        while not self._closed.wait(self.flush_interval):
+            # Failures stay in _flush_errors for their threads' next flush()
+            with self._flush_lock:
+                self._write_pending()
@@ -0,0 +1,30 @@
+"""Compact JSON serialization for database JSON columns"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize a JSON column value without insignificant whitespace.
+    
+    Args:
+        value: JSON-compatible value to store (orjson also accepts datetime,
+            date, Enum and UUID values, and non-string dict keys)
+    
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+def loads(text: str) -> Any:
+    """Parse a JSON column value.
+    
+    Args:
+        text: JSON text read from the database
+    
+    Returns:
+        Parsed value
+    """
+    return orjson.loads(text)
@@ -49,19 +49,18 @@ def test_reference_verifier_sends_email_first():
     )
     
     # Mock database operations and file reading
-    with patch('core.reference_verifier.safe_db_commit'):
-        with patch('core.reference_verifier.safe_db_add'):
-            with patch('core.reference_verifier.ContactRecord'):
-                with patch.object(verifier, '_read_transcript', return_value=None):
-                    # Execute verification
-                    result = verifier.verify_reference(
-                        verification_session_id="session_123",
-                        candidate_name="John Doe",
-                        reference_name="Jane Smith",
-                        reference_phone="+1234567890",
-                        reference_email="reference@example.com",
-                        relationship="manager"
-                    )
+    with patch('core.reference_verifier.safe_db_ctx'):
+        with patch('core.reference_verifier.ContactRecord'):
+            with patch.object(verifier, '_read_transcript', return_value=None):
+                # Execute verification
+                result = verifier.verify_reference(
+                    verification_session_id="session_123",
+                    candidate_name="John Doe",
+                    reference_name="Jane Smith",
+                    reference_phone="+1234567890",
+                    reference_email="reference@example.com",
+                    relationship="manager"
+                )
     
     # Verify email was sent FIRST
     assert mock_email_orchestrator.send_reference_email.called, "Email should be sent"
@@ -180,18 +179,17 @@ def test_email_only_when_no_phone():
     )
     
     # Mock database operations
-    with patch('core.reference_verifier.safe_db_commit'):
-        with patch('core.reference_verifier.safe_db_add'):
-            with patch('core.reference_verifier.ContactRecord'):
-                # Execute verification with NO phone number
-                result = verifier.verify_reference(
-                    verification_session_id="session_789",
-                    candidate_name="John Doe",
-                    reference_name="Jane Smith",
-                    reference_phone=None,  # No phone!
-                    reference_email="reference@example.com",
-                    relationship="manager"
-                )
+    with patch('core.reference_verifier.safe_db_ctx'):
+        with patch('core.reference_verifier.ContactRecord'):
+            # Execute verification with NO phone number
+            result = verifier.verify_reference(
+                verification_session_id="session_789",
+                candidate_name="John Doe",
+                reference_name="Jane Smith",
+                reference_phone=None,  # No phone!
+                reference_email="reference@example.com",
+                relationship="manager"
+            )
     
     # Verify email was sent
     assert mock_email_orchestrator.send_reference_email.called, "Email should be sent"
@@ -10,7 +10,10 @@ Tests the comprehensive report generation including:
 
 import os
 import sys
+import json
 from datetime import datetime, date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 # Add src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
@@ -168,7 +171,9 @@ def test_narrative_synthesizer():
         employment = session.employments[0]
         contact_records = [r for r in session.contact_records if r.contact_type == 'REFERENCE']
         
-        narrative = synthesizer.synthesize_employment_narrative(employment, contact_records)
+        reference_quotes = synthesizer.extract_reference_quotes(contact_records)
+        
+        narrative = synthesizer.synthesize_employment_narrative(employment, reference_quotes)
         print(f"Employment Narrative:\n{narrative}")
         assert len(narrative) > 0, "Employment narrative should not be empty"
         assert employment.company_name in narrative, "Narrative should mention company name"
@@ -365,6 +370,110 @@ def test_report_without_openai():
             os.environ['OPENAI_API_KEY'] = original_key
 
 
+def create_batch_client(session_id, status='in_progress', output_lines=None):
+    """Create a stubbed OpenAI client for the Batch API calls"""
+    client = MagicMock()
+    client.files.create.return_value = SimpleNamespace(id='file-input')
+    client.batches.create.return_value = SimpleNamespace(id='batch-123')
+    
+    client.batches.retrieve.return_value = SimpleNamespace(
+        id='batch-123',
+        status=status,
+        output_file_id='file-output' if status == 'completed' else None,
+        metadata={'verification_session_id': session_id}
+    )
+    client.files.content.return_value = SimpleNamespace(text="\n".join(output_lines or []))
+    return client
+
+
+def batch_output_line(custom_id, content):
+    """Build one line of a Batch API output file"""
+    return json.dumps({
+        'custom_id': custom_id,
+        'response': {
+            'status_code': 200,
+            'body': {'choices': [{'message': {'content': content}}]}
+        }
+    })
+
+
+def test_report_generator_batch_api():
+    """Test batch report generation and finalization with a stubbed client"""
+    print("\n=== Testing ReportGenerator (Batch API) ===")
+    
+    app = create_test_app()
+    
+    with app.app_context():
+        session_id = create_test_session()
+        
+        generator = ReportGenerator(openai_api_key='test-key', use_batch_api=True)
+        
+        print("\n1. Submitting report batch...")
+        client = create_batch_client(session_id, status='in_progress')
+        with patch('src.core.report_generator.OPENAI_AVAILABLE', True), \
+                patch('src.core.report_generator._openai_client', return_value=client):
+            result = generator.generate_report(session_id)
+        
+        assert result['success'], f"Report generation should succeed: {result.get('error')}"
+        report_data = result['report_data']
+        assert report_data['batch_id'] == 'batch-123', "Report should record its batch"
+        assert len(report_data['employment_history']) == 2, "Template narratives should be stored"
+        assert len(report_data['interview_questions']) >= 5, "Template questions should be stored"
+        
+        client.files.create.assert_called_once()
+        client.batches.create.assert_called_once()
+        assert client.batches.create.call_args.kwargs['input_file_id'] == 'file-input'
+        batch_input = client.files.create.call_args.kwargs['file'][1].decode('utf-8')
+        custom_ids = [json.loads(line)['custom_id'] for line in batch_input.splitlines()]
+        assert f"{session_id}:questions:0" in custom_ids, "Batch should request interview questions"
+        
+        report = VerificationReport.query.filter_by(verification_session_id=session_id).first()
+        assert report.report_data['batch_id'] == 'batch-123', "Stored report should record its batch"
+        print("✓ Template report stored with batch_id")
+        
+        print("\n2. Finalizing a batch that has not completed...")
+        with patch('src.core.report_generator._openai_client', return_value=client):
+            result = generator.finalize_report('batch-123')
+        
+        assert not result['success'], "Unfinished batch should not finalize"
+        assert result['status'] == 'in_progress'
+        client.files.content.assert_not_called()
+        db.session.refresh(report)
+        assert report.report_data['batch_id'] == 'batch-123', "Report should still wait for its batch"
+        print("✓ Unfinished batch leaves the report untouched")
+        
+        print("\n3. Finalizing a completed batch...")
+        questions = [f"Batch question {i} about the candidate's work history?" for i in range(1, 7)]
+        completed_client = create_batch_client(session_id, status='completed', output_lines=[
+            batch_output_line(
+                f"{session_id}:employment:0",
+                json.dumps({'narratives': [
+                    {'i': 0, 'text': 'Batch narrative for Tech Corp.'},
+                    {'i': 1, 'text': 'Batch narrative for Startup Inc.'}
+                ]})
+            ),
+            batch_output_line(f"{session_id}:technical:0", 'Batch technical narrative.'),
+            batch_output_line(f"{session_id}:questions:0", json.dumps({'questions': questions}))
+        ])
+        with patch('src.core.report_generator._openai_client', return_value=completed_client):
+            result = generator.finalize_report('batch-123')
+        
+        assert result['success'], f"Completed batch should finalize: {result.get('error')}"
+        completed_client.files.content.assert_called_once_with('file-output')
+        report_data = result['report_data']
+        assert 'batch_id' not in report_data, "Finalized report should drop its batch_id"
+        assert report_data['employment_history'][1]['narrative'] == 'Batch narrative for Startup Inc.'
+        assert report_data['technical_validation']['narrative'] == 'Batch technical narrative.'
+        assert report_data['interview_questions'] == questions
+        
+        db.session.refresh(report)
+        assert 'batch_id' not in report.report_data, "Stored report should drop its batch_id"
+        assert report.interview_questions == questions
+        print("✓ Completed batch fills in the narratives and questions")
+        
+        print("\n✓ ReportGenerator Batch API tests passed!")
+
+
 if __name__ == '__main__':
     print("="*80)
     print("REPORT GENERATION SYSTEM TEST SUITE")
@@ -376,6 +485,7 @@ if __name__ == '__main__':
         test_interview_question_generator()
         test_report_generator()
         test_report_without_openai()
+        test_report_generator_batch_api()
         
         print("\n" + "="*80)
         print("ALL TESTS PASSED! ✓")
@@ -3,6 +3,7 @@
 import os
 import sys
 from datetime import datetime, date
+from unittest.mock import patch
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -13,7 +14,7 @@ if sys.platform == 'win32':
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.database.models import (
-    db, VerificationSession, Candidate, Employment,
+    db, VerificationSession, Candidate, Employment, ContactRecord,
     VerificationStatus, EmploymentVerificationStatus, DataSource
 )
 from src.core.verification_orchestrator import (
@@ -220,6 +221,74 @@ def test_orchestrator_initialization():
     print("✓ Orchestrator initialization test passed!")
 
 
+def test_reference_contact_records_written_once_per_session():
+    """Test reference contact records are queued and written by the last reference task"""
+    print("\n=== Test: Reference Contact Records Per Session ===")
+    
+    app = create_app()
+    
+    with app.app_context():
+        candidate = Candidate(
+            full_name="Dana Reference",
+            email="dana@example.com"
+        )
+        db.session.add(candidate)
+        db.session.flush()
+        
+        session = VerificationSession(
+            candidate_id=candidate.id,
+            status=VerificationStatus.DOCUMENTS_COLLECTED
+        )
+        db.session.add(session)
+        db.session.commit()
+        session_id = session.id
+        
+        orchestrator = VerificationOrchestrator(timeout_hours=0.01)
+        verifier = orchestrator.reference_verifier
+        assert verifier.defer_contact_records, "Orchestrator should queue contact records"
+        
+        plan = VerificationPlan(session_id)
+        plan.add_reference_verification("Ref One", reference_email="one@example.com")
+        plan.add_reference_verification("Ref Two", reference_email="two@example.com")
+        
+        written_during_tasks = []
+        
+        def fake_verify_reference(verification_session_id, reference_name, reference_email, **kwargs):
+            contact_record_id = verifier._create_contact_record(
+                verification_session_id=verification_session_id,
+                contact_method="EMAIL",
+                contact_name=reference_name,
+                contact_info=reference_email,
+                response_received=False,
+                response_data=None,
+                transcript_url=None
+            )
+            written_during_tasks.append(
+                ContactRecord.query.filter_by(verification_session_id=verification_session_id).count()
+            )
+            return {'success': True, 'contact_record_id': contact_record_id}
+        
+        with patch.object(verifier, 'verify_reference', side_effect=fake_verify_reference):
+            orchestrator.execute_verification_plan(plan)
+        
+        records = ContactRecord.query.filter_by(verification_session_id=session_id).all()
+        print(f"✓ Contact records written: {len(records)}")
+        
+        assert written_during_tasks == [0, 0], "Records should be queued while tasks run"
+        assert sorted(record.contact_name for record in records) == ["Ref One", "Ref Two"]
+        assert session_id not in verifier._pending_records, "Queue should be empty after the last task"
+        assert session_id not in orchestrator._reference_tasks_remaining
+        
+        # Cleanup
+        for record in records:
+            db.session.delete(record)
+        db.session.delete(db.session.get(VerificationSession, session_id))
+        db.session.delete(candidate)
+        db.session.commit()
+        
+        print("✓ Reference contact records test passed!")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("VERIFICATION ORCHESTRATOR TESTS")
@@ -230,6 +299,7 @@ if __name__ == '__main__':
         test_verification_plan_creation()
         test_verification_plan_generation_from_session()
         test_verification_status_tracking()
+        test_reference_contact_records_written_once_per_session()
         
         print("\n" + "=" * 60)
         print("✓ ALL TESTS PASSED!")